@@ -0,0 +1,153 @@
+import os
+import json
+import threading
+from collections import OrderedDict
+
+BACKUP_SUFFIX = ".bak"
+
+
+class _Writer:
+    """One background thread doing the writes for every store; per store, the newest data wins."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._pending = OrderedDict()  # store -> bytes
+        self._busy = False
+        self._thread = None
+
+    def submit(self, store, data):
+        with self._cond:
+            self._pending[store] = data
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="config-writer", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def discard(self, store):
+        with self._cond:
+            self._pending.pop(store, None)
+
+    def flush(self, timeout=None):
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending)
+                store, data = self._pending.popitem(last=False)
+                self._busy = True
+            try:
+                store.write(data)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+
+_WRITER = _Writer()
+
+
+class ConfigStore:
+    """
+    Crash-safe home for a JSON settings file (config.json, instance.json).
+
+    Writes go to a temp file that is fsynced and renamed over the real one,
+    and the copy it replaces is kept next to it as <name>.bak, so there is always a
+    complete file on disk: a crash leaves either the old config, the new one,
+    or (between the two renames) the backup, which load() falls back to.
+    write_async() hands the bytes to a writer thread shared by every store,
+    newest wins, so the UI never waits on the disk; flush() blocks until
+    everything queued (for any store) is written.
+    Identical content is not rewritten.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.backup_path = path + BACKUP_SUFFIX
+        self._lock = threading.Lock()
+        self._last = None
+        self.writes = 0
+        self.error = None  # OSError of the last write, None once one succeeds
+
+    # ---- reading ----
+
+    def load(self):
+        """The saved config, or the backup if the main file is missing or corrupt; None if neither."""
+        for path in (self.path, self.backup_path):
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                cfg = json.loads(data.decode("utf-8"))
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError) as e:
+                print(f"[CONFIG] Could not read {path}: {e}")
+                continue
+            if not isinstance(cfg, dict):
+                continue
+            if path == self.backup_path:
+                print(f"[CONFIG] Recovered settings from {path}")
+            else:
+                self._last = data
+            return cfg
+        return None
+
+    # ---- writing ----
+
+    @staticmethod
+    def dumps(cfg):
+        return json.dumps(cfg, indent=4).encode("utf-8")
+
+    def write(self, data):
+        """Writes data (bytes) now, on this thread. Returns False if the disk refused."""
+        with self._lock:
+            if data == self._last:
+                return True
+        tmp = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            if os.path.exists(self.path):
+                os.replace(self.path, self.backup_path)
+            os.replace(tmp, self.path)
+            self._sync_dir()
+        except OSError as e:
+            print(f"[CONFIG] Could not save {self.path}: {e}")
+            self.error = e
+            return False
+        with self._lock:
+            self._last = data
+            self.writes += 1
+        self.error = None
+        return True
+
+    def _sync_dir(self):
+        # make the renames themselves durable (not possible on Windows)
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(os.path.dirname(self.path), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def write_async(self, data):
+        """Queues data for the writer thread, replacing anything not yet written."""
+        _WRITER.submit(self, data)
+
+    def cancel(self):
+        """Drops a queued write that hasn't started (the file is about to be deleted)."""
+        _WRITER.discard(self)
+
+    def flush(self, timeout=None):
+        """Blocks until queued writes are on disk."""
+        return _WRITER.flush(timeout)
+
+    def check(self):
+        """Raises the error of the last write if it failed (call after flush())."""
+        if self.error is not None:
+            raise self.error
@@ -0,0 +1,174 @@
+import os
+import time
+import threading
+from urllib.parse import urlsplit
+
+# requests (and urllib3) are imported by the first request rather than here:
+# they are the slowest import at startup and nothing on the first frame needs them.
+
+USER_AGENT = "RBLauncher (github.com/braydenwatt/RBLauncher)"
+
+# (connect, read) seconds per kind of endpoint. Callers pass kind=; an
+# explicit timeout= still wins.
+TIMEOUTS = {
+    "api": (5, 15),        # JSON APIs: Modrinth, Mojang/Fabric meta, update manifest
+    "auth": (5, 20),       # Microsoft / Xbox / Minecraft services sign-in
+    "download": (10, 60),  # jars, modpacks, game files; read is per chunk
+    "image": (5, 10),      # icons, avatars, news thumbnails
+}
+POOL_SIZE = 10
+
+# Upstreams the launcher (and scripts/) download from. RBL_STANDIN=http://host:port
+# sends every one of them to the local stand-in (standin_server.py) as
+# <standin>/<host>/<path>; RBL_URL_<HOST> (upper case, dots and dashes as
+# underscores) points a single host somewhere else.
+UPSTREAM_HOSTS = (
+    "launchermeta.mojang.com",
+    "piston-meta.mojang.com",
+    "piston-data.mojang.com",
+    "libraries.minecraft.net",
+    "resources.download.minecraft.net",
+    "meta.fabricmc.net",
+    "maven.fabricmc.net",
+    "api.modrinth.com",
+    "cdn.modrinth.com",
+)
+
+
+def base_url(host, environ=None):
+    """Where requests for host go, without a trailing slash."""
+    env = os.environ if environ is None else environ
+    override = env.get("RBL_URL_" + host.upper().replace(".", "_").replace("-", "_"))
+    if override:
+        return override.rstrip("/")
+    standin = env.get("RBL_STANDIN")
+    if standin and host in UPSTREAM_HOSTS:
+        return standin.rstrip("/") + "/" + host
+    return "https://" + host
+
+
+def resolve(url):
+    """url with its upstream swapped for the configured base; other URLs are left alone."""
+    parts = urlsplit(url)
+    if parts.scheme != "https" or parts.netloc.lower() not in UPSTREAM_HOSTS:
+        return url
+    base = base_url(parts.netloc.lower())
+    if base == "https://" + parts.netloc.lower():
+        return url
+    return base + url[len(parts.scheme) + 3 + len(parts.netloc):]
+
+
+class HttpClient:
+    """
+    The one HTTP client every part of the launcher goes through.
+
+    One requests.Session per host, so connections (and TLS handshakes) are
+    reused across workers; a common User-Agent; default timeouts by endpoint
+    kind; retries when a connection can't be made; and counters
+    (requests, errors, bytes, time) per kind and per host, see stats().
+    Upstream URLs are passed through resolve(), so one environment variable
+    points the whole launcher at the stand-in server.
+    """
+
+    def __init__(self, user_agent=USER_AGENT, timeouts=None, pool_size=POOL_SIZE):
+        self.user_agent = user_agent
+        self.timeouts = dict(TIMEOUTS, **(timeouts or {}))
+        self.pool_size = pool_size
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    # ---- sessions ----
+
+    def _session(self, host):
+        import requests
+        from requests.adapters import HTTPAdapter
+        try:
+            from urllib3.util.retry import Retry
+        except ImportError:  # very old requests bundles it
+            from requests.packages.urllib3.util.retry import Retry
+
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                session.headers["User-Agent"] = self.user_agent
+                # connection failures only: nothing has reached the server yet.
+                # 429s go back to the caller (Retry-After would otherwise raise)
+                retry = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.3,
+                              respect_retry_after_header=False)
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def close(self):
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            session.close()
+
+    # ---- metrics ----
+
+    def _count(self, kind, host, seconds, nbytes, failed):
+        with self._lock:
+            for key in ("kind:" + kind, "host:" + host):
+                s = self._stats.setdefault(key, {"requests": 0, "errors": 0, "bytes": 0, "seconds": 0.0})
+                s["requests"] += 1
+                s["errors"] += 1 if failed else 0
+                s["bytes"] += nbytes
+                s["seconds"] += seconds
+
+    def stats(self):
+        """{"kind:api": {...}, "host:api.modrinth.com": {...}} with requests/errors/bytes/seconds."""
+        with self._lock:
+            return {k: dict(v) for k, v in self._stats.items()}
+
+    def summary(self):
+        lines = []
+        for key, s in sorted(self.stats().items()):
+            avg = s["seconds"] / s["requests"] * 1000 if s["requests"] else 0
+            lines.append(f"{key}: {s['requests']} req, {s['errors']} err, "
+                         f"{s['bytes'] / 1024:.0f} KiB, avg {avg:.0f} ms")
+        return "\n".join(lines)
+
+    # ---- requests ----
+
+    def request(self, method, url, kind="api", **kwargs):
+        """
+        requests.request() through the shared pool. Streamed responses count
+        their Content-Length (the body hasn't been read yet).
+        """
+        import requests
+
+        url = resolve(url)
+        host = urlsplit(url).netloc.lower()
+        kwargs.setdefault("timeout", self.timeouts.get(kind, self.timeouts["api"]))
+        start = time.perf_counter()
+        try:
+            r = self._session(host).request(method, url, **kwargs)
+        except requests.RequestException:
+            self._count(kind, host, time.perf_counter() - start, 0, True)
+            raise
+        if kwargs.get("stream"):
+            nbytes = int(r.headers.get("Content-Length") or 0)
+        else:
+            nbytes = len(r.content)
+        self._count(kind, host, time.perf_counter() - start, nbytes, r.status_code >= 400)
+        return r
+
+    def get(self, url, kind="api", **kwargs):
+        return self.request("GET", url, kind, **kwargs)
+
+    def post(self, url, kind="api", **kwargs):
+        return self.request("POST", url, kind, **kwargs)
+
+    def get_json(self, url, kind="api", **kwargs):
+        """GET and parse; raises requests.HTTPError on a 4xx/5xx."""
+        r = self.get(url, kind, **kwargs)
+        r.raise_for_status()
+        return r.json()
+
+
+HTTP = HttpClient()
@@ -0,0 +1,187 @@
+import os
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap
+
+from http_client import HTTP
+from thumbnails import DiskLRU, PixmapLRU, render_rounded
+
+MEMORY_BUDGET = 32 * 1024 * 1024
+DISK_BUDGET = 128 * 1024 * 1024
+DECODE_WORKERS = 2
+FETCH_WORKERS = 4
+
+
+class ImageLoader(QObject):
+    """
+    App-wide loader for remote icons (Modrinth mod and modpack icons).
+
+    Downloads go through the shared HTTP client (kind="image", so they get
+    its timeouts and show up in its counters) on a small fetch pool and are
+    kept on disk by URL so a restart doesn't refetch them; decoding, scaling
+    and rounding run on a small thread pool (QImage only), and the finished
+    pixmaps live in a memory LRU keyed by (url, size, radius, dpr). Many
+    labels asking for the same URL share one download and one decode.
+    """
+    _decoded = pyqtSignal(object, object)  # key, QImage (from the decode pool)
+    _fetched = pyqtSignal(str, bytes)      # url, body (b"" on failure; from the fetch pool)
+
+    def __init__(self, cache_dir, memory_budget=MEMORY_BUDGET, disk_budget=DISK_BUDGET,
+                 workers=DECODE_WORKERS, parent=None):
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        self.workers = workers
+        self._fetch_pool = None
+        self._pool = None
+        self._mem = PixmapLRU(memory_budget)  # key -> QPixmap
+        self._disk = DiskLRU(cache_dir, disk_budget)
+        self._waiting = {}         # key -> [callback]
+        self._downloads = {}       # url -> [key] waiting on that download
+        self._decoded.connect(self._on_decoded)
+        self._fetched.connect(self._on_fetched)
+
+    # ---- public ----
+
+    def load(self, url, size, radius=8, dpr=1.0, callback=None):
+        """
+        Calls callback(QPixmap) on the GUI thread once the icon is ready.
+        Returns the pixmap straight away (and still calls back) on a memory
+        hit, else None.
+        """
+        key = (url, size, radius, round(float(dpr), 2))
+        pix = self._mem.get(key)
+        if pix is not None:
+            if callback:
+                callback(pix)
+            return pix
+
+        callbacks = self._waiting.get(key)
+        if callbacks is not None:
+            if callback:
+                callbacks.append(callback)
+            return None
+        self._waiting[key] = [callback] if callback else []
+
+        path = self._disk_path(url)
+        if os.path.exists(path):
+            self._decode(key, path)
+        elif url in self._downloads:
+            self._downloads[url].append(key)
+        else:
+            self._downloads[url] = [key]
+            self._fetch(url)
+        return None
+
+    def set_label(self, label, url, size, radius=8, loaded_style="background: transparent;",
+                  placeholder_style=None):
+        """
+        Shows url's icon on a QLabel when it arrives. A label reused for
+        another URL (or cleared with url=None) ignores late arrivals.
+        """
+        label._image_url = url
+        if not url:
+            return
+
+        def apply(pix, label=label, url=url):
+            if sip.isdeleted(label) or getattr(label, "_image_url", None) != url or pix.isNull():
+                return
+            label.setText("")
+            label.setPixmap(pix)
+            if loaded_style is not None:
+                label.setStyleSheet(loaded_style)
+
+        if self.load(url, size, radius, label.devicePixelRatioF(), apply) is None and placeholder_style:
+            label.clear()
+            label.setStyleSheet(placeholder_style)
+
+    def cached_file(self, url):
+        """Path of url's downloaded bytes if they're on disk, else None."""
+        path = self._disk_path(url) if url else None
+        return path if path and os.path.exists(path) else None
+
+    def clear_memory(self):
+        self._mem.clear()
+
+    # ---- network ----
+
+    def _disk_path(self, url):
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], digest)
+
+    def _fetch(self, url):
+        if self._fetch_pool is None:
+            self._fetch_pool = ThreadPoolExecutor(max_workers=FETCH_WORKERS,
+                                                  thread_name_prefix="image-fetch")
+        self._fetch_pool.submit(self._fetch_job, url)
+
+    def _fetch_job(self, url):
+        # fetch pool thread
+        try:
+            r = HTTP.get(url, kind="image")
+            r.raise_for_status()
+            data = r.content
+        except Exception as e:
+            print(f"[IMAGES] Download failed for {url}: {e}")
+            data = b""
+        self._fetched.emit(url, data)
+
+    def _on_fetched(self, url, data):
+        keys = self._downloads.pop(url, [])
+        path = self._disk_path(url)
+        if data and self._store(path, data):
+            for key in keys:
+                self._decode(key, path)
+        else:
+            # nothing to show; drop the waiters so a later request retries
+            for key in keys:
+                self._waiting.pop(key, None)
+
+    def _store(self, path, data):
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[IMAGES] Could not write {path}: {e}")
+            return False
+
+        self._disk.added(path)
+        return True
+
+    # ---- decoding ----
+
+    def _decode(self, key, path):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        self._disk.touch(path)  # LRU order for disk eviction
+        self._pool.submit(self._decode_job, key, path)
+
+    def _decode_job(self, key, path):
+        # decode pool thread: QImage work only, QPixmap is made on the GUI thread
+        _, size, radius, dpr = key
+        try:
+            image = render_rounded(QImage(path), size, radius, dpr)
+        except Exception as e:
+            print(f"[IMAGES] Could not decode {path}: {e}")
+            image = QImage()
+        self._decoded.emit(key, image)
+
+    def _on_decoded(self, key, image):
+        callbacks = self._waiting.pop(key, [])
+        if image.isNull():
+            # not an image (an error page, a truncated file); fetch it again next time
+            try:
+                os.remove(self._disk_path(key[0]))
+            except OSError:
+                pass
+            return
+        pix = QPixmap.fromImage(image)
+        pix.setDevicePixelRatio(key[3])
+        self._mem.put(key, pix)
+        for cb in callbacks:
+            cb(pix)
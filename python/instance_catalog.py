@@ -0,0 +1,277 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS instances (
+    name         TEXT PRIMARY KEY,
+    type         TEXT,
+    version      TEXT,
+    modloader    TEXT,
+    mod_count    INTEGER,
+    last_played  REAL
+);
+CREATE INDEX IF NOT EXISTS instances_last_played ON instances (last_played DESC);
+CREATE TABLE IF NOT EXISTS mods (
+    instance       TEXT NOT NULL,
+    filename       TEXT NOT NULL,
+    enabled        INTEGER,
+    mod_id         TEXT,
+    name           TEXT,
+    version        TEXT,
+    project_id     TEXT,
+    version_id     TEXT,
+    sha1           TEXT,
+    has_update     INTEGER DEFAULT 0,
+    latest_version TEXT,
+    PRIMARY KEY (instance, filename)
+);
+CREATE INDEX IF NOT EXISTS mods_project ON mods (project_id);
+CREATE INDEX IF NOT EXISTS mods_sha1 ON mods (sha1);
+CREATE INDEX IF NOT EXISTS mods_updates ON mods (instance) WHERE has_update = 1;
+CREATE TABLE IF NOT EXISTS sessions (
+    id          INTEGER PRIMARY KEY,
+    instance    TEXT NOT NULL,
+    started_at  REAL NOT NULL,
+    ended_at    REAL,
+    exit_code   INTEGER
+);
+CREATE INDEX IF NOT EXISTS sessions_instance ON sessions (instance, started_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _timestamp(iso):
+    """ISO-8601 (as stored in last_played) to epoch seconds, None if unset or unreadable."""
+    if not iso:
+        return None
+    try:
+        return datetime.fromisoformat(str(iso).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _project_id(mod):
+    pid = mod.get("project_id")
+    if not pid or str(pid).lower() in ("unknown", "none", "null"):
+        return None
+    return str(pid)
+
+
+class InstanceCatalog:
+    """
+    SQLite index over every instance, its mod files and its launch sessions.
+
+    config.json and instances/<name>/instance.json stay the source of truth;
+    this is kept in step with them (one transaction per changed instance) so
+    questions that cut across instances - which use a project, which have
+    updates waiting, which was played last, how long each was played - are
+    index lookups instead of scans over every instance's JSON.
+
+    Writes go through submit(), one background thread with its own
+    connection, in order; the UI thread only reads.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._synced = {}  # name -> index row last written, to skip unchanged ones
+        self._pool = None
+        self.mod_writes = 0  # mod rows inserted, replaced or deleted
+
+    def submit(self, fn, *args):
+        """
+        Runs fn(*args) on the catalog's writer thread and returns its Future.
+        The catalog is only an index, so a sqlite error is logged and the
+        Future's result is None; any other exception is logged and stays on
+        the Future.
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="instance-db")
+        return self._pool.submit(self._run, fn, args)
+
+    @staticmethod
+    def _run(fn, args):
+        name = getattr(fn, "__name__", fn)
+        try:
+            return fn(*args)
+        except sqlite3.Error as e:
+            print(f"[INSTANCEDB] {name} failed: {e}")
+            return None
+        except Exception as e:
+            # nobody waits on these futures, so say so here
+            print(f"[INSTANCEDB] {name} raised {type(e).__name__}: {e}")
+            raise
+
+    def _db(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    # ---- migration ----
+
+    def is_migrated(self):
+        row = self._db().execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        return bool(row) and int(row["value"]) >= SCHEMA_VERSION
+
+    def migrate(self, index, instances_dir, mod_hashes=None):
+        """
+        First run: fills the catalog from the instance index (config.json) and
+        every instance.json. Meant for a background thread. mod_hashes(name)
+        may return {filename: sha1} for an instance.
+        """
+        t = time.perf_counter()
+        conn = self._db()
+        rows = 0
+        for name, summary in index.items():
+            path = os.path.join(instances_dir, name, "instance.json")
+            try:
+                with open(path, "r") as f:
+                    data = dict(json.load(f), **summary)
+            except (OSError, ValueError):
+                data = dict(summary)
+            rows += self.sync_instance(name, data, mod_hashes(name) if mod_hashes else None, conn=conn)
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema', ?)", (str(SCHEMA_VERSION),))
+        print(f"[INSTANCEDB] Indexed {len(index)} instance(s), {rows} mod file(s) "
+              f"in {(time.perf_counter() - t) * 1000:.0f} ms")
+
+    # ---- updates ----
+
+    def _index_row(self, name, data):
+        mods = data.get("mods", data.get("mod_count"))
+        return (name, data.get("type"), data.get("version"), data.get("modloader", data.get("loader")),
+                mods if isinstance(mods, int) else None, _timestamp(data.get("last_played")))
+
+    def sync_index(self, index):
+        """Upserts the instances whose index entry changed; drops ones no longer listed."""
+        conn = self._db()
+        changed = []
+        for name, summary in index.items():
+            row = self._index_row(name, summary)
+            if self._synced.get(name) != row:
+                changed.append(row)
+        if not self._synced:
+            known = {r[0] for r in conn.execute("SELECT name FROM instances")}
+        else:
+            known = set(self._synced)
+        gone = known - set(index)
+        if not changed and not gone:
+            return
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO instances VALUES (?, ?, ?, ?, ?, ?)", changed)
+            for name in gone:
+                self._delete(conn, name)
+        for row in changed:
+            self._synced[row[0]] = row
+
+    def snapshot(self, name, data):
+        """
+        (index row, mod rows without sha1) for an instance dict. Cheap, and
+        made where the dict lives (the UI thread) so write_instance() can run
+        on the writer thread without touching it.
+        """
+        mods = []
+        for mod in data.get("mod_data") or []:
+            filename = mod.get("filename") or ((mod.get("filenames") or [None])[0])
+            if not filename:
+                continue
+            mods.append((name, filename, 1 if mod.get("enabled", True) else 0, mod.get("mod_id"),
+                         mod.get("name"), mod.get("version"), _project_id(mod), mod.get("version_id"),
+                         None, 1 if mod.get("_has_update") else 0, mod.get("_latest_version") or None))
+        return self._index_row(name, data), mods
+
+    def sync_instance(self, name, data, hashes=None, conn=None):
+        """Brings one instance's row and mod rows up to date. Returns the mod count."""
+        row, mods = self.snapshot(name, data)
+        return self.write_instance(row, mods, hashes, conn)
+
+    def write_instance(self, row, mods, hashes=None, conn=None):
+        """
+        Upserts the instance row and, in the same transaction, only the mod
+        rows that differ from what's stored (a toggle rewrites one row).
+        hashes: {filename: sha1} to fill in.
+        """
+        conn = conn or self._db()
+        name = row[0]
+        hashes = hashes or {}
+        new = {m[1]: m[:8] + (hashes.get(m[1]),) + m[9:] for m in mods}
+        old = {r[1]: tuple(r) for r in conn.execute("SELECT * FROM mods WHERE instance = ?", (name,))}
+        upserts = [m for filename, m in new.items() if old.get(filename) != m]
+        gone = [(name, filename) for filename in old if filename not in new]
+        with conn:
+            if self._synced.get(name) != row:
+                conn.execute("INSERT OR REPLACE INTO instances VALUES (?, ?, ?, ?, ?, ?)", row)
+            conn.executemany("DELETE FROM mods WHERE instance = ? AND filename = ?", gone)
+            conn.executemany("INSERT OR REPLACE INTO mods VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", upserts)
+        self._synced[name] = row
+        self.mod_writes += len(upserts) + len(gone)
+        return len(new)
+
+    def remove_instance(self, name):
+        with self._db() as conn:
+            self._delete(conn, name)
+
+    def _delete(self, conn, name):
+        conn.execute("DELETE FROM instances WHERE name = ?", (name,))
+        conn.execute("DELETE FROM mods WHERE instance = ?", (name,))
+        conn.execute("DELETE FROM sessions WHERE instance = ?", (name,))
+        self._synced.pop(name, None)
+
+    # ---- launch sessions (any thread) ----
+
+    def start_session(self, name, started_at=None):
+        started_at = started_at or time.time()
+        with self._db() as conn:
+            cur = conn.execute("INSERT INTO sessions (instance, started_at) VALUES (?, ?)", (name, started_at))
+            conn.execute("UPDATE instances SET last_played = ? WHERE name = ?", (started_at, name))
+        return cur.lastrowid
+
+    def end_session(self, session_id, exit_code=None):
+        with self._db() as conn:
+            conn.execute("UPDATE sessions SET ended_at = ?, exit_code = ? WHERE id = ?",
+                         (time.time(), exit_code, session_id))
+
+    # ---- queries ----
+
+    def most_recent(self, limit=1):
+        """Instance names, most recently played first."""
+        return [r[0] for r in self._db().execute(
+            "SELECT name FROM instances WHERE last_played IS NOT NULL "
+            "ORDER BY last_played DESC LIMIT ?", (limit,))]
+
+    def instances_using(self, project_id=None, sha1=None):
+        """Instances with a file from project_id (or that exact file, by sha1)."""
+        if sha1:
+            sql, arg = "SELECT DISTINCT instance FROM mods WHERE sha1 = ?", sha1
+        else:
+            sql, arg = "SELECT DISTINCT instance FROM mods WHERE project_id = ?", project_id
+        return [r[0] for r in self._db().execute(sql + " ORDER BY instance", (arg,))]
+
+    def outdated_instances(self):
+        """{instance: number of mods with an update waiting}, from the last update check."""
+        return dict(self._db().execute(
+            "SELECT instance, COUNT(*) FROM mods WHERE has_update = 1 GROUP BY instance"))
+
+    def play_time(self, name):
+        """(sessions, seconds played) for an instance; running sessions count up to now."""
+        row = self._db().execute(
+            "SELECT COUNT(*), COALESCE(SUM(COALESCE(ended_at, ?) - started_at), 0) "
+            "FROM sessions WHERE instance = ?", (time.time(), name)).fetchone()
+        return row[0], row[1]
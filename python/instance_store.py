@@ -0,0 +1,119 @@
+import os
+
+from config_store import ConfigStore
+
+INSTANCE_FILE = "instance.json"
+
+# What config.json keeps per instance: enough for the sidebar, the home card
+# and the launcher header. Everything else (mod_data, mod_sets, modpack
+# details...) lives in instances/<name>/instance.json.
+INDEX_KEYS = (
+    "name", "type", "version", "modloader", "loader", "loader_version", "fabric_version",
+    "image", "last_played", "last_played_instance", "mod_count", "mods",
+)
+
+
+def summary(data):
+    """The index entry for a full instance dict."""
+    return {k: data[k] for k in INDEX_KEYS if k in data}
+
+
+class InstanceStore:
+    """
+    Per-instance metadata files behind LauncherV2.instances_data.
+
+    At startup instances_data holds only index entries. load() merges an
+    instance's instance.json into its dict in place the first time it is
+    needed (on selection), so the mod list of a pack nobody opens is never
+    read. Only loaded instances are written back, each through its own
+    ConfigStore (atomic, skipped when unchanged).
+    """
+
+    def __init__(self, instances_dir):
+        self.instances_dir = instances_dir
+        self._stores = {}
+        self._loaded = set()
+        self._saved = {}  # name -> bytes last queued
+
+    def path(self, name):
+        return os.path.join(self.instances_dir, name, INSTANCE_FILE)
+
+    def _store(self, name):
+        store = self._stores.get(name)
+        if store is None:
+            store = self._stores[name] = ConfigStore(self.path(name))
+        return store
+
+    def is_loaded(self, name):
+        return name in self._loaded
+
+    def load(self, name, data):
+        """Fills data (the index entry) with the instance's details; the index wins on shared keys."""
+        if name in self._loaded:
+            return data
+        details = self._store(name).load() or {}
+        for key, value in details.items():
+            if key not in data:
+                data[key] = value
+        self._loaded.add(name)
+        return data
+
+    def adopt(self, name):
+        """Marks an instance created in memory (nothing to read) as loaded."""
+        self._loaded.add(name)
+
+    def forget(self, name):
+        """Before deleting an instance's folder: nothing queued may recreate it."""
+        self._loaded.discard(name)
+        self._saved.pop(name, None)
+        store = self._stores.pop(name, None)
+        if store is not None:
+            store.cancel()
+            store.flush()
+
+    def migrate(self, instances):
+        """
+        Moves details out of an old-style config (full dicts under "instances")
+        into instance files. Returns True if anything was moved.
+        """
+        moved = 0
+        for name, data in instances.items():
+            if set(data) <= set(INDEX_KEYS):
+                continue
+            if not self._store(name).write(ConfigStore.dumps(data)):
+                continue  # keep it in config.json rather than lose it
+            for key in set(data) - set(INDEX_KEYS):
+                del data[key]
+            moved += 1
+        if moved:
+            print(f"[INSTANCES] Moved details of {moved} instance(s) out of config.json")
+        return moved > 0
+
+    def save(self, instances, names=None):
+        """
+        Queues a write for each of names (every loaded instance if None) whose
+        details changed since the last save. Returns (index for config.json,
+        names of the instances written).
+        """
+        changed = []
+        for name in (self._loaded if names is None else self._loaded.intersection(names)):
+            data = instances.get(name)
+            if data is None:
+                continue
+            raw = ConfigStore.dumps(data)
+            if self._saved.get(name) != raw:
+                self._saved[name] = raw
+                self._store(name).write_async(raw)
+                changed.append(name)
+        return {name: summary(data) for name, data in instances.items()}, changed
+
+    def check(self):
+        """
+        Raises the OSError of an instance file that couldn't be written (call
+        after ConfigStore.flush()). That instance is written again on the next save.
+        """
+        failed = [(name, store) for name, store in self._stores.items() if store.error is not None]
+        for name, _ in failed:
+            self._saved.pop(name, None)
+        for _, store in failed:
+            store.check()
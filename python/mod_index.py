@@ -0,0 +1,377 @@
+import io
+import os
+import json
+import hashlib
+import shutil
+import zipfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Bump when the shape of the cached metadata changes so old indexes get rebuilt
+INDEX_VERSION = 2
+INDEX_FILENAME = "mod_index.json"
+# Below this many jars a pool costs more to start than it saves
+PARALLEL_THRESHOLD = 8
+
+
+def _first_author(authors):
+    if isinstance(authors, list) and authors:
+        a = authors[0]
+        return a if isinstance(a, str) else (a or {}).get("name", "Unknown")
+    if isinstance(authors, str) and authors:
+        return authors
+    return "Unknown"
+
+
+def _author_names(authors):
+    if isinstance(authors, str):
+        return [authors]
+    names = []
+    for a in authors or []:
+        if isinstance(a, str):
+            names.append(a)
+        elif isinstance(a, dict) and a.get("name"):
+            names.append(a["name"])
+    return names
+
+
+def _project_id_from_fmj(data):
+    """Some mods put their Modrinth project in "contact" or "custom"."""
+    contact = data.get("contact", {}) or {}
+    val = contact.get("modrinth") if isinstance(contact, dict) else None
+    if isinstance(val, str) and val:
+        # Sometimes this is a URL, sometimes an ID
+        if "modrinth.com/mod/" in val:
+            return val.rstrip("/").split("/")[-1]
+        return val
+
+    custom = data.get("custom", {}) or {}
+    val = custom.get("modrinth") if isinstance(custom, dict) else None
+    if isinstance(val, str) and val:
+        return val
+    return None
+
+
+def _nested_mods(z, data, names):
+    """
+    Ids of the jar-in-jar mods listed under "jars". The loader treats these
+    as installed, e.g. fabric-api ships every fabric-*-api module this way.
+    """
+    nested = []
+    for entry in data.get("jars", []) or []:
+        path = entry.get("file") if isinstance(entry, dict) else None
+        if not path or path not in names:
+            continue
+        try:
+            with zipfile.ZipFile(io.BytesIO(z.read(path))) as nz:
+                if "fabric.mod.json" not in nz.namelist():
+                    continue
+                nd = json.loads(nz.read("fabric.mod.json").decode("utf-8", "replace"), strict=False)
+        except Exception:
+            continue
+        if nd.get("id"):
+            nested.append({"id": nd["id"], "version": nd.get("version", "")})
+        for p in nd.get("provides", []) or []:
+            if isinstance(p, str):
+                nested.append({"id": p, "version": nd.get("version", "")})
+    return nested
+
+
+def read_jar_metadata(jar_path, icon_cache_dir=None):
+    """
+    Reads fabric.mod.json out of a jar.
+    Returns the dict stored in mod_data plus the extra fields the launcher
+    needs for dependency checks (depends, breaks, provides, nested, entrypoints).
+    """
+    filename = os.path.basename(jar_path)
+    meta = {
+        "filename": filename,
+        "name": filename,
+        "mod_id": None,
+        "version": "",
+        "author": "Unknown",
+        "authors": [],
+        "description": "",
+        "icon_path": None,
+        "project_id": None,
+        "depends": {},
+        "breaks": {},
+        "provides": [],
+        "nested": [],
+        "entrypoints": {},
+    }
+
+    try:
+        with zipfile.ZipFile(jar_path, 'r') as z:
+            names = set(z.namelist())
+            if "fabric.mod.json" not in names:
+                return meta
+
+            # strict=False: plenty of mods ship raw newlines inside strings
+            data = json.loads(z.read("fabric.mod.json").decode("utf-8", "replace"), strict=False)
+
+            meta["mod_id"] = data.get("id")
+            meta["name"] = data.get("name") or data.get("id") or filename
+            meta["version"] = data.get("version", "")
+            meta["description"] = data.get("description", "") or ""
+            meta["author"] = _first_author(data.get("authors", []))
+            meta["authors"] = _author_names(data.get("authors", []))
+            meta["project_id"] = _project_id_from_fmj(data)
+
+            for key in ("depends", "breaks"):
+                val = data.get(key, {})
+                meta[key] = val if isinstance(val, dict) else {}
+            provides = data.get("provides", [])
+            meta["provides"] = provides if isinstance(provides, list) else []
+            meta["nested"] = _nested_mods(z, data, names)
+            entrypoints = data.get("entrypoints", {})
+            meta["entrypoints"] = entrypoints if isinstance(entrypoints, dict) else {}
+
+            # Extract Icon
+            icon_file = data.get("icon")
+            if isinstance(icon_file, dict) and icon_file:
+                icon_file = icon_file.get("128x") or icon_file.get("64x") or list(icon_file.values())[0]
+
+            if icon_cache_dir and isinstance(icon_file, str) and icon_file in names:
+                os.makedirs(icon_cache_dir, exist_ok=True)
+                ext = os.path.splitext(icon_file)[1] or ".png"
+                safe_id = (data.get("id") or meta["name"]).replace(" ", "_").lower()
+                cached_path = os.path.join(icon_cache_dir, f"{safe_id}{ext}")
+
+                with z.open(icon_file) as source, open(cached_path, "wb") as target:
+                    shutil.copyfileobj(source, target)
+
+                meta["icon_path"] = cached_path
+
+    except Exception as e:
+        print(f"Failed to read metadata for {jar_path}: {e}")
+
+    return meta
+
+
+class MetadataPipeline:
+    """
+    Reads jar metadata on a process pool so it can run alongside downloads.
+
+    submit() as soon as a jar lands on disk, result() once everything is
+    queued. Falls back to threads if worker processes can't be started, and
+    to reading inline if the pool dies part way through.
+
+    Workers are always spawned (forking a process that runs Qt and threads
+    isn't safe), and only import this module to run read_jar_metadata: the
+    entry scripts keep their launcher imports under __main__, so a worker's
+    re-import of the main module doesn't load PyQt or the app singletons.
+    """
+
+    def __init__(self, icon_cache_dir=None, max_workers=None):
+        self.icon_cache_dir = icon_cache_dir
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._pool = None
+        self._futures = []
+
+    def _executor(self):
+        if self._pool is None:
+            try:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 mp_context=multiprocessing.get_context("spawn"))
+            except (OSError, NotImplementedError, ImportError) as e:
+                print(f"[MODINDEX] Process pool unavailable, using threads: {e}")
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def submit(self, jar_path):
+        try:
+            future = self._executor().submit(read_jar_metadata, jar_path, self.icon_cache_dir)
+        except (BrokenProcessPool, RuntimeError, OSError) as e:
+            print(f"[MODINDEX] Pool submit failed, switching to threads: {e}")
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+            future = self._pool.submit(read_jar_metadata, jar_path, self.icon_cache_dir)
+        self._futures.append(future)
+        return future
+
+    def result(self, future, jar_path):
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"[MODINDEX] Worker failed on {jar_path}, reading inline: {e}")
+            return read_jar_metadata(jar_path, self.icon_cache_dir)
+
+    def close(self, cancel=False):
+        if cancel:
+            for f in self._futures:
+                f.cancel()
+        self._futures = []
+        if self._pool is not None:
+            self._pool.shutdown(wait=not cancel)
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(cancel=exc_type is not None)
+
+
+def read_many(jar_paths, icon_cache_dir=None):
+    """Reads several jars at once. Returns {jar_path: meta}."""
+    if len(jar_paths) < PARALLEL_THRESHOLD:
+        return {p: read_jar_metadata(p, icon_cache_dir) for p in jar_paths}
+
+    with MetadataPipeline(icon_cache_dir) as pipeline:
+        futures = [(p, pipeline.submit(p)) for p in jar_paths]
+        return {p: pipeline.result(f, p) for p, f in futures}
+
+
+def file_sha1(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def is_mod_file(filename):
+    # Dotfiles are in-progress downloads (".temp_*") or OS junk, never mods.
+    if filename.startswith("."):
+        return False
+    return filename.endswith(".jar") or filename.endswith(".jar.disabled")
+
+
+def mod_data_from_meta(meta):
+    """The subset of jar metadata that is kept in an instance's mod_data."""
+    filename = meta.get("filename", "")
+    return {
+        "filename": filename,
+        "filenames": [filename],
+        "name": meta.get("name", filename),
+        "mod_id": meta.get("mod_id"),
+        "version": meta.get("version", ""),
+        "author": meta.get("author", "Unknown"),
+        "icon_path": meta.get("icon_path"),
+        "project_id": meta.get("project_id"),
+        "enabled": not filename.endswith(".disabled"),
+    }
+
+
+class ModIndex:
+    """
+    Per-instance cache of parsed jar metadata.
+
+    Stored as instances/<name>/mod_index.json and keyed by filename, with the
+    file's size and mtime recorded next to the metadata. A jar is only
+    re-opened when its stat changes, so refreshing an unchanged instance is
+    one directory listing and one small JSON read.
+    """
+
+    def __init__(self, instance_dir, icon_cache_dir=None):
+        self.instance_dir = instance_dir
+        self.mods_dir = os.path.join(instance_dir, "mods")
+        self.path = os.path.join(instance_dir, INDEX_FILENAME)
+        self.icon_cache_dir = icon_cache_dir
+        self.entries = {}  # filename -> {"size", "mtime", "meta"}
+        self._dirty = False
+        self.load()
+
+    # ---- persistence ----
+
+    def load(self):
+        self.entries = {}
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION:
+                self.entries = data.get("entries", {}) or {}
+        except Exception as e:
+            print(f"[MODINDEX] Ignoring unreadable index {self.path}: {e}")
+
+    def save(self):
+        if not self._dirty:
+            return
+        os.makedirs(self.instance_dir, exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"version": INDEX_VERSION, "entries": self.entries}, f)
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+    # ---- lookups ----
+
+    @staticmethod
+    def _stat_key(path):
+        st = os.stat(path)
+        return st.st_size, st.st_mtime_ns
+
+    def get(self, filename):
+        entry = self.entries.get(filename)
+        return entry["meta"] if entry else None
+
+    def sha1(self, filename):
+        """sha1 of a jar in mods/, cached in the index until the file's stat changes."""
+        path = os.path.join(self.mods_dir, filename)
+        entry = self.entries.get(filename)
+        if entry and entry.get("sha1") and (entry["size"], entry["mtime"]) == self._stat_key(path):
+            return entry["sha1"]
+        digest = file_sha1(path)
+        if entry and (entry["size"], entry["mtime"]) == self._stat_key(path):
+            entry["sha1"] = digest
+            self._dirty = True
+        return digest
+
+    def put(self, jar_path, meta):
+        """Records metadata that was already read elsewhere (e.g. during install)."""
+        try:
+            size, mtime = self._stat_key(jar_path)
+        except OSError:
+            return
+        self.entries[os.path.basename(jar_path)] = {"size": size, "mtime": mtime, "meta": meta}
+        self._dirty = True
+
+    def stale_files(self):
+        """Returns (changed_paths, removed_filenames) without opening any jar."""
+        changed, seen = [], set()
+        if os.path.isdir(self.mods_dir):
+            with os.scandir(self.mods_dir) as it:
+                for e in it:
+                    if not e.is_file() or not is_mod_file(e.name):
+                        continue
+                    seen.add(e.name)
+                    st = e.stat()
+                    entry = self.entries.get(e.name)
+                    if not entry or entry.get("size") != st.st_size or entry.get("mtime") != st.st_mtime_ns:
+                        changed.append(e.path)
+        removed = [fn for fn in self.entries if fn not in seen]
+        return changed, removed
+
+    def refresh(self):
+        """
+        Brings the index in line with mods/ and saves it if anything changed.
+        Returns what changed: {"read": [filenames (re)read], "removed":
+        [filenames gone], "renamed": {old filename: new filename}}.
+        """
+        changed, removed = self.stale_files()
+        gone = {fn: self.entries.pop(fn) for fn in removed}
+        if gone:
+            self._dirty = True
+
+        to_read, renamed = [], {}
+        for path in changed:
+            fn = os.path.basename(path)
+            # Toggling a mod renames foo.jar <-> foo.jar.disabled but keeps the
+            # stat, so carry the old entry over instead of re-opening the jar.
+            twin = fn[:-9] if fn.endswith(".disabled") else fn + ".disabled"
+            entry = gone.pop(twin, None)
+            if entry and (entry["size"], entry["mtime"]) == self._stat_key(path):
+                entry["meta"]["filename"] = fn
+                self.entries[fn] = entry
+                renamed[twin] = fn
+                continue
+            to_read.append(path)
+
+        for path, meta in read_many(to_read, self.icon_cache_dir).items():
+            self.put(path, meta)
+
+        self.save()
+        return {"read": [os.path.basename(p) for p in to_read], "removed": sorted(gone), "renamed": renamed}
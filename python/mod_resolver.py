@@ -0,0 +1,585 @@
+import os
+import re
+import json
+import shutil
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from http_client import HTTP
+from mod_index import read_jar_metadata
+
+MODRINTH_API = "https://api.modrinth.com/v2"
+
+# Ids the loader provides itself. "minecraft" is checked against the
+# instance's game version instead.
+BUILTIN_IDS = {"java", "fabricloader", "fabric-loader", "mixinextras"}
+
+# Old mod ids whose Modrinth project has a different slug
+MOD_ID_SLUGS = {"fabric": "fabric-api"}
+
+MAX_WORKERS = 6
+
+
+# ---------------------------
+# Version predicates (fabric.mod.json "depends"/"breaks")
+# ---------------------------
+
+def _vtuple(version):
+    """1.21.1+build.3 -> (1, 21, 1). None if there is nothing numeric to compare."""
+    core = str(version or "").split("+", 1)[0].split("-", 1)[0]
+    nums = re.findall(r"\d+", core)
+    return tuple(int(n) for n in nums) if nums else None
+
+
+def _cmp(a, b):
+    n = max(len(a), len(b))
+    a = a + (0,) * (n - len(a))
+    b = b + (0,) * (n - len(b))
+    return (a > b) - (a < b)
+
+
+def _matches_one(v, part):
+    m = re.match(r"^(>=|<=|>|<|=|~|\^)?(.*)$", part)
+    op, target = m.group(1) or "", m.group(2)
+    wildcard = target.endswith((".x", ".X", ".*")) or target in ("x", "X")
+    t = _vtuple(target)
+    if t is None:
+        return True  # something we don't understand, don't block on it
+
+    if op in ("", "="):
+        return v[:len(t)] == t if wildcard else _cmp(v, t) == 0
+    if op == ">=":
+        return _cmp(v, t) >= 0
+    if op == "<=":
+        return _cmp(v, t) <= 0
+    if op == ">":
+        return _cmp(v, t) > 0
+    if op == "<":
+        return _cmp(v, t) < 0
+    if op == "~":
+        return _cmp(v, t) >= 0 and v[:2] == (t + (0,))[:2]
+    if op == "^":
+        return _cmp(v, t) >= 0 and v[:1] == t[:1]
+    return True
+
+
+def version_matches(version, predicate):
+    """
+    Fabric-style version predicate check. A list means any of, spaces mean
+    all of. Unparseable versions/predicates count as a match.
+    """
+    if isinstance(predicate, list):
+        return not predicate or any(version_matches(version, p) for p in predicate)
+    pred = str(predicate or "").strip()
+    if pred in ("", "*"):
+        return True
+    v = _vtuple(version)
+    if v is None:
+        return True
+    return all(_matches_one(v, part) for part in pred.split())
+
+
+def provided_ids(meta):
+    """{mod id: version} a jar makes available: its own id, "provides" and jar-in-jar mods."""
+    meta = meta or {}
+    ids = {}
+    if meta.get("mod_id"):
+        ids[meta["mod_id"]] = meta.get("version", "")
+    for p in meta.get("provides", []) or []:
+        ids.setdefault(p, meta.get("version", ""))
+    for n in meta.get("nested", []) or []:
+        ids.setdefault(n["id"], n.get("version", ""))
+    return ids
+
+
+def download_to(url, path, expected_sha1=None, should_stop=None):
+    """Streams url to path, checking the sha1 Modrinth published for it."""
+    h = hashlib.sha1()
+    r = HTTP.get(url, kind="download", stream=True)
+    r.raise_for_status()
+    with open(path, "wb") as out:
+        for chunk in r.iter_content(chunk_size=65536):
+            if should_stop and should_stop():
+                raise RuntimeError("Cancelled")
+            if chunk:
+                out.write(chunk)
+                h.update(chunk)
+    if expected_sha1 and expected_sha1 != h.hexdigest():
+        raise RuntimeError(f"Checksum mismatch for {os.path.basename(path)}")
+
+
+# ---------------------------
+# Resolver
+# ---------------------------
+
+class InstallResolver:
+    """
+    Works out everything that has to go into mods/ for one Browse install.
+
+    1. Walks the Modrinth "dependencies" of the chosen version, fetching
+       each level of missing required dependencies as one parallel batch.
+    2. Downloads the whole set into a staging folder.
+    3. Reads each staged jar's fabric.mod.json and checks depends/breaks and
+       duplicate mod ids against what is already installed. Required mod ids
+       that Modrinth didn't declare get one extra lookup by slug.
+
+    A dependency that is installed but disabled isn't downloaded again; it
+    goes into plan["reenable"] instead.
+
+    Nothing touches mods/ until commit_install() is called with the plan.
+    """
+
+    def __init__(self, mc_version, loader, installed_mods, installed_metas, should_stop=None, http=None):
+        self.mc_version = mc_version or ""
+        self.loader = (loader or "").lower().strip()
+        self.installed_mods = installed_mods or []   # mod_data entries
+        self.installed_metas = installed_metas or []  # jar metadata from the mod index
+        self.should_stop = should_stop or (lambda: False)
+        self.progress = lambda msg: None
+        self.http = http  # optional ModrinthCache; the shared HTTP client otherwise
+
+        self.installed_projects = {}  # project_id -> mod_data
+        for m in self.installed_mods:
+            if m.get("project_id"):
+                self.installed_projects[m["project_id"]] = m
+
+    # ---- Modrinth lookups ----
+
+    def _get(self, path, params=None):
+        if self.http is not None:
+            try:
+                return self.http.get_json(f"{MODRINTH_API}{path}", params, timeout=15)
+            except requests.HTTPError as e:
+                if e.response is not None and e.response.status_code == 404:
+                    return None
+                raise
+        r = HTTP.get(f"{MODRINTH_API}{path}", params=params)
+        if r.status_code == 404:
+            return None
+        r.raise_for_status()
+        return r.json()
+
+    def _versions_by_id(self, version_ids):
+        if not version_ids:
+            return []
+        return self._get("/versions", {"ids": json.dumps(sorted(version_ids))}) or []
+
+    def _projects_by_id(self, project_ids):
+        if not project_ids:
+            return {}
+        projects = self._get("/projects", {"ids": json.dumps(sorted(project_ids))}) or []
+        out = {}
+        for p in projects:
+            out[p.get("id")] = p
+            if p.get("slug"):
+                out[p["slug"]] = p
+        return out
+
+    def _latest_compatible(self, project_id):
+        params = {}
+        if self.mc_version:
+            params["game_versions"] = json.dumps([self.mc_version])
+        if self.loader:
+            params["loaders"] = json.dumps([self.loader])
+        try:
+            versions = self._get(f"/project/{project_id}/version", params) or []
+        except Exception as e:
+            print(f"[RESOLVE] Version lookup failed for {project_id}: {e}")
+            return None
+        # Modrinth returns newest first; prefer a release if there is one
+        releases = [v for v in versions if v.get("version_type") == "release"]
+        return (releases or versions or [None])[0]
+
+    def _latest_many(self, project_ids):
+        if not project_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(project_ids))) as pool:
+            return dict(zip(project_ids, pool.map(self._latest_compatible, project_ids)))
+
+    # ---- step 1: Modrinth dependency graph ----
+
+    def _make_item(self, version, reason, project=None):
+        files = version.get("files", []) or []
+        primary = next((f for f in files if f.get("primary")), files[0] if files else None)
+        project = project or {}
+        return {
+            "project_id": version.get("project_id"),
+            "version_id": version.get("id"),
+            "version_number": version.get("version_number", ""),
+            "title": project.get("title") or version.get("name") or version.get("project_id"),
+            "author": project.get("author"),
+            "icon_url": project.get("icon_url"),
+            "file": primary,
+            "dependencies": version.get("dependencies", []) or [],
+            "reason": reason,
+            "staged_path": None,
+            "meta": None,
+        }
+
+    def _expand(self, items, plan):
+        """Adds required Modrinth dependencies of `items` (and theirs) to the plan."""
+        planned = {i["project_id"] for i in plan["items"]}
+        level = items
+        while level and not self.should_stop():
+            by_version, by_project = {}, {}
+            for item in level:
+                for dep in item["dependencies"]:
+                    pid, vid = dep.get("project_id"), dep.get("version_id")
+                    dtype = dep.get("dependency_type")
+                    if dtype == "incompatible":
+                        if pid and (pid in planned or self._installed_enabled(pid)):
+                            plan["incompatible"].append((item["title"], pid))
+                        continue
+                    if dtype != "required":
+                        continue
+                    if pid and (pid in planned or pid in self.installed_projects):
+                        if pid in self.installed_projects and not self._installed_enabled(pid):
+                            self._reenable_project(plan, pid)
+                        continue
+                    if vid:
+                        by_version.setdefault(vid, item)
+                    elif pid:
+                        by_project.setdefault(pid, item)
+
+            if not by_version and not by_project:
+                break
+            self.progress(f"Resolving {len(by_version) + len(by_project)} dependencies...")
+
+            found = []
+            for v in self._versions_by_id(list(by_version)):
+                parent = by_version.get(v.get("id"))
+                if v.get("project_id") in planned or v.get("project_id") in self.installed_projects:
+                    continue
+                by_project.pop(v.get("project_id"), None)
+                found.append((v, parent))
+
+            for pid, v in self._latest_many(list(by_project)).items():
+                parent = by_project[pid]
+                if v is None:
+                    plan["unresolved"].append((parent["title"], pid))
+                    continue
+                found.append((v, parent))
+
+            level = []
+            for v, parent in found:
+                if v.get("project_id") in planned:
+                    continue
+                item = self._make_item(v, f"required by {parent['title']}")
+                planned.add(item["project_id"])
+                plan["items"].append(item)
+                level.append(item)
+
+    def _installed_enabled(self, project_id):
+        m = self.installed_projects.get(project_id)
+        return bool(m) and m.get("enabled", True)
+
+    def _installed_title(self, project_id):
+        m = self.installed_projects.get(project_id) or {}
+        return m.get("title") or m.get("name") or project_id
+
+    def _reenable_project(self, plan, project_id):
+        m = self.installed_projects.get(project_id) or {}
+        files = m.get("filenames") or []
+        fn = next((f for f in files if f.endswith(".disabled")), files[0] if files else None)
+        if fn:
+            plan["reenable"].setdefault(fn, self._installed_title(project_id))
+
+    # ---- step 2: staging ----
+
+    def _stage_one(self, item, staging_dir, icon_cache_dir):
+        f = item["file"] or {}
+        url, filename = f.get("url"), f.get("filename")
+        if not url or not filename:
+            raise RuntimeError(f"{item['title']} has no downloadable file")
+
+        path = os.path.join(staging_dir, filename)
+        download_to(url, path, (f.get("hashes") or {}).get("sha1"), self.should_stop)
+        item["staged_path"] = path
+        item["meta"] = read_jar_metadata(path, icon_cache_dir)
+
+    def _stage(self, items, staging_dir, icon_cache_dir):
+        items = [i for i in items if not i["staged_path"]]
+        if not items:
+            return
+        self.progress(f"Downloading {len(items)} file(s)...")
+        os.makedirs(staging_dir, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(items))) as pool:
+            for fut in [pool.submit(self._stage_one, i, staging_dir, icon_cache_dir) for i in items]:
+                fut.result()
+
+    # ---- step 3: fabric.mod.json checks ----
+
+    def _installed_ids(self, disabled=False):
+        """
+        mod id -> (version, description) for every enabled installed jar,
+        nested jars included. disabled=True: the same for disabled jars,
+        with the jar's filename as the description.
+        """
+        ids = {}
+        for meta in self.installed_metas:
+            if str(meta.get("filename", "")).endswith(".disabled") != disabled:
+                continue
+            label = meta.get("filename") if disabled else (meta.get("name") or meta.get("filename"))
+            if meta.get("mod_id"):
+                ids[meta["mod_id"]] = (meta.get("version", ""), label)
+            for p in meta.get("provides", []) or []:
+                ids.setdefault(p, (meta.get("version", ""), label))
+            for n in meta.get("nested", []) or []:
+                ids.setdefault(n["id"], (n.get("version", ""), label))
+        return ids
+
+    def _item_ids(self, item):
+        return provided_ids(item["meta"])
+
+    def _check(self, plan):
+        """
+        Returns (conflicts, warnings, missing) where missing maps mod ids
+        that nothing provides to the item needing them. Dependencies that
+        turn out to be installed already are dropped from the plan, and
+        disabled ones are added to plan["reenable"].
+        """
+        conflicts, warnings = [], []
+        installed = self._installed_ids()
+        disabled = self._installed_ids(disabled=True)
+        titles = {m.get("filename"): m.get("name") or m.get("filename") for m in self.installed_metas}
+        root = plan["items"][0]
+
+        # Duplicates: the jar's mod id is already in mods/ (often under an
+        # unknown project id). A dependency that's already there is simply
+        # dropped; the mod that was picked is a conflict.
+        kept, new_ids = [], {}
+        for item in plan["items"]:
+            mod_id = (item["meta"] or {}).get("mod_id")
+            if mod_id and mod_id in installed:
+                if item is root:
+                    conflicts.append(
+                        f"{item['title']} is already installed ({installed[mod_id][1]}).")
+                    kept.append(item)
+                else:
+                    self._discard(item)
+                continue
+            if mod_id and mod_id in disabled:
+                fn = disabled[mod_id][1]
+                if item is root:
+                    conflicts.append(
+                        f"{item['title']} is already installed but disabled ({titles[fn]}); enable it instead.")
+                    kept.append(item)
+                else:
+                    plan["reenable"].setdefault(fn, titles[fn])
+                    self._discard(item)
+                continue
+            if mod_id and mod_id in new_ids:
+                conflicts.append(
+                    f"{item['title']} and {new_ids[mod_id]['title']} are both mod id '{mod_id}'.")
+            if mod_id:
+                new_ids[mod_id] = item
+            kept.append(item)
+        plan["items"] = kept
+
+        present = {k: v for k, (v, _) in installed.items()}
+        for item in plan["items"]:
+            for k, v in self._item_ids(item).items():
+                present.setdefault(k, v)
+        for k, (v, fn) in disabled.items():
+            if fn in plan["reenable"]:
+                present.setdefault(k, v)
+
+        missing = {}
+        for item in plan["items"]:
+            meta = item["meta"] or {}
+            for dep_id, pred in (meta.get("breaks") or {}).items():
+                if dep_id in present and version_matches(present[dep_id], pred):
+                    conflicts.append(f"{item['title']} breaks '{dep_id}' {present[dep_id]}.")
+
+            for dep_id, pred in (meta.get("depends") or {}).items():
+                if dep_id in BUILTIN_IDS:
+                    continue
+                if dep_id == "minecraft":
+                    if self.mc_version and not version_matches(self.mc_version, pred):
+                        conflicts.append(
+                            f"{item['title']} needs Minecraft {pred}, this instance is {self.mc_version}.")
+                    continue
+                if dep_id not in present and dep_id in disabled:
+                    v, fn = disabled[dep_id]
+                    plan["reenable"].setdefault(fn, titles[fn])
+                    present[dep_id] = v
+                if dep_id not in present:
+                    missing.setdefault(dep_id, item)
+                elif not version_matches(present[dep_id], pred):
+                    warnings.append(
+                        f"{item['title']} wants '{dep_id}' {pred}, found {present[dep_id]}.")
+
+        # Installed mods that break something we're about to add
+        new_present = {}
+        for item in plan["items"]:
+            new_present.update(self._item_ids(item))
+        for meta in self.installed_metas:
+            fn = str(meta.get("filename", ""))
+            if fn.endswith(".disabled") and fn not in plan["reenable"]:
+                continue
+            for dep_id, pred in (meta.get("breaks") or {}).items():
+                if dep_id in new_present and version_matches(new_present[dep_id], pred):
+                    conflicts.append(
+                        f"Installed mod {meta.get('name') or meta.get('filename')} breaks '{dep_id}' {new_present[dep_id]}.")
+        return conflicts, warnings, missing
+
+    def _discard(self, item):
+        if item.get("staged_path") and os.path.exists(item["staged_path"]):
+            try:
+                os.remove(item["staged_path"])
+            except OSError:
+                pass
+
+    # ---- entry point ----
+
+    def plan(self, version, project, staging_dir, icon_cache_dir=None):
+        """
+        version: the Modrinth version object that was picked.
+        project: the Browse hit (title, author, icon_url, project_id).
+        Returns a plan dict; see commit_install() / discard_plan().
+        """
+        plan = {
+            "items": [],
+            "conflicts": [],
+            "warnings": [],
+            "incompatible": [],  # (title, project_id)
+            "unresolved": [],    # (title, project_id) with no compatible version
+            "reenable": {},      # disabled jar filename -> title, instead of downloading it again
+            "staging_dir": staging_dir,
+        }
+        root = self._make_item(version, "selected", project)
+        root["project_id"] = root["project_id"] or project.get("project_id")
+        plan["items"].append(root)
+
+        self._expand([root], plan)
+        self._stage(plan["items"], staging_dir, icon_cache_dir)
+        conflicts, warnings, missing = self._check(plan)
+
+        # Jars sometimes require mods their Modrinth page doesn't list. Most
+        # mod ids are also the project slug, so try those once.
+        if missing and not self.should_stop():
+            slugs = {}
+            for mod_id, item in missing.items():
+                slugs.setdefault(MOD_ID_SLUGS.get(mod_id, mod_id), item)
+            # Installed projects (enabled or not) are never downloaded again
+            planned = {i["project_id"] for i in plan["items"]} | set(self.installed_projects)
+            extra = []
+            for slug, v in self._latest_many(list(slugs)).items():
+                if v is None or v.get("project_id") in planned:
+                    continue
+                planned.add(v.get("project_id"))
+                extra.append(self._make_item(v, f"required by {slugs[slug]['title']}"))
+            if extra:
+                plan["items"].extend(extra)
+                self._expand(extra, plan)
+                self._stage(plan["items"], staging_dir, icon_cache_dir)
+                conflicts, warnings, missing = self._check(plan)
+
+        for dep_id, item in missing.items():
+            warnings.append(f"{item['title']} requires '{dep_id}', which isn't installed "
+                            f"and couldn't be found on Modrinth.")
+        plan["conflicts"].extend(conflicts)
+        plan["warnings"].extend(warnings)
+
+        # Names for anything we only know by project id
+        ids = {pid for _, pid in plan["incompatible"] + plan["unresolved"]}
+        ids |= {i["project_id"] for i in plan["items"] if i["reason"] != "selected"}
+        try:
+            projects = self._projects_by_id(ids)
+        except Exception as e:
+            print(f"[RESOLVE] Project lookup failed: {e}")
+            projects = {}
+        for item in plan["items"]:
+            p = projects.get(item["project_id"])
+            if p and item["reason"] != "selected":
+                item["title"] = p.get("title") or item["title"]
+                item["icon_url"] = p.get("icon_url")
+
+        def name(pid):
+            return (projects.get(pid) or {}).get("title") or self._installed_title(pid)
+
+        for title, pid in plan["incompatible"]:
+            plan["conflicts"].append(f"{title} is incompatible with {name(pid)}.")
+        for title, pid in plan["unresolved"]:
+            plan["conflicts"].append(
+                f"{title} requires {name(pid)}, which has no version for "
+                f"{self.mc_version or 'this version'} ({self.loader or 'any loader'}).")
+
+        if icon_cache_dir and not plan["conflicts"]:
+            self._fetch_icons(plan["items"], icon_cache_dir)
+        return plan
+
+    def _fetch_icons(self, items, icon_cache_dir):
+        """Modrinth icons for jars that don't ship one."""
+        for item in items:
+            meta = item["meta"] or {}
+            if meta.get("icon_path") or not item["icon_url"] or self.should_stop():
+                continue
+            ext = os.path.splitext(item["icon_url"])[1]
+            if not ext or len(ext) > 5:
+                ext = ".png"
+            path = os.path.join(icon_cache_dir, f"{str(item['project_id']).replace('/', '_')}{ext}")
+            try:
+                r = HTTP.get(item["icon_url"], kind="image")
+                if r.status_code == 200:
+                    os.makedirs(icon_cache_dir, exist_ok=True)
+                    with open(path, "wb") as f:
+                        f.write(r.content)
+                    meta["icon_path"] = path
+            except Exception as e:
+                print(f"[RESOLVE] Icon download failed for {item['title']}: {e}")
+
+
+# ---------------------------
+# Applying a plan
+# ---------------------------
+
+def discard_plan(plan):
+    shutil.rmtree(plan.get("staging_dir") or "", ignore_errors=True)
+
+
+def commit_install(plan, mods_dir):
+    """
+    Moves every staged jar into mods/ and returns (mod_data entries, paths).
+    Refuses (RuntimeError) if a jar of the same name, enabled or disabled, is
+    already there, so nothing the user has is overwritten. If a move fails,
+    the ones already moved are taken back out.
+    """
+    os.makedirs(mods_dir, exist_ok=True)
+    moved, entries = [], []
+    try:
+        for item in plan["items"]:
+            filename = os.path.basename(item["staged_path"])
+            for name in (filename, filename + ".disabled"):
+                if os.path.exists(os.path.join(mods_dir, name)):
+                    raise RuntimeError(f"{name} is already in mods/.")
+        for item in plan["items"]:
+            filename = os.path.basename(item["staged_path"])
+            final = os.path.join(mods_dir, filename)
+            os.replace(item["staged_path"], final)
+            moved.append(final)
+
+            meta = item["meta"] or {}
+            entries.append({
+                "filenames": [filename],
+                "project_id": item["project_id"],
+                "title": item["title"],
+                "author": item["author"] or meta.get("author", "Unknown"),
+                "version": item["version_number"] or meta.get("version", ""),
+                "mod_id": meta.get("mod_id"),
+                "icon_path": meta.get("icon_path"),
+                "icon_url": item["icon_url"],
+                "enabled": True,
+            })
+    except Exception:
+        for path in moved:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        raise
+    finally:
+        discard_plan(plan)
+    return entries, moved
@@ -0,0 +1,242 @@
+import re
+import bisect
+
+# How much a hit in each field counts towards a mod's rank
+FIELD_WEIGHTS = {
+    "title": 5.0,
+    "mod_id": 4.0,
+    "project_id": 3.0,
+    "author": 2.0,
+    "category": 1.5,
+    "description": 0.5,
+}
+
+# Multipliers for how a query term matched a token
+EXACT = 1.0
+PREFIX = 0.6
+TYPO = 0.35
+SUBSTRING = 0.2
+
+# Terms shorter than this never fuzzy match ("fps" shouldn't find "api")
+TYPO_MIN_LEN = 4
+
+_SPLIT = re.compile(r"[^0-9a-z]+")
+_STRIP = "\"'.,;:()[]{}"
+
+
+def tokenize(text):
+    """
+    Lowercase tokens for one field. Words are split on anything that isn't
+    a letter or digit, and ids like "fabric-api" are also kept whole and
+    joined ("fabric-api", "fabricapi") so typing them either way works.
+    """
+    text = (text or "").lower()
+    tokens = set(t for t in _SPLIT.split(text) if t)
+    for word in text.split():
+        word = word.strip(_STRIP)
+        parts = [t for t in _SPLIT.split(word) if t]
+        if len(parts) > 1:
+            tokens.add(word)
+            tokens.add("".join(parts))
+    return tokens
+
+
+def _deletes(token):
+    return {token[:i] + token[i + 1:] for i in range(len(token))}
+
+
+def _within_one_edit(a, b):
+    """True if a and b differ by at most one insert, delete, substitution or swap."""
+    if a == b:
+        return True
+    la, lb = len(a), len(b)
+    if abs(la - lb) > 1:
+        return False
+    if la == lb:
+        diff = [i for i in range(la) if a[i] != b[i]]
+        if len(diff) == 1:
+            return True
+        return (len(diff) == 2 and diff[1] == diff[0] + 1
+                and a[diff[0]] == b[diff[1]] and a[diff[1]] == b[diff[0]])
+    if la > lb:
+        a, b = b, a
+    # b is one longer than a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    return a[i:] == b[i + 1:]
+
+
+class ModSearchIndex:
+    """
+    In-memory search over installed mods.
+
+    Inverted index from token -> {doc key: best field weight}, a sorted token
+    list for prefix lookups and a one-deletion map for typo tolerance, so a
+    query touches only the tokens it could match instead of every mod.
+    Every query term has to match (exactly, as a prefix, with one typo, or
+    as a substring of the title/author/category/id); results are ranked by
+    field weight and match quality.
+    """
+
+    def __init__(self):
+        self._docs = {}       # key -> {"tokens": {token: weight}, "haystack": str, "title": str, "order": int}
+        self._postings = {}   # token -> {key: weight}
+        self._deletes = {}    # token with one char removed -> {token}
+        self._sorted = None   # sorted list of tokens, rebuilt lazily
+        self._order = 0
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __contains__(self, key):
+        return key in self._docs
+
+    # ---- building ----
+
+    def clear(self):
+        self.__init__()
+
+    def add(self, key, fields):
+        """fields: {field name: text}. Re-adding a key replaces it."""
+        if key in self._docs:
+            self.remove(key)
+
+        weights = {}
+        for field, text in fields.items():
+            w = FIELD_WEIGHTS.get(field, 1.0)
+            for tok in tokenize(text):
+                if w > weights.get(tok, 0):
+                    weights[tok] = w
+
+        for tok, w in weights.items():
+            posting = self._postings.get(tok)
+            if posting is None:
+                posting = self._postings[tok] = {}
+                self._sorted = None
+                if len(tok) >= TYPO_MIN_LEN - 1:
+                    for d in _deletes(tok):
+                        self._deletes.setdefault(d, set()).add(tok)
+            posting[key] = w
+
+        title = (fields.get("title") or "").lower()
+        haystack = " ".join((fields.get(f) or "").lower()
+                            for f in ("title", "author", "category", "mod_id", "project_id"))
+        self._docs[key] = {"tokens": weights, "haystack": haystack, "title": title, "order": self._order}
+        self._order += 1
+
+    def remove(self, key):
+        doc = self._docs.pop(key, None)
+        if not doc:
+            return
+        for tok in doc["tokens"]:
+            posting = self._postings.get(tok)
+            if posting is None:
+                continue
+            posting.pop(key, None)
+            if not posting:
+                del self._postings[tok]
+                self._sorted = None
+                for d in _deletes(tok):
+                    group = self._deletes.get(d)
+                    if group is not None:
+                        group.discard(tok)
+                        if not group:
+                            del self._deletes[d]
+
+    # ---- querying ----
+
+    def _prefix_tokens(self, term):
+        if self._sorted is None:
+            self._sorted = sorted(self._postings)
+        i = bisect.bisect_left(self._sorted, term)
+        out = []
+        while i < len(self._sorted) and self._sorted[i].startswith(term):
+            out.append(self._sorted[i])
+            i += 1
+        return out
+
+    def _typo_tokens(self, term):
+        if len(term) < TYPO_MIN_LEN:
+            return set()
+        candidates = set(self._deletes.get(term, ()))  # token has one extra char
+        for d in _deletes(term):
+            if d in self._postings:                      # term has one extra char
+                candidates.add(d)
+            candidates.update(self._deletes.get(d, ()))  # substitution / swap
+        return {t for t in candidates if t != term and _within_one_edit(term, t)}
+
+    def _match_term(self, term):
+        """Returns {key: score} for one query term."""
+        scores = {}
+
+        def hit(tokens, kind):
+            for tok in tokens:
+                for key, w in self._postings[tok].items():
+                    s = w * kind
+                    if s > scores.get(key, 0):
+                        scores[key] = s
+
+        if term in self._postings:
+            hit([term], EXACT)
+        hit([t for t in self._prefix_tokens(term) if t != term], PREFIX)
+        hit(self._typo_tokens(term), TYPO)
+
+        if len(term) >= 3:
+            for key, doc in self._docs.items():
+                if key not in scores and term in doc["haystack"]:
+                    scores[key] = SUBSTRING
+        return scores
+
+    def search(self, query, limit=None):
+        """
+        Returns [(key, score)] best first. An empty query returns every
+        document in the order it was added.
+        """
+        terms = [t.strip(_STRIP) for t in (query or "").lower().split()]
+        terms = [t for t in terms if t]
+        if not terms:
+            ranked = sorted(self._docs, key=lambda k: self._docs[k]["order"])
+            return [(k, 0.0) for k in ranked[:limit]]
+
+        total = None
+        for term in terms:
+            scores = self._match_term(term)
+            if total is None:
+                total = scores
+            else:
+                total = {k: total[k] + s for k, s in scores.items() if k in total}
+            if not total:
+                break
+
+        # The whole query as typed still finds anything containing it ("od 12")
+        phrase = " ".join(terms)
+        if len(terms) > 1 and len(phrase) >= 3:
+            for key, doc in self._docs.items():
+                if key not in total and phrase in doc["haystack"]:
+                    total[key] = SUBSTRING
+
+        for key in total:
+            title = self._docs[key]["title"]
+            if title == phrase:
+                total[key] += 3.0
+            elif title.startswith(phrase):
+                total[key] += 1.5
+
+        ranked = sorted(total.items(), key=lambda kv: (-kv[1], self._docs[kv[0]]["order"]))
+        return ranked[:limit] if limit else ranked
+
+
+def mod_search_fields(mod, meta=None):
+    """The searchable text of one mod_data entry, plus jar metadata if known."""
+    meta = meta or {}
+    authors = meta.get("authors") or []
+    author = " ".join([mod.get("author") or ""] + [a for a in authors if a != mod.get("author")])
+    return {
+        "title": mod.get("title") or mod.get("name") or "",
+        "mod_id": mod.get("mod_id") or meta.get("mod_id") or "",
+        "project_id": mod.get("project_id") or "",
+        "author": author,
+        "category": mod.get("category") or " ".join(mod.get("categories") or []),
+        "description": mod.get("description") or meta.get("description") or "",
+    }
@@ -0,0 +1,118 @@
+import os
+
+from mod_resolver import BUILTIN_IDS, provided_ids, version_matches
+
+
+def _base_name(filename):
+    return filename[:-9] if filename.endswith(".disabled") else filename
+
+
+def mod_key(mod):
+    """How a set refers to a mod: its project, else its mod id, else its jar name."""
+    if mod.get("project_id"):
+        return "project:" + str(mod["project_id"])
+    if mod.get("mod_id"):
+        return "mod:" + str(mod["mod_id"])
+    files = mod.get("filenames", []) or []
+    return "file:" + _base_name(files[0]) if files else None
+
+
+def capture_set(mods):
+    """A set from the instance as it is now: which mods are on and which are off."""
+    enabled, disabled = [], []
+    for mod in mods:
+        key = mod_key(mod)
+        if key:
+            (enabled if mod.get("enabled", True) else disabled).append(key)
+    return {"enabled": sorted(enabled), "disabled": sorted(disabled)}
+
+
+def plan_set(mods, mod_set):
+    """
+    [(mod, enable)] for every mod whose state differs from the set. Mods the
+    set doesn't mention (installed after it was saved) are left as they are.
+    """
+    on = set(mod_set.get("enabled", []))
+    off = set(mod_set.get("disabled", []))
+    changes = []
+    for mod in mods:
+        key = mod_key(mod)
+        enabled = mod.get("enabled", True)
+        if key in on and not enabled:
+            changes.append((mod, True))
+        elif key in off and enabled:
+            changes.append((mod, False))
+    return changes
+
+
+def check_set(mods, metas, enabled_after):
+    """
+    Dependency check for the state a set would leave behind, done once for
+    the whole set. metas: {id(mod): jar meta or None}; enabled_after:
+    {id(mod): bool}. Returns a list of problems; empty means fine.
+    Only problems the set causes are reported: a dependency nothing installed
+    provides was already missing before.
+    """
+    def title(mod):
+        return mod.get("title") or mod.get("name") or mod_key(mod)
+
+    on_ids, off_ids = {}, {}
+    for mod in mods:
+        ids = provided_ids(metas.get(id(mod)))
+        target = on_ids if enabled_after.get(id(mod)) else off_ids
+        for mod_id, version in ids.items():
+            target.setdefault(mod_id, (version, mod))
+
+    problems = []
+    for mod in mods:
+        meta = metas.get(id(mod))
+        if not meta or not enabled_after.get(id(mod)):
+            continue
+        for dep_id in (meta.get("depends") or {}):
+            if dep_id in BUILTIN_IDS or dep_id == "minecraft" or dep_id in on_ids:
+                continue
+            if dep_id in off_ids:
+                problems.append(f"{title(mod)} needs '{dep_id}', which this set turns off "
+                                f"({title(off_ids[dep_id][1])}).")
+        for dep_id, pred in (meta.get("breaks") or {}).items():
+            if dep_id in on_ids and version_matches(on_ids[dep_id][0], pred):
+                other = on_ids[dep_id][1]
+                if other is not mod:
+                    problems.append(f"{title(mod)} breaks {title(other)}, and the set enables both.")
+    return problems
+
+
+def rename_all(mods_dir, changes):
+    """
+    Renames the jars of every (mod, enable) in changes to/from .disabled in
+    one go. All targets are checked before anything moves, and if a rename
+    fails the ones already done are put back. Returns {id(mod): filenames}.
+    """
+    moves, result = [], {}
+    for mod, enable in changes:
+        new_files = []
+        for fn in mod.get("filenames", []) or []:
+            base = _base_name(fn)
+            target = base if enable else base + ".disabled"
+            current = next((n for n in (fn, base, base + ".disabled")
+                            if os.path.exists(os.path.join(mods_dir, n))), None)
+            if current and current != target:
+                if os.path.exists(os.path.join(mods_dir, target)):
+                    raise RuntimeError(f"{target} already exists in mods/.")
+                moves.append((current, target))
+            new_files.append(target)
+        result[id(mod)] = new_files
+
+    done = []
+    try:
+        for src, dst in moves:
+            os.rename(os.path.join(mods_dir, src), os.path.join(mods_dir, dst))
+            done.append((src, dst))
+    except OSError:
+        for src, dst in reversed(done):
+            try:
+                os.rename(os.path.join(mods_dir, dst), os.path.join(mods_dir, src))
+            except OSError:
+                pass
+        raise
+    return result
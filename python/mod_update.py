@@ -0,0 +1,318 @@
+import os
+import json
+import time
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from http_client import HTTP
+from mod_resolver import MODRINTH_API, download_to
+
+JOURNAL_FILENAME = "update_journal.json"
+MAX_WORKERS = 6
+# Modrinth accepts large hash batches; keep each POST body reasonable
+HASH_BATCH = 500
+# ids ride in the query string of /projects and /teams, so these batches are smaller
+PROJECT_BATCH = 100
+
+
+def _files_on_disk(mods_dir, mod):
+    """The mod's jars that actually exist, following .disabled renames."""
+    found = []
+    for fn in mod.get("filenames", []) or []:
+        twin = fn[:-9] if fn.endswith(".disabled") else fn + ".disabled"
+        for name in (fn, twin):
+            if os.path.exists(os.path.join(mods_dir, name)) and name not in found:
+                found.append(name)
+                break
+    return found
+
+
+def find_updates(mods, index, mc_version, loader):
+    """
+    Looks up the newest compatible version of every installed jar with one
+    POST /version_files/update, keyed by the jar's sha1 (cached in the
+    mod index). Returns a list of update dicts for the jars that changed.
+    """
+    by_hash = {}
+    for mod in mods:
+        files = _files_on_disk(index.mods_dir, mod)
+        if not files:
+            continue
+        by_hash[index.sha1(files[0])] = (mod, files)
+    index.save()
+    if not by_hash:
+        return []
+
+    body = {"hashes": list(by_hash), "algorithm": "sha1"}
+    if loader:
+        body["loaders"] = [loader.lower()]
+    if mc_version:
+        body["game_versions"] = [mc_version]
+
+    r = HTTP.post(f"{MODRINTH_API}/version_files/update", json=body, timeout=30)
+    r.raise_for_status()
+
+    updates = []
+    for digest, version in (r.json() or {}).items():
+        if digest not in by_hash:
+            continue
+        mod, files = by_hash[digest]
+        vfiles = version.get("files", []) or []
+        primary = next((f for f in vfiles if f.get("primary")), vfiles[0] if vfiles else None)
+        if not primary or not primary.get("url") or not primary.get("filename"):
+            continue
+        if (primary.get("hashes") or {}).get("sha1") == digest:
+            continue  # already the newest
+
+        enabled = not files[0].endswith(".disabled")
+        updates.append({
+            "mod": mod,
+            "title": mod.get("title") or mod.get("name") or files[0],
+            "old_version": mod.get("version", ""),
+            "old_files": files,
+            "project_id": version.get("project_id"),
+            "version_id": version.get("id"),
+            "version_number": version.get("version_number", ""),
+            "file": primary,
+            # keep disabled mods disabled
+            "new_name": primary["filename"] + ("" if enabled else ".disabled"),
+            "staged_path": None,
+        })
+    return updates
+
+
+class HashLookupCache:
+    """
+    sha1 -> what Modrinth said about that exact file, kept in one JSON file
+    shared by every instance. Misses are stored as None so a jar Modrinth
+    doesn't know is never asked about again.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self._dirty = False
+        if os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    self.entries = json.load(f) or {}
+            except Exception as e:
+                print(f"[IDENTIFY] Ignoring unreadable hash cache {path}: {e}")
+
+    def __contains__(self, digest):
+        return digest in self.entries
+
+    def get(self, digest):
+        return self.entries.get(digest)
+
+    def put(self, digest, info):
+        self.entries[digest] = info
+        self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.entries, f)
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
+def identify_jars(mods, index, cache):
+    """
+    Finds the Modrinth project behind jars installed without one (dropped in
+    by hand, or with no modrinth entry in fabric.mod.json). Hashes come from
+    the mod index, and only hashes the cache hasn't seen go out, in one
+    POST /version_files. Returns [(mod, info)] for the mods that were found.
+    """
+    by_hash = {}
+    for mod in mods:
+        files = _files_on_disk(index.mods_dir, mod)
+        if files:
+            by_hash.setdefault(index.sha1(files[0]), []).append(mod)
+    index.save()
+
+    unseen = [d for d in by_hash if d not in cache]
+    for i in range(0, len(unseen), HASH_BATCH):
+        batch = unseen[i:i + HASH_BATCH]
+        r = HTTP.post(f"{MODRINTH_API}/version_files",
+                      json={"hashes": batch, "algorithm": "sha1"}, timeout=30)
+        r.raise_for_status()
+        found = r.json() or {}
+        for digest in batch:
+            version = found.get(digest)
+            cache.put(digest, {
+                "project_id": version.get("project_id"),
+                "version_id": version.get("id"),
+                "version_number": version.get("version_number", ""),
+            } if version else None)
+    cache.save()
+
+    out = []
+    for digest, owners in by_hash.items():
+        info = cache.get(digest)
+        if info and info.get("project_id"):
+            out.extend((mod, info) for mod in owners)
+    return out
+
+
+def _owner_name(members):
+    """Who a project is "by": the team's owner, else its first listed member."""
+    members = sorted(members or [], key=lambda m: m.get("ordering", 0))
+    owner = next((m for m in members if m.get("role") == "Owner"), members[0] if members else None)
+    return ((owner or {}).get("user") or {}).get("username")
+
+
+def fetch_projects(project_ids, http):
+    """
+    {project_id: project} for every id Modrinth knows, each project with an
+    "author" added from its team. One GET /projects plus one GET /teams per
+    PROJECT_BATCH ids, however many mods the instance has; http is the
+    shared API cache, so a repeat within the TTL doesn't touch the network.
+    """
+    ids = sorted({str(p) for p in project_ids if p})
+    projects = {}
+    for i in range(0, len(ids), PROJECT_BATCH):
+        batch = ids[i:i + PROJECT_BATCH]
+        for project in http.get_json(f"{MODRINTH_API}/projects", {"ids": json.dumps(batch)}, timeout=30) or []:
+            projects[project["id"]] = project
+
+    teams = sorted({p["team"] for p in projects.values() if p.get("team")})
+    owners = {}
+    for i in range(0, len(teams), PROJECT_BATCH):
+        batch = teams[i:i + PROJECT_BATCH]
+        for members in http.get_json(f"{MODRINTH_API}/teams", {"ids": json.dumps(batch)}, timeout=30) or []:
+            if members:
+                owners[members[0].get("team_id")] = _owner_name(members)
+
+    for project in projects.values():
+        project["author"] = owners.get(project.get("team"))
+    return projects
+
+
+def stage_updates(updates, staging_dir, should_stop=None, progress=None):
+    """
+    Downloads every update into staging_dir in parallel. Raises on the first
+    failure, after cancelling the queued downloads and stopping running ones.
+    """
+    os.makedirs(staging_dir, exist_ok=True)
+    done = [0]
+    failed = [False]
+
+    def stop():
+        return failed[0] or bool(should_stop and should_stop())
+
+    def fetch(u):
+        path = os.path.join(staging_dir, u["file"]["filename"])
+        download_to(u["file"]["url"], path, (u["file"].get("hashes") or {}).get("sha1"), stop)
+        u["staged_path"] = path
+        done[0] += 1
+        if progress:
+            progress(f"Downloaded {done[0]}/{len(updates)}: {u['title']}")
+
+    if not updates:
+        return
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(updates))) as pool:
+        futures = [pool.submit(fetch, u) for u in updates]
+        for fut in as_completed(futures):
+            if fut.exception() is not None:
+                failed[0] = True
+                for f in futures:
+                    f.cancel()
+                raise fut.exception()
+
+
+class UpdateTransaction:
+    """
+    Swaps a set of staged jars into mods/ all-or-nothing.
+
+    Every old jar is moved into a backup folder before any new jar goes in,
+    and a journal listing both sets is written first. rollback() (or
+    recover_interrupted_update() after a crash) uses it to put the old set
+    back; commit() drops the backup once the config has been saved.
+    """
+
+    def __init__(self, instance_dir):
+        self.instance_dir = instance_dir
+        self.mods_dir = os.path.join(instance_dir, "mods")
+        self.backup_dir = os.path.join(instance_dir, ".staging", f"backup-{int(time.time() * 1000)}")
+        self.journal_path = os.path.join(instance_dir, JOURNAL_FILENAME)
+        self.journal = None
+
+    def swap(self, updates):
+        old = [fn for u in updates for fn in u["old_files"]]
+        new = [u["new_name"] for u in updates]
+
+        if len(set(new)) != len(new):
+            raise RuntimeError("Two updates want the same file name.")
+        old_set = set(old)
+        for name in new:
+            if name not in old_set and os.path.exists(os.path.join(self.mods_dir, name)):
+                raise RuntimeError(f"{name} is already in mods/.")
+
+        os.makedirs(self.backup_dir, exist_ok=True)
+        self.journal = {"backup_dir": self.backup_dir, "old": old, "new": new}
+        tmp = self.journal_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.journal, f)
+        os.replace(tmp, self.journal_path)
+
+        try:
+            for fn in old:
+                os.replace(os.path.join(self.mods_dir, fn), os.path.join(self.backup_dir, fn))
+            for u in updates:
+                os.replace(u["staged_path"], os.path.join(self.mods_dir, u["new_name"]))
+        except Exception:
+            self.rollback()
+            raise
+
+    def rollback(self):
+        if self.journal:
+            _undo(self.mods_dir, self.journal)
+        self._finish()
+
+    def commit(self):
+        self._finish()
+
+    def _finish(self):
+        shutil.rmtree(self.backup_dir, ignore_errors=True)
+        try:
+            os.remove(self.journal_path)
+        except OSError:
+            pass
+        self.journal = None
+
+
+def _undo(mods_dir, journal):
+    backup_dir = journal["backup_dir"]
+    old_set = set(journal["old"])
+    # All old jars are moved out before any new one goes in, so a new name
+    # that is also an old name is only "ours" once its backup exists.
+    for name in journal["new"]:
+        path = os.path.join(mods_dir, name)
+        if os.path.exists(path) and (name not in old_set or os.path.exists(os.path.join(backup_dir, name))):
+            os.remove(path)
+    for fn in journal["old"]:
+        src = os.path.join(backup_dir, fn)
+        if os.path.exists(src):
+            os.replace(src, os.path.join(mods_dir, fn))
+
+
+def recover_interrupted_update(instance_dir):
+    """Puts the previous jar set back if an update swap never finished. Returns True if it did."""
+    journal_path = os.path.join(instance_dir, JOURNAL_FILENAME)
+    if not os.path.exists(journal_path):
+        return False
+    try:
+        with open(journal_path, "r") as f:
+            journal = json.load(f)
+        _undo(os.path.join(instance_dir, "mods"), journal)
+        shutil.rmtree(journal["backup_dir"], ignore_errors=True)
+        print(f"[UPDATE] Rolled back an interrupted update in {instance_dir}")
+    except Exception as e:
+        print(f"[UPDATE] Could not roll back interrupted update: {e}")
+        return False
+    os.remove(journal_path)
+    return True
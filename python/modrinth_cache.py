@@ -0,0 +1,202 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from http_client import HTTP
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# (path pattern, fresh for, then served stale while revalidating for)
+# Search results and version lists move; a version object never changes.
+TTL_RULES = [
+    (re.compile(r"/search$"), 10 * MINUTE, DAY),
+    (re.compile(r"/project/[^/]+/version$"), 30 * MINUTE, DAY),
+    (re.compile(r"/project/[^/]+$"), HOUR, 7 * DAY),
+    (re.compile(r"/projects$"), HOUR, 7 * DAY),
+    (re.compile(r"/teams?(/[^/]+)?(/members)?$"), DAY, 30 * DAY),
+    (re.compile(r"/versions?(/[^/]+)?$"), DAY, 30 * DAY),
+    (re.compile(r"/tag/"), DAY, 30 * DAY),
+]
+DEFAULT_TTL = (5 * MINUTE, DAY)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key           TEXT PRIMARY KEY,
+    etag          TEXT,
+    last_modified TEXT,
+    body          BLOB NOT NULL,
+    fetched_at    REAL NOT NULL,
+    fresh_until   REAL NOT NULL,
+    stale_until   REAL NOT NULL
+)
+"""
+
+
+def normalize_key(url, params=None):
+    """
+    One key per logical request: scheme/host lowercased, no trailing slash,
+    and the query (from the URL and params together) sorted, so
+    ?a=1&b=2 and params={"b": 2, "a": 1} share an entry.
+    """
+    parts = urlsplit(url)
+    pairs = parse_qsl(parts.query, keep_blank_values=True)
+    for k, v in (params or {}).items():
+        if v is None:
+            continue
+        if isinstance(v, (list, tuple)):
+            pairs.extend((k, str(x)) for x in v)
+        else:
+            pairs.append((k, str(v)))
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(sorted(pairs)), ""))
+
+
+def ttl_for(url):
+    path = urlsplit(url).path.rstrip("/")
+    for pattern, fresh, stale in TTL_RULES:
+        if pattern.search(path):
+            return fresh, stale
+    return DEFAULT_TTL
+
+
+class ModrinthCache:
+    """
+    GET cache for the Modrinth API, shared by every worker.
+
+    Responses live in one SQLite file keyed by normalize_key(). A fresh entry
+    is returned without touching the network. Past its TTL it is still
+    returned while a background request revalidates it (If-None-Match /
+    If-Modified-Since, so an unchanged answer costs a 304). Past the stale
+    window the request waits for the network, and if that fails an old
+    answer is still better than none.
+    """
+
+    def __init__(self, db_path, session=None, max_workers=2):
+        self.db_path = db_path
+        self.session = session or HTTP
+        self.max_workers = max_workers
+        self.stats = {"hit": 0, "stale": 0, "miss": 0, "revalidated": 0, "offline": 0}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._inflight = set()
+        self._pool = None
+        self._pruned = False
+
+    # ---- storage ----
+
+    def _db(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            self._local.conn = conn
+            with self._lock:
+                prune, self._pruned = not self._pruned, True
+            if prune:
+                with conn:
+                    conn.execute("DELETE FROM responses WHERE stale_until < ?", (time.time(),))
+        return conn
+
+    def _load(self, key):
+        return self._db().execute("SELECT * FROM responses WHERE key = ?", (key,)).fetchone()
+
+    def _store(self, key, url, response):
+        now = time.time()
+        fresh, stale = ttl_for(url)
+        with self._db() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, response.headers.get("ETag"), response.headers.get("Last-Modified"),
+                 response.content, now, now + fresh, now + fresh + stale))
+
+    def _touch(self, key, url):
+        now = time.time()
+        fresh, stale = ttl_for(url)
+        with self._db() as conn:
+            conn.execute(
+                "UPDATE responses SET fetched_at = ?, fresh_until = ?, stale_until = ? WHERE key = ?",
+                (now, now + fresh, now + fresh + stale, key))
+
+    def clear(self):
+        with self._db() as conn:
+            conn.execute("DELETE FROM responses")
+
+    # ---- network ----
+
+    def _fetch(self, key, url, params, timeout, row):
+        """Conditional GET. Returns the body bytes (the cached ones on a 304)."""
+        headers = {}
+        if row is not None:
+            if row["etag"]:
+                headers["If-None-Match"] = row["etag"]
+            if row["last_modified"]:
+                headers["If-Modified-Since"] = row["last_modified"]
+
+        r = self.session.get(url, params=params, headers=headers, timeout=timeout)
+        if r.status_code == 304 and row is not None:
+            self._touch(key, url)
+            self.stats["revalidated"] += 1
+            return row["body"]
+        r.raise_for_status()
+        self._store(key, url, r)
+        return r.content
+
+    def _revalidate_later(self, key, url, params, timeout, row):
+        with self._lock:
+            if key in self._inflight:
+                return
+            self._inflight.add(key)
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        def work():
+            try:
+                self._fetch(key, url, params, timeout, row)
+            except Exception as e:
+                print(f"[HTTPCACHE] Background refresh failed for {url}: {e}")
+            finally:
+                with self._lock:
+                    self._inflight.discard(key)
+
+        self._pool.submit(work)
+
+    # ---- public ----
+
+    def get_json(self, url, params=None, timeout=10):
+        """Parsed JSON for a GET, from cache when possible. Raises like requests on HTTP errors."""
+        key = normalize_key(url, params)
+        row = self._load(key)
+        now = time.time()
+
+        if row is not None and now < row["fresh_until"]:
+            self.stats["hit"] += 1
+            return json.loads(row["body"])
+
+        if row is not None and now < row["stale_until"]:
+            self.stats["stale"] += 1
+            self._revalidate_later(key, url, params, timeout, row)
+            return json.loads(row["body"])
+
+        self.stats["miss"] += 1
+        import requests  # not at module level: see http_client
+        try:
+            body = self._fetch(key, url, params, timeout, row)
+        except requests.RequestException as e:
+            if row is None or (isinstance(e, requests.HTTPError) and e.response is not None
+                               and e.response.status_code < 500):
+                raise
+            self.stats["offline"] += 1
+            print(f"[HTTPCACHE] {url} unreachable, using an expired answer: {e}")
+            body = row["body"]
+        return json.loads(body)
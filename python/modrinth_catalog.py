@@ -0,0 +1,294 @@
+import os
+import re
+import json
+import hashlib
+import time
+import sqlite3
+import threading
+
+from http_client import HTTP
+
+SEARCH_URL = "https://api.modrinth.com/v2/search"
+PAGE_SIZE = 100                    # the most /search hands out per request
+MAX_PER_TYPE = 20000               # top projects (by downloads) kept per snapshot
+REFRESH_INTERVAL = 24 * 60 * 60
+
+# What gets snapshotted: the same facets Browse and the wizard search with
+SNAPSHOT_FACETS = {
+    "mod": [["categories:fabric"], ["project_type:mod"]],
+    "modpack": [["project_type:modpack"]],
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id            INTEGER PRIMARY KEY,
+    project_id    TEXT UNIQUE NOT NULL,
+    project_type  TEXT NOT NULL,
+    title         TEXT,
+    description   TEXT,
+    author        TEXT,
+    categories    TEXT,
+    facets        TEXT,
+    downloads     INTEGER,
+    date_created  TEXT,
+    date_modified TEXT
+);
+CREATE TABLE IF NOT EXISTS hits (
+    id  INTEGER PRIMARY KEY,
+    hit TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_FTS = """
+CREATE VIRTUAL TABLE IF NOT EXISTS projects_fts USING fts5(
+    title, description, author, categories, facets,
+    content='projects', content_rowid='id', prefix='2 3'
+)
+"""
+
+# title matches count for most, then author, then description; facets not at all
+RANK = "bm25(projects_fts, 10.0, 1.0, 3.0, 0.5, 0.0)"
+RANK_WINDOW = 500
+
+_ORDER = {
+    "downloads": "p.id",
+    "newest": "p.date_created DESC",
+    "updated": "p.date_modified DESC",
+}
+
+
+def _facet_token(facet):
+    """A facet ("versions:1.21.1") as one plain word the FTS tokenizer keeps whole."""
+    return "f" + hashlib.md5(facet.encode("utf-8")).hexdigest()[:16]
+
+
+def _facets_of(hit):
+    """The facet tokens a hit answers to, from the facets /search would match it on."""
+    out = {"project_type:" + str(hit.get("project_type") or "")}
+    for c in (hit.get("categories") or []) + (hit.get("display_categories") or []):
+        out.add("categories:" + str(c))
+    for v in hit.get("versions") or []:
+        out.add("versions:" + str(v))
+    return " ".join(sorted(_facet_token(f) for f in out))
+
+
+def _match_expr(query):
+    """Every word must match, the last one as a prefix (search as you type)."""
+    words = re.findall(r"\w+", query.lower())
+    if not words:
+        return None
+    terms = [f'"{w}"' for w in words[:-1]] + [f'"{words[-1]}"*']
+    return " AND ".join(terms)
+
+
+class ModrinthCatalog:
+    """
+    Optional offline snapshot of Modrinth's project listings.
+
+    A periodic refresh pages through /search for the top mods and modpacks
+    and keeps their search hits in SQLite. One FTS5 index covers the text
+    (title, description, author, categories) and the categories:/versions:/
+    project_type: facets, stored as one token each, so a filtered search is
+    a single posting-list intersection. search() takes the same
+    query/facets/index/offset/limit as the API and returns hits shaped like
+    it, so Browse and the wizard can use either. Versions and files still
+    come from the live API.
+    """
+
+    def __init__(self, db_path, session=None):
+        self.db_path = db_path
+        self.session = session or HTTP
+        self.enabled = False
+        self._local = threading.local()
+        self._refreshed_at = None
+        self._fts = None
+
+    # ---- storage ----
+
+    def _db(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            if self._fts is None:
+                try:
+                    conn.execute(_FTS)
+                    self._fts = True
+                except sqlite3.OperationalError:
+                    print("[CATALOG] SQLite has no FTS5; falling back to LIKE matching")
+                    self._fts = False
+            self._local.conn = conn
+        return conn
+
+    def refreshed_at(self):
+        if self._refreshed_at is None:
+            row = self._db().execute("SELECT value FROM meta WHERE key = 'refreshed_at'").fetchone()
+            self._refreshed_at = float(row["value"]) if row else 0.0
+        return self._refreshed_at
+
+    def is_ready(self):
+        return self.refreshed_at() > 0
+
+    def needs_refresh(self, max_age=REFRESH_INTERVAL):
+        return time.time() - self.refreshed_at() > max_age
+
+    # ---- refresh ----
+
+    def _fetch_type(self, project_type, limit, should_stop, progress):
+        hits, offset, total = [], 0, None
+        facets = json.dumps(SNAPSHOT_FACETS[project_type])
+        while offset < limit and (total is None or offset < total):
+            if should_stop and should_stop():
+                return None
+            r = self.session.get(SEARCH_URL, params={
+                "facets": facets, "index": "downloads",
+                "offset": offset, "limit": PAGE_SIZE,
+            }, timeout=30)
+            if r.status_code == 429:
+                time.sleep(int(r.headers.get("X-Ratelimit-Reset", "10") or 10))
+                continue
+            r.raise_for_status()
+            data = r.json()
+            page = data.get("hits", [])
+            total = min(int(data.get("total_hits") or 0), limit)
+            if not page:
+                break
+            hits.extend(page)
+            offset += len(page)
+            if progress:
+                progress(project_type, offset, total)
+            # stay well inside the API's per-minute budget
+            if int(r.headers.get("X-Ratelimit-Remaining", "100") or 100) < 20:
+                time.sleep(int(r.headers.get("X-Ratelimit-Reset", "5") or 5))
+        return hits
+
+    def refresh(self, limit=MAX_PER_TYPE, should_stop=None, progress=None):
+        """
+        Re-downloads the snapshot. Everything is fetched first and swapped in
+        with one transaction, so readers never see a half-built catalog and a
+        failed or cancelled refresh leaves the old one in place.
+        Returns the number of projects stored, or None if cancelled.
+        """
+        hits = []
+        for project_type in SNAPSHOT_FACETS:
+            page = self._fetch_type(project_type, limit, should_stop, progress)
+            if page is None:
+                return None
+            hits.extend(page)
+        # rows go in most-downloaded first, so rowid order *is* download order
+        # and the common sorts never need a sort step
+        hits.sort(key=lambda h: -int(h.get("downloads") or 0))
+
+        conn = self._db()
+        now = time.time()
+        seen = set()
+        with conn:
+            conn.execute("DELETE FROM hits")
+            conn.execute("DELETE FROM projects")
+            for hit in hits:
+                if hit.get("project_id") in seen:
+                    continue
+                seen.add(hit.get("project_id"))
+                cur = conn.execute(
+                    "INSERT INTO projects (project_id, project_type, title, description, author, "
+                    "categories, facets, downloads, date_created, date_modified) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (hit.get("project_id"), hit.get("project_type") or "", hit.get("title") or "",
+                     hit.get("description") or "", hit.get("author") or "",
+                     " ".join(hit.get("categories") or []), _facets_of(hit),
+                     int(hit.get("downloads") or 0), hit.get("date_created") or "",
+                     hit.get("date_modified") or ""))
+                conn.execute("INSERT INTO hits VALUES (?, ?)", (cur.lastrowid, json.dumps(hit)))
+            if self._fts:
+                conn.execute("INSERT INTO projects_fts(projects_fts) VALUES ('rebuild')")
+                conn.execute("INSERT INTO projects_fts(projects_fts) VALUES ('optimize')")
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('refreshed_at', ?)", (str(now),))
+        self._refreshed_at = now
+        print(f"[CATALOG] Snapshot refreshed: {len(seen)} projects")
+        return len(seen)
+
+    # ---- queries ----
+
+    def search(self, query="", facets=None, index="relevance", offset=0, limit=20):
+        """
+        Same contract as GET /v2/search: facets is a list of OR-groups that
+        are ANDed together. Returns (total_hits, hits).
+        """
+        conn = self._db()
+        groups = [[_facet_token(str(f)) for f in group] for group in (facets or []) if group]
+        match = _match_expr(query or "")
+        page = [int(limit), int(offset)]
+
+        if self._fts and (match or groups):
+            terms = ["facets : (%s)" % " OR ".join(g) for g in groups]
+            if match:
+                terms.insert(0, "{title description author categories} : (%s)" % match)
+            expr = " AND ".join(terms)
+            total = conn.execute("SELECT COUNT(*) FROM projects_fts WHERE projects_fts MATCH ?",
+                                 (expr,)).fetchone()[0]
+            if index in _ORDER and index != "downloads":
+                sql = ("SELECT p.id FROM projects_fts JOIN projects p ON p.id = projects_fts.rowid "
+                       f"WHERE projects_fts MATCH ? ORDER BY {_ORDER[index]} LIMIT ? OFFSET ?")
+                ids = [r[0] for r in conn.execute(sql, [expr] + page)]
+            elif match and index != "downloads":
+                ids = self._ranked(conn, expr, total, int(offset), int(limit))
+            else:
+                sql = "SELECT rowid FROM projects_fts WHERE projects_fts MATCH ? ORDER BY rowid LIMIT ? OFFSET ?"
+                ids = [r[0] for r in conn.execute(sql, [expr] + page)]
+        else:
+            where, args = [], []
+            for g in groups:
+                where.append("(%s)" % " OR ".join(["(' ' || p.facets || ' ') LIKE ?"] * len(g)))
+                args.extend("% " + t + " %" for t in g)
+            for word in re.findall(r"\w+", (query or "").lower()) if match else []:
+                where.append("(lower(p.title) LIKE ? OR lower(p.description) LIKE ? OR lower(p.author) LIKE ?)")
+                args.extend(["%" + word + "%"] * 3)
+            clause = (" WHERE " + " AND ".join(where)) if where else ""
+            total = conn.execute(f"SELECT COUNT(*) FROM projects p{clause}", args).fetchone()[0]
+            order = _ORDER.get(index, "p.id")
+            ids = [r[0] for r in conn.execute(
+                f"SELECT p.id FROM projects p{clause} ORDER BY {order} LIMIT ? OFFSET ?", args + page)]
+
+        if not ids:
+            return total, []
+        found = dict(conn.execute("SELECT id, hit FROM hits WHERE id IN (%s)" % ",".join("?" * len(ids)), ids))
+        return total, [json.loads(found[i]) for i in ids if i in found]
+
+    def _ranked(self, conn, expr, total, offset, limit):
+        """
+        Relevance order. Only the RANK_WINDOW most downloaded matches are
+        scored (a one-letter prefix can match half the catalog, and bm25 over
+        all of it is what would make typing slow); the rest follow them in
+        download order, which is where they'd end up anyway.
+        """
+        cutoff = None
+        if total > RANK_WINDOW:
+            cutoff = conn.execute("SELECT rowid FROM projects_fts WHERE projects_fts MATCH ? "
+                                  "ORDER BY rowid LIMIT 1 OFFSET ?", (expr, RANK_WINDOW - 1)).fetchone()[0]
+        ids = [r[0] for r in conn.execute(
+            "SELECT rowid FROM projects_fts WHERE projects_fts MATCH ? AND rowid <= ? "
+            f"ORDER BY {RANK} LIMIT ? OFFSET ?",
+            (expr, cutoff if cutoff is not None else 1 << 62, limit, offset))]
+        if cutoff is not None and len(ids) < limit:
+            ids += [r[0] for r in conn.execute(
+                "SELECT rowid FROM projects_fts WHERE projects_fts MATCH ? AND rowid > ? "
+                "ORDER BY rowid LIMIT ? OFFSET ?",
+                (expr, cutoff, limit - len(ids), max(0, offset - RANK_WINDOW)))]
+        return ids
+
+    def clear(self):
+        with self._db() as conn:
+            conn.execute("DELETE FROM hits")
+            conn.execute("DELETE FROM projects")
+            if self._fts:
+                conn.execute("INSERT INTO projects_fts(projects_fts) VALUES ('rebuild')")
+            conn.execute("DELETE FROM meta")
+        self._refreshed_at = 0.0
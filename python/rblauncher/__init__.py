@@ -0,0 +1,15 @@
+"""
+The launcher application, split by concern:
+
+    core         paths and the shared caches/stores (config, instances, icons, HTTP caches)
+    network      version lists, sign-in, app update and catalog refresh workers
+    install      InstallationWorker (vanilla/Fabric/modpack installs)
+    launch       running, tracking and stopping game instances
+    mods         Modrinth search/install/update workers and the installed-mods model
+    ui.*         widgets, dialogs and pages; ui.main_window holds LauncherV2
+    app          main()
+
+Pages and workers that aren't on screen at startup (mod manager, new
+instance wizard, account/settings dialogs, installs) are imported where
+they are first used, so a cold start only loads what the home page needs.
+"""
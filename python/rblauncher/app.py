@@ -0,0 +1,46 @@
+import sys
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import Qt
+
+from http_client import HTTP
+from startup_timeline import STARTUP
+
+from .core import APP_ICON_PATH2
+from .ui.main_window import LauncherV2
+
+
+class LoggerWriter:
+    def __init__(self, filepath):
+        self.terminal = sys.stdout
+        self.log = open(filepath, "a", buffering=1)
+
+    def write(self, message):
+        # Optional: write to terminal only if NOT production
+        # self.terminal.write(message) 
+        self.log.write(message)
+
+    def flush(self):
+        self.log.flush()
+
+def _flush_on_exit(w):
+    try:
+        w.flush_config(wait=True)
+    except OSError as e:
+        print(f"[CONFIG] Settings could not be saved on exit: {e}")
+
+
+def main():
+    STARTUP.mark("modules loaded")
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
+    app = QApplication(sys.argv)
+    app.setWindowIcon(QIcon(APP_ICON_PATH2))
+    app.setApplicationName("RBLauncher: Dusk")
+    app.aboutToQuit.connect(lambda: print("[HTTP] Session totals:\n" + HTTP.summary()))
+    app.aboutToQuit.connect(HTTP.close)
+    w = LauncherV2()
+    app.aboutToQuit.connect(lambda: _flush_on_exit(w))
+    w.show()
+    STARTUP.mark("window shown")
+    sys.exit(app.exec_())
@@ -0,0 +1,46 @@
+import os
+
+from config_store import ConfigStore
+from instance_catalog import InstanceCatalog
+from instance_store import InstanceStore
+from modrinth_cache import ModrinthCache
+from modrinth_catalog import ModrinthCatalog
+from svg_icons import SvgIconCache
+from thumbnails import ThumbnailCache
+
+# ================= GLOBAL CONSTANTS =================
+CONFIG_PATH = os.path.expanduser(
+    "~/Library/Application Support/ReallyBadLauncher/config.json"
+)
+GAME_DIR = os.path.expanduser("~/Library/Application Support/ReallyBadLauncher")
+# python/ (scripts/ lives next to this package)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_DIR = os.path.dirname(BASE_DIR)
+ICONS_DIR = os.path.join(PROJECT_DIR, ".icons")
+APP_ICON_PATH = os.path.join(ICONS_DIR, "rbldawn.png") 
+APP_ICON_PATH2 = os.path.join(ICONS_DIR, "icon.png") 
+# Rounded, pre-scaled mod/instance icons (memory LRU + disk cache)
+THUMBNAILS = ThumbnailCache(os.path.join(GAME_DIR, "cache", "thumbnails"))
+# Every Modrinth API GET goes through this (SQLite, per-endpoint TTLs, ETag revalidation)
+MODRINTH = ModrinthCache(os.path.join(GAME_DIR, "cache", "modrinth_api.sqlite3"))
+# Optional offline snapshot of Modrinth's listings; Browse/modpack search use it when enabled
+CATALOG = ModrinthCatalog(os.path.join(GAME_DIR, "cache", "modrinth_catalog.sqlite3"))
+# config.json: atomic writes with a .bak, on a writer thread (see LauncherV2.save_config)
+CONFIG_STORE = ConfigStore(CONFIG_PATH)
+# instances/<name>/instance.json: details loaded on selection, config.json keeps an index
+INSTANCES = InstanceStore(os.path.join(GAME_DIR, "instances"))
+# SQLite index over instances, their mod files and launch sessions (cross-instance queries)
+INSTANCE_DB = InstanceCatalog(os.path.join(GAME_DIR, "instances.sqlite3"))
+# Recolored .icons/*.svg, parsed once and memoized per (path, size, color, dpr)
+SVG_ICONS = SvgIconCache()
+
+
+def __getattr__(name):
+    # Remote icons (Browse cards, modpack cards): fetched through HTTP, disk + memory cache.
+    # Made on first use: nothing needs it until a page that shows them is opened.
+    if name == "IMAGES":
+        global IMAGES
+        from image_loader import ImageLoader
+        IMAGES = ImageLoader(os.path.join(GAME_DIR, "cache", "images"))
+        return IMAGES
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,241 @@
+import os
+import json
+import shutil
+import subprocess
+import zipfile
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from http_client import HTTP
+from mod_index import MetadataPipeline, ModIndex, mod_data_from_meta, read_jar_metadata
+
+from .core import GAME_DIR, BASE_DIR
+
+
+# ================= INSTALLATION WORKER (FIXED) =================
+class InstallationWorker(QObject):
+    """Worker for handling installations in a separate thread."""
+    progress = pyqtSignal(str)
+    finished = pyqtSignal(bool, str)
+
+    def __init__(self, instance_data, java_path):
+        super().__init__()
+        self.instance_data = instance_data
+        self.java_path = java_path or "java"
+        self._should_stop = False
+        # Setup cache dir for extracted mod icons
+        self.mod_icon_cache = os.path.join(GAME_DIR, "cache", "mod_icons")
+        os.makedirs(self.mod_icon_cache, exist_ok=True)
+
+    def stop(self):
+        self._should_stop = True
+
+    def run(self):
+        try:
+            instance_type = self.instance_data.get('type')
+            
+            if instance_type == "Modrinth":
+                self.install_modrinth_pack()
+            else:
+                self.install_vanilla_or_fabric()
+            
+            if not self._should_stop:
+                self.finished.emit(True, "Installation completed successfully!")
+
+        except Exception as e:
+            import traceback
+            print(traceback.format_exc())
+            self.finished.emit(False, f"Error: {str(e)}")
+
+    def execute_process(self, args):
+        """Executes a subprocess and emits output."""
+        if args[0].endswith(".sh") or args[0].endswith(".command"):
+            subprocess.run(["chmod", "+x", args[0]])
+
+        process = subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            universal_newlines=True
+        )
+        for line in process.stdout:
+            if self._should_stop:
+                process.terminate()
+                return False
+            self.progress.emit(line.strip())
+        process.wait()
+        return process.returncode == 0
+
+    def download_url(self, url, dest):
+        """Helper to download a file with progress logging."""
+        try:
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            r = HTTP.get(url, kind="download", stream=True)
+            r.raise_for_status()
+            with open(dest, 'wb') as f:
+                for chunk in r.iter_content(chunk_size=8192):
+                    if self._should_stop: return False
+                    f.write(chunk)
+            return True
+        except Exception as e:
+            self.progress.emit(f"Download Failed: {e}")
+            return False
+
+    def extract_jar_metadata(self, jar_path):
+        """
+        Reads fabric.mod.json to find name, version, icon, and potentially project_id.
+        """
+        return read_jar_metadata(jar_path, self.mod_icon_cache)
+
+    def install_modrinth_pack(self):
+        name = self.instance_data['name']
+        instance_dir = os.path.join(GAME_DIR, "instances", name)
+        
+        mp_url = self.instance_data.get('modpack_url')
+        if not mp_url:
+            self.progress.emit("Error: No Modpack URL found.")
+            return
+
+        self.progress.emit("Downloading Modrinth Pack...")
+        pack_zip_path = os.path.join(instance_dir, "modpack.mrpack")
+        if not self.download_url(mp_url, pack_zip_path):
+            raise Exception("Failed to download modpack file.")
+
+        self.progress.emit("Reading modpack manifest...")
+        downloaded_mods_metadata = []
+        index = ModIndex(instance_dir, self.mod_icon_cache)
+        # Jars are parsed on a worker pool while the remaining downloads run
+        pipeline = MetadataPipeline(self.mod_icon_cache)
+        pending = []  # (manifest path, download url, dest path, future)
+
+        try:
+            with zipfile.ZipFile(pack_zip_path, 'r') as z:
+                with z.open("modrinth.index.json") as f:
+                    manifest = json.load(f)
+                
+                # --- NEW: Extract Dependencies (Loader & Game Version) ---
+                deps = manifest.get("dependencies", {})
+                print(deps)
+                # 1. Sync Minecraft Version
+                if "minecraft" in deps:
+                    self.instance_data["version"] = deps["minecraft"]
+                
+                # 2. Sync Loader Version
+                if "fabric-loader" in deps:
+                    self.instance_data["modloader"] = "Fabric"
+                    self.instance_data["fabric_version"] = deps["fabric-loader"]
+                    print(self.instance_data)
+                    # Also set generic field for compatibility
+                    self.instance_data["loader_version"] = deps["fabric-loader"]
+                    self.progress.emit(f"Set Fabric Loader to {deps['fabric-loader']}")
+                    
+                elif "forge" in deps:
+                    self.instance_data["modloader"] = "Forge"
+                    self.instance_data["loader_version"] = deps["forge"]
+                # ---------------------------------------------------------
+
+                files = manifest.get("files", [])
+                total = len(files)
+                self.progress.emit(f"Found {total} mods to download.")
+                
+                for i, file_info in enumerate(files):
+                    if self._should_stop: return
+                    
+                    path = file_info["path"] 
+                    downloads = file_info["downloads"]
+                    
+                    if not downloads: continue
+                    
+                    dl_url = downloads[0]
+                    dest_path = os.path.join(instance_dir, path)
+                    
+                    self.progress.emit(f"[{i+1}/{total}] Downloading {os.path.basename(path)}...")
+                    if self.download_url(dl_url, dest_path):
+                        # Hand the jar to the metadata pool and move on to the next download
+                        pending.append((path, dl_url, dest_path, pipeline.submit(dest_path)))
+
+                # Overrides (Config files, etc.)
+                for zip_info in z.infolist():
+                    if zip_info.filename.startswith("overrides/"):
+                        target_name = zip_info.filename[len("overrides/"):]
+                        if not target_name: continue
+                        target_path = os.path.join(instance_dir, target_name)
+                        if zip_info.is_dir():
+                            os.makedirs(target_path, exist_ok=True)
+                        else:
+                            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                            with z.open(zip_info) as source, open(target_path, "wb") as target:
+                                shutil.copyfileobj(source, target)
+
+            # By now nearly every future has finished in the background
+            for path, dl_url, dest_path, future in pending:
+                if self._should_stop: return
+
+                # 1. Metadata from the Jar (and remember it in the mod index)
+                jar_meta = pipeline.result(future, dest_path)
+                if path.startswith("mods/"):
+                    index.put(dest_path, jar_meta)
+                mod_meta = mod_data_from_meta(jar_meta)
+
+                # 2. Extract Project ID from URL if missing
+                if not mod_meta.get("project_id") and "cdn.modrinth.com/data/" in dl_url:
+                    try:
+                        parts = dl_url.split("/")
+                        if "data" in parts:
+                            data_index = parts.index("data")
+                            if len(parts) > data_index + 1:
+                                mod_meta["project_id"] = parts[data_index + 1]
+                    except Exception as e:
+                        print(f"Could not parse project ID from URL {dl_url}: {e}")
+
+                downloaded_mods_metadata.append(mod_meta)
+
+            self.progress.emit("Modpack files installed.")
+            index.save()
+            
+            # SAVE METADATA TO INSTANCE
+            self.instance_data["mod_data"] = downloaded_mods_metadata
+            self.instance_data["mod_count"] = len(downloaded_mods_metadata)
+            
+        except Exception as e:
+            raise Exception(f"Failed to process modpack: {e}")
+        finally:
+            pipeline.close(cancel=self._should_stop)
+            if os.path.exists(pack_zip_path):
+                os.remove(pack_zip_path)
+
+        self.install_vanilla_or_fabric()
+
+    def install_vanilla_or_fabric(self):
+        self.progress.emit("Setting up core game files...")
+        name = self.instance_data['name']
+        version = self.instance_data['version']
+        modloader = self.instance_data.get('modloader', 'Vanilla')
+        
+        # Ensure directory exists
+        instance_dir = os.path.join(GAME_DIR, "instances", name)
+        os.makedirs(instance_dir, exist_ok=True)
+        
+        scripts_dir = os.path.join(BASE_DIR, "scripts")
+        
+        if modloader == "Fabric":
+            self.progress.emit(f"Installing Fabric for {version}...")
+            # Default fabric version if not specified
+            fabric_ver = self.instance_data.get('fabric_version', 'latest')
+            script = os.path.join(scripts_dir, "install_fabric.sh")
+            
+            if os.path.exists(script):
+                self.execute_process([script, version, fabric_ver, self.java_path])
+            else:
+                self.progress.emit(f"Error: Script not found at {script}")
+
+        elif modloader == "Vanilla":
+            self.progress.emit(f"Downloading Vanilla {version}...")
+            script = os.path.join(scripts_dir, "download_vanilla.sh")
+            
+            if os.path.exists(script):
+                self.execute_process([script, version, self.java_path])
+            else:
+                self.progress.emit(f"Error: Script not found at {script}")
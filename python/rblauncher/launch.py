@@ -0,0 +1,389 @@
+import os
+import subprocess
+import threading
+import sqlite3
+
+from PyQt5.QtWidgets import QMessageBox
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from http_client import HTTP
+
+from .core import BASE_DIR, INSTANCE_DB
+
+
+class LogEmitter(QObject):
+    """Signals for thread-safe logging"""
+    log_signal = pyqtSignal(str)
+
+
+class LaunchMixin:
+    """
+    LauncherV2's side of running the game: building the launch command,
+    the launch/kill threads, play sessions and the Launch/Stop buttons.
+    """
+
+    def launch_last_played_from_home(self):
+
+        # Identify target instance
+        name = getattr(self, "last_played_instance", "")
+        if not name or name not in self.instances_data:
+            name = self._pick_most_recent_instance() or next(iter(self.instances_data.keys()))
+        
+        if not name: return
+
+        # Check if running
+        if name in self.active_instances:
+            self.kill_instance(name)
+        else:
+            # Set selection and launch
+            self.set_selected_instance(name)
+            self.pages.setCurrentWidget(self.page_launcher)
+            self.refresh_instances_list()
+            self.launch_instance()
+
+    def kill_instance(self, name):
+        """Terminates the subprocess for the given instance."""
+        # 1. Check if the instance is actually running/tracked
+        if name not in self.active_instances:
+            print(f"Instance {name} is not in active instances.")
+            return
+
+        self.log_output.emit(f"[Manager] Stopping instance: {name}...")
+
+        try:
+            # 2. Setup the script path
+            script_name = "kill.command"
+            launch_script = os.path.join(BASE_DIR, "scripts", script_name)
+
+            # 3. Prepare arguments
+            # Your bash script builds the path using the name, so we just pass 'name'.
+            # If you passed a full path here, the bash script would double it up.
+            args = [launch_script, name] 
+            
+            kill_thread = threading.Thread(target=self._run_kill_thread, args=(args,))
+            kill_thread.start()
+
+        except Exception as e:
+            print(f"Error preparing to kill process: {e}")
+
+    def _run_kill_thread(self, args):
+        if args[0].endswith(".command") or args[0].endswith(".sh"):
+            subprocess.run(["chmod", "+x", args[0]])
+        def runner():
+            try:
+                process = subprocess.Popen(
+                    args,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,
+                    universal_newlines=True
+                )
+                
+                # Stream output
+                for line in process.stdout:
+                    # Emit signal instead of printing
+                    self.log_output.emit(line.strip())
+                    
+                process.wait()
+                
+            except Exception as e:
+                self.log_output.emit(f"Error killing instance: {str(e)}")
+
+        # Start the background thread
+        threading.Thread(target=runner, daemon=True).start()
+
+    def mark_instance_last_played(self, name: str):
+        if not name or name not in self.instances_data:
+            return
+
+        from datetime import datetime, timezone
+        iso = datetime.now(timezone.utc).isoformat()
+
+        self.instances_data[name]["last_played"] = iso
+        self.instances_data[name]["last_played_instance"] = name  # optional per-instance
+
+        # ✅ global "last played" pointer
+        self.last_played_instance = name
+
+        self.save_config()
+
+        if self.selected_instance_name == name and hasattr(self, "card_last"):
+            self.card_last.value.setText(self._time_ago(iso))
+
+        self.update_home_launch_label()
+
+    def launch_instance(self):
+        """Toggle: Launch if idle, Kill if running."""
+        # 1. Auth Check
+        if self.selected_instance_name not in self.active_instances:
+            if not self.is_authenticated():
+                # Create a message box with "Continue Offline" and "Cancel" (Exit) options
+                msg_box = QMessageBox(self)
+                msg_box.setWindowTitle("Not signed in")
+                msg_box.setText("You are not signed in. Would you like to continue in offline mode or cancel?")
+                
+                continue_button = msg_box.addButton("Continue Offline", QMessageBox.AcceptRole)
+                cancel_button = msg_box.addButton("Cancel", QMessageBox.RejectRole)
+                
+                msg_box.exec()
+
+                if msg_box.clickedButton() == cancel_button:
+                    return
+
+        # 2. Selection Check
+        if not self.selected_instance_name:
+            return
+
+        # 3. TOGGLE LOGIC
+        if self.selected_instance_name in self.active_instances:
+            # IT IS RUNNING -> KILL IT
+            self.kill_instance(self.selected_instance_name)
+            return
+
+        # 4. Record Stats (Only on launch)
+        self.mark_instance_last_played(self.selected_instance_name)
+
+        print(f"[Launch] Starting: {self.selected_instance_name}")
+        
+        instance_data = self.instances_data.get(self.selected_instance_name, {})
+        modloader = instance_data.get('modloader', 'Vanilla')
+        version = instance_data.get('version', '')
+
+        if modloader == "Fabric":
+            self.launch_fabric_instance(version, instance_data)
+        else:
+            self.launch_vanilla_instance(version)
+
+    def get_latest_fabric_loader(self, game_version):
+        """Fetches the latest stable Fabric Loader version for a specific Minecraft version."""
+        url = f"https://meta.fabricmc.net/v2/versions/loader/{game_version}"
+        
+        try:
+            response = HTTP.get(url, timeout=5)
+            response.raise_for_status()
+            data = response.json()
+            
+            if data:
+                # The API returns a list sorted by newest first.
+                # We grab the first one. 
+                # You could also loop through to find the first where 'loader'['stable'] is True.
+                return data[0]['loader']['version']
+                
+        except Exception as e:
+            print(f"Failed to fetch Fabric version: {e}")
+            # Fallback to a safe default or handle error appropriately
+            return None 
+        
+        return None
+
+    def launch_fabric_instance(self, version, instance_data):
+        """Prepare arguments for Fabric launch"""
+        script_name = "fabric.command"
+        launch_script = os.path.join(BASE_DIR, "scripts", script_name)
+        
+        # --- NEW LOGIC START ---
+        # Check if we need to resolve "latest"
+        fabric_version = instance_data.get('fabric_version', "latest")
+        
+        if fabric_version == "latest":
+            print(f"Resolving latest Fabric Loader for Minecraft {version}...")
+            fetched_version = self.get_latest_fabric_loader(version)
+            
+            if fetched_version:
+                fabric_version = fetched_version
+                print(f"Resolved Fabric Loader: {fabric_version}")
+            else:
+                # Handle offline/error case - maybe default to a known safe version 
+                # or raise an error if you can't launch without it.
+                print("Could not resolve Fabric version, check internet connection.")
+                self.log_output.emit("Could not resolve Fabric version, check internet connection.")
+                return 
+        # --- NEW LOGIC END ---
+
+        # ✅ Ensure we use self.java_path
+        java_exec = self.java_path if self.java_path else "java"
+
+        args = [
+            launch_script, 
+            self.username, 
+            self.uuid, 
+            version, 
+            fabric_version, 
+            self.access_token, 
+            self.selected_instance_name, 
+            java_exec # ✅ Passed here
+        ]
+        
+        self._run_launch_thread(args)
+
+    def launch_vanilla_instance(self, version):
+        """Prepare arguments for Vanilla launch"""
+        script_name = "launch_vanilla.command"
+        launch_script = os.path.join(BASE_DIR, "scripts", script_name)
+        
+        # ✅ Ensure we use self.java_path
+        java_exec = self.java_path if self.java_path else "java"
+
+        args = [
+            launch_script, 
+            self.username, 
+            self.uuid, 
+            version, 
+            self.access_token, 
+            self.selected_instance_name, 
+            java_exec # ✅ Passed here
+        ]
+
+        self._run_launch_thread(args)
+
+    def _handle_log_output(self, text):
+        """Slot to append log text to the UI safely."""
+        if hasattr(self, 'log_view'):
+            self.log_view.append(text)
+            # Auto scroll to bottom
+            sb = self.log_view.verticalScrollBar()
+            sb.setValue(sb.maximum())
+
+    def _run_launch_thread(self, args):
+        """Executes the subprocess in a separate thread to prevent GUI freezing"""
+        
+        # Clear previous logs on new launch
+        if hasattr(self, 'log_view'):
+            self.log_view.clear()
+            self.log_view.append(f"Executing command:\n{' '.join(args)}\n")
+
+        # Ensure script is executable (Mac/Linux)
+        if args[0].endswith(".command") or args[0].endswith(".sh"):
+            subprocess.run(["chmod", "+x", args[0]])
+
+        def runner():
+            instance_name = self.selected_instance_name
+            active_name = instance_name
+            try:
+                process = subprocess.Popen(
+                    args,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,
+                    universal_newlines=True
+                )
+                
+                # Register active process
+                self.active_instances[instance_name] = process
+                session_id = self._start_session(instance_name)
+                
+                # Emit signal that instance has started
+                self.instance_started.emit(active_name)
+                
+                # Stream output
+                for line in process.stdout:
+                    # Emit signal instead of printing
+                    self.log_output.emit(line.strip())
+                    
+                process.wait()
+                self.log_output.emit(f"\nProcess finished with exit code: {process.returncode}")
+                self._end_session(session_id, process.returncode)
+                
+            except Exception as e:
+                self.log_output.emit(f"Error launching instance: {str(e)}")
+            finally:
+                # Cleanup
+                if instance_name in self.active_instances:
+                    del self.active_instances[instance_name]
+
+                # Emit signal that instance stopped
+                self.instance_stopped.emit(active_name)
+        # Start the background thread
+        threading.Thread(target=runner, daemon=True).start()
+
+    def _play_time_text(self, name):
+        if not self._instance_db_ready:
+            return ""
+        try:
+            sessions, seconds = INSTANCE_DB.play_time(name)
+        except sqlite3.Error:
+            return ""
+        if not sessions:
+            return "Not played yet"
+        hours, minutes = divmod(int(seconds) // 60, 60)
+        return f"{sessions} session{'s' if sessions != 1 else ''}, {hours}h {minutes:02d}m played"
+
+    def _start_session(self, name):
+        # launch thread: sqlite connections are per thread, so this is safe here
+        if not self._instance_db_ready:
+            return None
+        try:
+            return INSTANCE_DB.start_session(name)
+        except sqlite3.Error as e:
+            print(f"[INSTANCEDB] Could not record launch: {e}")
+            return None
+
+    def _end_session(self, session_id, exit_code):
+        if session_id is None:
+            return
+        try:
+            INSTANCE_DB.end_session(session_id, exit_code)
+        except sqlite3.Error as e:
+            print(f"[INSTANCEDB] Could not record exit: {e}")
+
+    def _on_instance_state_changed(self, instance_name):
+        """Slot called when any instance starts or stops."""
+        # Refresh buttons based on current selection
+        self.update_launch_buttons_ui()
+
+    def update_launch_buttons_ui(self):
+        """Updates the Big Launch button and Home button based on running PIDs."""
+        
+        # --- 1. Update Instance Page Button (Big Button) ---
+        if self.selected_instance_name and hasattr(self, "btn_launch_big"):
+            is_running = self.selected_instance_name in self.active_instances
+            self._apply_button_state(self.btn_launch_big, is_running, self.selected_instance_name)
+        
+        # --- 2. Update Home Page Button ---
+        # Determine which instance the home button represents
+        home_inst_name = getattr(self, "last_played_instance", "")
+        if not home_inst_name or home_inst_name not in self.instances_data:
+            home_inst_name = self._pick_most_recent_instance()
+        
+        if home_inst_name:
+            is_running = home_inst_name in self.active_instances
+            self._apply_button_state(self.btn_launch_home, is_running, home_inst_name, is_home=True)
+
+    def _apply_button_state(self, btn, is_running, instance_name, is_home=False):
+        """Helper to style a button as Launch (Green) or Stop (Red)."""
+        if is_running:
+            btn.setText(f"Stop {instance_name}")
+            btn.setObjectName("StopButton") # Requires CSS update below
+            # Force red style directly to ensure override
+            btn.setStyleSheet("""
+                QPushButton {
+                    background-color: #ef4444; 
+                    color: white; 
+                    border: none; 
+                    border-radius: 14px; 
+                    font-size: 17px; 
+                    font-weight: 700;
+                }
+                QPushButton:hover { background-color: #dc2626; }
+            """)
+            self.set_button_svg_icon(btn, "Kill", size=22)
+        else:
+            prefix = "Launch last played" if is_home else "Launch"
+            display_name = f" ({instance_name})" if is_home else f" {instance_name}"
+            btn.setText(f"{prefix}{display_name}")
+            btn.setObjectName("LaunchButton")
+            # Force green style (restore)
+            btn.setStyleSheet("""
+                QPushButton {
+                    background-color: #10b981; 
+                    color: white; 
+                    border: none; 
+                    border-radius: 14px; 
+                    font-size: 17px; 
+                    font-weight: 700;
+                }
+                QPushButton:hover { background-color: #059669; }
+            """)
+            self.set_button_svg_icon(btn, "Launch", size=22)
@@ -0,0 +1,434 @@
+import os
+import json
+import shutil
+import sqlite3
+
+import requests
+
+from PyQt5.QtCore import (
+    QAbstractListModel, QModelIndex, QObject, QSortFilterProxyModel, Qt, pyqtSignal
+)
+
+from http_client import HTTP
+from mod_index import ModIndex
+from mod_resolver import InstallResolver, discard_plan
+from mod_update import HashLookupCache, fetch_projects, find_updates, identify_jars, stage_updates
+
+from .core import MODRINTH, CATALOG
+
+
+class ModrinthSearchWorker(QObject):
+    """
+    Fetches one page of Browse results. tag is handed back untouched.
+    is_current (optional) is asked before the request goes out, so a
+    search superseded while waiting to start never hits the network.
+    """
+    results_ready = pyqtSignal(object, int, list)  # tag, total_hits, hits
+    error = pyqtSignal(object, str)
+
+    def __init__(self, query, mc_version, sort_index="relevance", offset=0, limit=20, tag=None, is_current=None):
+        super().__init__()
+        self.query = query
+        self.mc_version = mc_version
+        self.sort_index = sort_index
+        self.offset = offset
+        self.limit = limit
+        self.tag = tag
+        self.is_current = is_current
+
+    def run(self):
+        try:
+            if self.is_current is not None and not self.is_current():
+                self.error.emit(self.tag, "superseded")
+                return
+
+            url = "https://api.modrinth.com/v2/search"
+            
+            # Facets: AND logic is outer list, OR logic is inner list.
+            # We want: (Fabric) AND (Game Version) AND (Mod)
+            facets = [
+                ["categories:fabric"],
+                ["project_type:mod"],
+            ]
+            
+            if self.mc_version:
+                facets.append([f"versions:{self.mc_version}"])
+
+            params = {
+                "query": self.query,
+                "facets": json.dumps(facets),
+                "index": self.sort_index, # relevance, downloads, newest, updated
+                "offset": self.offset,
+                "limit": self.limit
+            }
+
+            if CATALOG.enabled and CATALOG.is_ready():
+                try:
+                    total, hits = CATALOG.search(self.query, facets, self.sort_index, self.offset, self.limit)
+                    self.results_ready.emit(self.tag, total, hits)
+                    return
+                except sqlite3.Error as e:
+                    print(f"[CATALOG] Offline search failed, asking Modrinth: {e}")
+
+            data = MODRINTH.get_json(url, params, timeout=10)
+            self.results_ready.emit(self.tag, int(data.get("total_hits") or 0), data.get("hits", []))
+        except requests.HTTPError as e:
+            self.error.emit(self.tag, f"Search failed: {e.response.status_code}")
+        except Exception as e:
+            self.error.emit(self.tag, str(e))
+
+
+class ModrinthVersionFetcher(QObject):
+    """Fetches list of versions compatible with the instance."""
+    versions_ready = pyqtSignal(list)
+    error = pyqtSignal(str)
+    
+    def __init__(self, project_id, mc_version, loader):
+        super().__init__()
+        self.project_id = project_id
+        self.mc_version = mc_version
+        self.loader = loader
+
+    def run(self):
+        try:
+            url = f"https://api.modrinth.com/v2/project/{self.project_id}/version"
+            params = {}
+            if self.mc_version: params["game_versions[]"] = self.mc_version
+            if self.loader: params["loaders[]"] = self.loader.lower()
+
+            self.versions_ready.emit(MODRINTH.get_json(url, params, timeout=10))
+        except requests.HTTPError as e:
+            self.error.emit(f"API Error: {e.response.status_code}")
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class ModrinthInstaller(QObject):
+    """Downloads a specific file URL and replaces old files."""
+    progress = pyqtSignal(str)
+    finished = pyqtSignal(bool, str, dict) # success, msg, updated_data_partial
+
+    def __init__(self, file_info, new_version_number, mod_data, mods_dir):
+        super().__init__()
+        self.file_info = file_info
+        self.new_version = new_version_number
+        self.mod_data = mod_data
+        self.mods_dir = mods_dir
+        self._should_stop = False
+
+    def run(self):
+        temp_path = None
+        try:
+            url = self.file_info.get("url")
+            filename = self.file_info.get("filename")
+            
+            if not url or not filename:
+                self.finished.emit(False, "Invalid file info", {})
+                return
+
+            os.makedirs(self.mods_dir, exist_ok=True)
+            
+            # 1. Download
+            self.progress.emit(f"Downloading {filename}...")
+            temp_path = os.path.join(self.mods_dir, f".temp_{filename}")
+            
+            r = HTTP.get(url, kind="download", stream=True)
+            r.raise_for_status()
+            with open(temp_path, "wb") as f:
+                for chunk in r.iter_content(chunk_size=8192):
+                    if self._should_stop:
+                        raise RuntimeError("Cancelled")
+                    f.write(chunk)
+            
+            # 2. Move New File (before touching the old one, so a failure leaves the mod installed)
+            final_path = os.path.join(self.mods_dir, filename)
+            os.replace(temp_path, final_path)
+            temp_path = None
+
+            # 3. Delete Old Files
+            self.progress.emit("Removing old version...")
+            old_files = self.mod_data.get("filenames", [])
+            for fn in old_files:
+                if fn == filename:
+                    continue
+                p = os.path.join(self.mods_dir, fn)
+                if os.path.exists(p):
+                    try: os.remove(p)
+                    except: pass
+            
+            # 4. Success Data
+            updated_data = {
+                "filenames": [filename],
+                "version": self.new_version,
+                "enabled": True
+            }
+            self.finished.emit(True, f"Installed {self.new_version}", updated_data)
+
+        except Exception as e:
+            # Never leave a partial download behind; finished is always emitted
+            # so the caller releases its hold on the mods folder watcher.
+            if temp_path:
+                try: os.remove(temp_path)
+                except OSError: pass
+            self.finished.emit(False, str(e), {})
+
+    def stop(self):
+        self._should_stop = True
+
+
+class ModInstallPlanner(QObject):
+    """
+    Resolves a Browse install (required dependencies, conflicts, duplicate
+    mod ids) and downloads the whole set into a staging folder.
+    Nothing is written to mods/ here; see InstallResolver.
+    installed_metas=None reads them from the instance's mod index first.
+    """
+    progress = pyqtSignal(str)
+    planned = pyqtSignal(object)  # plan dict
+    error = pyqtSignal(str)
+
+    def __init__(self, version, project, mc_version, loader, installed_mods, installed_metas,
+                 staging_dir, icon_cache_dir, instance_dir=None):
+        super().__init__()
+        self.version = version
+        self.project = project
+        self.instance_dir = instance_dir
+        self.installed_metas = installed_metas
+        self.staging_dir = staging_dir
+        self.icon_cache_dir = icon_cache_dir
+        self._should_stop = False
+        self.resolver = InstallResolver(mc_version, loader, installed_mods, installed_metas,
+                                        should_stop=lambda: self._should_stop, http=MODRINTH)
+        self.resolver.progress = self.progress.emit
+
+    def stop(self):
+        self._should_stop = True
+
+    def run(self):
+        try:
+            if self.installed_metas is None:
+                self.progress.emit("Reading installed mods...")
+                index = ModIndex(self.instance_dir, self.icon_cache_dir)
+                index.refresh()
+                self.resolver.installed_metas = [e["meta"] for e in index.entries.values()]
+            plan = self.resolver.plan(self.version, self.project, self.staging_dir, self.icon_cache_dir)
+            if self._should_stop:
+                discard_plan(plan)
+                self.error.emit("Cancelled")
+                return
+            self.planned.emit(plan)
+        except Exception as e:
+            shutil.rmtree(self.staging_dir, ignore_errors=True)
+            self.error.emit(str(e))
+
+
+class ModIndexLoader(QObject):
+    """Builds or refreshes an instance's mod index; only new or changed jars are opened."""
+    loaded = pyqtSignal(object)  # ModIndex
+    error = pyqtSignal(str)
+
+    def __init__(self, instance_dir, icon_cache_dir):
+        super().__init__()
+        self.instance_dir = instance_dir
+        self.icon_cache_dir = icon_cache_dir
+
+    def run(self):
+        try:
+            index = ModIndex(self.instance_dir, self.icon_cache_dir)
+            index.refresh()
+            self.loaded.emit(index)
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class ModUpdateFinder(QObject):
+    """
+    Resolves every available update for an instance in one request
+    (find_updates). Emits mod_checked for every mod, then found with the
+    update list; the background check uses the first, Update All the second.
+    """
+    mod_checked = pyqtSignal(object, bool, str)  # mod_data, has_update, latest_version
+    found = pyqtSignal(object)  # list of updates; object keeps the mod_data dicts by reference
+    error = pyqtSignal(str)
+    finished = pyqtSignal()
+
+    def __init__(self, instance_dir, mods, mc_version, loader):
+        super().__init__()
+        self.instance_dir = instance_dir
+        self.mods = list(mods)
+        self.mc_version = mc_version
+        self.loader = loader
+        self._should_stop = False
+
+    def stop(self):
+        self._should_stop = True
+
+    def run(self):
+        try:
+            index = ModIndex(self.instance_dir)
+            updates = find_updates(self.mods, index, self.mc_version, self.loader)
+            latest = {id(u["mod"]): u["version_number"] for u in updates}
+            for mod in self.mods:
+                if self._should_stop:
+                    return
+                if id(mod) in latest:
+                    self.mod_checked.emit(mod, True, latest[id(mod)])
+                else:
+                    self.mod_checked.emit(mod, False, mod.get("version", ""))
+            self.found.emit(updates)
+        except Exception as e:
+            self.error.emit(str(e))
+        finally:
+            self.finished.emit()
+
+
+class ModIdentifier(QObject):
+    """Matches jars with no project_id to Modrinth projects by sha1."""
+    identified = pyqtSignal(object)  # [(mod_data, info)]; object keeps the dicts by reference
+    error = pyqtSignal(str)
+
+    def __init__(self, instance_dir, mods, cache_path):
+        super().__init__()
+        self.instance_dir = instance_dir
+        self.mods = list(mods)
+        self.cache_path = cache_path
+
+    def run(self):
+        try:
+            index = ModIndex(self.instance_dir)
+            self.identified.emit(identify_jars(self.mods, index, HashLookupCache(self.cache_path)))
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class ProjectHydrator(QObject):
+    """Fetches Modrinth project info (title, team owner, categories, icon) for a set of ids, in batches."""
+    hydrated = pyqtSignal(object)  # {project_id: project}
+    error = pyqtSignal(str)
+
+    def __init__(self, project_ids):
+        super().__init__()
+        self.project_ids = list(project_ids)
+
+    def run(self):
+        try:
+            self.hydrated.emit(fetch_projects(self.project_ids, MODRINTH))
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class ModUpdateStager(QObject):
+    """Downloads a set of updates into staging, in parallel."""
+    progress = pyqtSignal(str)
+    staged = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+    def __init__(self, updates, staging_dir):
+        super().__init__()
+        self.updates = updates
+        self.staging_dir = staging_dir
+        self._should_stop = False
+
+    def stop(self):
+        self._should_stop = True
+
+    def run(self):
+        try:
+            stage_updates(self.updates, self.staging_dir,
+                          should_stop=lambda: self._should_stop, progress=self.progress.emit)
+            self.staged.emit(self.updates)
+        except Exception as e:
+            shutil.rmtree(self.staging_dir, ignore_errors=True)
+            self.error.emit(str(e))
+
+
+# ---------------------------
+# Installed mods list (model / view)
+# ---------------------------
+
+class InstalledModsModel(QAbstractListModel):
+    """Holds the instance's mod_data dicts. Rows are the dicts themselves."""
+    ModRole = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._mods = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._mods)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._mods):
+            return None
+        mod = self._mods[index.row()]
+        if role == self.ModRole:
+            return mod
+        if role == Qt.DisplayRole:
+            return mod.get("title") or mod.get("name", "Unknown Mod")
+        return None
+
+    def mods(self):
+        return self._mods
+
+    def set_mods(self, mods):
+        self.beginResetModel()
+        self._mods = list(mods or [])
+        self.endResetModel()
+
+    def add_mod(self, mod):
+        row = len(self._mods)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._mods.append(mod)
+        self.endInsertRows()
+
+    def row_of(self, mod):
+        for i, m in enumerate(self._mods):
+            if m is mod:
+                return i
+        return -1
+
+    def remove_mod(self, mod):
+        row = self.row_of(mod)
+        if row < 0:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._mods[row]
+        self.endRemoveRows()
+        return True
+
+    def replace_mod(self, old, new):
+        row = self.row_of(old)
+        if row < 0:
+            return False
+        self._mods[row] = new
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx)
+        return True
+
+    def mod_changed(self, mod):
+        row = self.row_of(mod)
+        if row >= 0:
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx)
+
+
+class InstalledModsFilter(QSortFilterProxyModel):
+    """Shows the rows a ModSearchIndex query returned, best match first."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ranks = None  # id(mod) -> rank; None shows everything in install order
+
+    def set_ranking(self, keys):
+        self._ranks = None if keys is None else {k: i for i, k in enumerate(keys)}
+        self.invalidate()
+        self.sort(-1 if self._ranks is None else 0)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._ranks is None:
+            return True
+        return id(self.sourceModel().mods()[source_row]) in self._ranks
+
+    def lessThan(self, left, right):
+        mods = self.sourceModel().mods()
+        return self._ranks.get(id(mods[left.row()]), 0) < self._ranks.get(id(mods[right.row()]), 0)
@@ -0,0 +1,257 @@
+import sqlite3
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+
+from http_client import HTTP
+
+from .core import MODRINTH, CATALOG
+
+
+class ApiWorker(QThread):
+    """Generic worker for fetching JSON from APIs"""
+    data_ready = pyqtSignal(list)
+    error = pyqtSignal(str)
+
+    def __init__(self, mode, query=None):
+        super().__init__()
+        self.mode = mode
+        self.query = query
+
+    def run(self):
+        try:
+            if self.mode == "vanilla":
+                url = "https://launchermeta.mojang.com/mc/game/version_manifest.json"
+                data = HTTP.get_json(url)
+                # Return ALL versions (release + snapshot)
+                # We will filter them in the UI
+                self.data_ready.emit(data["versions"])
+            
+            elif self.mode == "fabric":
+                url = "https://meta.fabricmc.net/v2/versions/loader"
+                data = HTTP.get_json(url)
+                # Just get loader versions
+                versions = [v["version"] for v in data]
+                self.data_ready.emit(versions)
+
+            elif self.mode == "modpack_search":
+                hits = None
+                if CATALOG.enabled and CATALOG.is_ready():
+                    try:
+                        _, hits = CATALOG.search(self.query or "", [["project_type:modpack"]], limit=20)
+                    except sqlite3.Error as e:
+                        print(f"[CATALOG] Offline search failed, asking Modrinth: {e}")
+                if hits is None:
+                    url = "https://api.modrinth.com/v2/search"
+                    params = {
+                        'facets': '[["project_type:modpack"]]',
+                        'limit': 20,
+                        'query': self.query or ""
+                    }
+                    data = MODRINTH.get_json(url, params)
+                    hits = data.get("hits", [])
+                results = []
+                for h in hits:
+                    results.append({
+                        "id": h.get("project_id"),
+                        "title": h.get("title"),
+                        "desc": h.get("description"),
+                        "author": h.get("author"),
+                        "icon_url": h.get("icon_url"),
+                        "downloads": h.get("downloads"),
+                        "versions": h.get("versions", []) # Note: search doesn't return full version list usually
+                    })
+                self.data_ready.emit(results)
+                
+            elif self.mode == "modpack_versions":
+                # query is project_id
+                url = f"https://api.modrinth.com/v2/project/{self.query}/version"
+                data = MODRINTH.get_json(url)
+                self.data_ready.emit(data)
+
+        except Exception as e:
+            self.error.emit(str(e))
+
+# ================= NEW INSTANCE WIZARD PAGE =================
+
+
+# ================= AUTH WORKER =================
+class AuthWorker(QThread):
+    status = pyqtSignal(str)
+    success = pyqtSignal(dict)
+    failure = pyqtSignal(str)
+
+    def __init__(self, auth_code):
+        super().__init__()
+        self.code = auth_code
+
+    def run(self):
+        try:
+            self.status.emit("Exchanging code for Microsoft token…")
+            token = self.get_token()
+            if not token:
+                raise Exception("Microsoft authentication failed")
+
+            self.status.emit("Authenticating with Xbox Live…")
+            xbl = self.auth_xbl(token)
+            if not xbl:
+                raise Exception("Xbox Live authentication failed")
+
+            self.status.emit("Authenticating with XSTS…")
+            xsts = self.auth_xsts(xbl)
+            if not xsts:
+                raise Exception("XSTS authentication failed")
+
+            self.status.emit("Getting Minecraft access token…")
+            mc = self.get_mc_token(xsts)
+            if not mc:
+                raise Exception("Minecraft token failed")
+
+            profile = self.get_profile(mc)
+            if not profile:
+                raise Exception("Failed to fetch Minecraft profile")
+
+            self.success.emit({
+                "username": profile["name"],
+                "uuid": profile["id"],
+                "access_token": mc
+            })
+
+        except Exception as e:
+            self.failure.emit(str(e))
+
+    # ---- API helpers ----
+    def get_token(self):
+        r = HTTP.post(
+            "https://login.live.com/oauth20_token.srf",
+            kind="auth",
+            data={
+                "client_id": "00000000402b5328",
+                "code": self.code,
+                "grant_type": "authorization_code",
+                "redirect_uri": "https://login.live.com/oauth20_desktop.srf",
+                "scope": "service::user.auth.xboxlive.com::MBI_SSL",
+            },
+        )
+        return r.json().get("access_token") if r.ok else None
+
+    def auth_xbl(self, token):
+        r = HTTP.post(
+            "https://user.auth.xboxlive.com/user/authenticate",
+            kind="auth",
+            json={
+                "Properties": {
+                    "AuthMethod": "RPS",
+                    "SiteName": "user.auth.xboxlive.com",
+                    "RpsTicket": token,
+                },
+                "RelyingParty": "http://auth.xboxlive.com",
+                "TokenType": "JWT",
+            },
+        )
+        j = r.json()
+        if r.ok:
+            return {
+                "token": j["Token"],
+                "uhs": j["DisplayClaims"]["xui"][0]["uhs"],
+            }
+
+    def auth_xsts(self, xbl):
+        r = HTTP.post(
+            "https://xsts.auth.xboxlive.com/xsts/authorize",
+            kind="auth",
+            json={
+                "Properties": {
+                    "SandboxId": "RETAIL",
+                    "UserTokens": [xbl["token"]],
+                },
+                "RelyingParty": "rp://api.minecraftservices.com/",
+                "TokenType": "JWT",
+            },
+        )
+        j = r.json()
+        if r.ok:
+            return {
+                "token": j["Token"],
+                "uhs": j["DisplayClaims"]["xui"][0]["uhs"],
+            }
+
+    def get_mc_token(self, xsts):
+        r = HTTP.post(
+            "https://api.minecraftservices.com/authentication/login_with_xbox",
+            kind="auth",
+            json={"identityToken": f"XBL3.0 x={xsts['uhs']};{xsts['token']}"},
+        )
+        return r.json().get("access_token") if r.ok else None
+
+    def get_profile(self, token):
+        r = HTTP.get(
+            "https://api.minecraftservices.com/minecraft/profile",
+            kind="auth",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        return r.json() if r.ok else None
+
+
+class AppUpdateChecker(QObject):
+    """
+    Checks a URL for a JSON file containing {"version": "2.0.1", "url": "..."}
+    """
+    finished = pyqtSignal(bool, str, str)  # has_update, new_version, download_url
+
+    def __init__(self, current_version, update_url):
+        super().__init__()
+        self.current_version = current_version
+        self.update_url = update_url
+
+    def run(self):
+        try:
+            print(f"[UPDATE] Checking for updates from {self.update_url}...")
+            # 1. Fetch the JSON
+            r = HTTP.get(self.update_url, timeout=5)
+            if r.status_code != 200:
+                print(f"[UPDATE] Failed with status {r.status_code}")
+                self.finished.emit(False, "", "")
+                return
+
+            data = r.json()
+            remote_ver = data.get("version", "0.0.0")
+            download_url = data.get("url", "")
+
+            # 2. Compare Versions (Simple Semantic Versioning)
+            if self._is_newer(remote_ver):
+                self.finished.emit(True, remote_ver, download_url)
+            else:
+                self.finished.emit(False, remote_ver, "")
+
+        except Exception as e:
+            print(f"[UPDATE] Error checking for updates: {e}")
+            self.finished.emit(False, "", "")
+
+    def _is_newer(self, remote_ver):
+        """Returns True if remote_ver > self.current_version"""
+        try:
+            # Remove 'v' prefix and suffixes like '-beta' for comparison
+            # This turns "v2.0.1-beta" into [2, 0, 1]
+            def parse(v):
+                clean = v.lower().lstrip("v").split("-")[0] 
+                return [int(x) for x in clean.split(".")]
+
+            local_parts = parse(self.current_version)
+            remote_parts = parse(remote_ver)
+            
+            return remote_parts > local_parts
+        except Exception:
+            return False
+
+
+class CatalogRefresher(QObject):
+    """Re-downloads the offline Modrinth catalog (see ModrinthCatalog.refresh)."""
+    finished = pyqtSignal(int)  # projects stored
+    error = pyqtSignal(str)
+
+    def run(self):
+        try:
+            count = CATALOG.refresh()
+            self.finished.emit(count or 0)
+        except Exception as e:
+            self.error.emit(str(e))
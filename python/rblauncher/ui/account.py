@@ -0,0 +1,291 @@
+import webbrowser
+from urllib.parse import parse_qs, urlparse
+
+from PyQt5.QtWidgets import (
+    QDialog, QFrame, QLabel, QLineEdit, QMessageBox, QPushButton, QStackedLayout, QVBoxLayout
+)
+from PyQt5.QtGui import QPainter, QPixmap
+from PyQt5.QtCore import QTimer, Qt, pyqtSignal
+from PyQt5.QtSvg import QSvgRenderer
+
+from ..network import AuthWorker
+
+
+# ================= ACCOUNT WINDOW =================
+# ================= ACCOUNT WINDOW (FIXED) =================
+class AccountWindow(QDialog):
+    account_updated = pyqtSignal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Sign in")
+        self.setFixedSize(500, 480)
+        self.setObjectName("AccountWindow")
+
+        # Main layout for the dialog background
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(24, 24, 24, 24)
+
+        # The central card frame
+        self.card = QFrame()
+        self.card.setObjectName("AuthCard")
+        # 🔥 CRITICAL FIX: Forces the frame to paint its background-color
+        self.card.setAttribute(Qt.WA_StyledBackground, True) 
+        main_layout.addWidget(self.card)
+
+        # Stack layout lives inside the card
+        self.stack = QStackedLayout(self.card)
+        self.page_intro = self._build_intro()
+        self.page_url = self._build_url()
+
+        self.stack.addWidget(self.page_intro)
+        self.stack.addWidget(self.page_url)
+        self.stack.setCurrentWidget(self.page_intro)
+
+        self.apply_styles()
+
+    # ---------- PAGE 1 ----------
+    def _build_intro(self):
+        page_container = QFrame()
+        lay = QVBoxLayout(page_container)
+        lay.setContentsMargins(40, 50, 40, 50)
+        lay.setSpacing(0)
+
+        # 1. Wrapper for the white square (Alignment wrapper)
+        logo_wrapper = QVBoxLayout()
+        logo_wrapper.setAlignment(Qt.AlignCenter)
+
+        # 2. The white tile itself
+        self.logo_tile = QFrame()
+        self.logo_tile.setObjectName("LogoTile")
+        self.logo_tile.setFixedSize(84, 84) 
+        # 🔥 CRITICAL FIX: Forces the white tile to paint
+        self.logo_tile.setAttribute(Qt.WA_StyledBackground, True)
+
+        # 3. Layout inside the tile to center the actual icon
+        tile_layout = QVBoxLayout(self.logo_tile)
+        tile_layout.setContentsMargins(0, 0, 0, 0)
+        tile_layout.setAlignment(Qt.AlignCenter)
+
+        # 4. The Icon
+        logo_img = QLabel()
+        logo_img.setPixmap(self._load_ms_logo(42))
+        logo_img.setAlignment(Qt.AlignCenter)
+        
+        tile_layout.addWidget(logo_img)
+        logo_wrapper.addWidget(self.logo_tile)
+
+        # --- Text ---
+        title = QLabel("Sign in with Microsoft")
+        title.setObjectName("AuthTitle")
+        title.setAlignment(Qt.AlignCenter)
+
+        subtitle = QLabel("Use your Microsoft account to access Minecraft")
+        subtitle.setObjectName("AuthSubtitle")
+        subtitle.setAlignment(Qt.AlignCenter)
+        subtitle.setWordWrap(True)
+
+        # --- Button ---
+        self.btn_ms = QPushButton("Continue with Microsoft")
+        self.btn_ms.setObjectName("LaunchButton")
+        self.btn_ms.setMinimumHeight(64)
+        self.btn_ms.setCursor(Qt.PointingHandCursor)
+        self.btn_ms.clicked.connect(self._start_ms_flow)
+
+        # --- Assembly ---
+        lay.addStretch(1)
+        lay.addLayout(logo_wrapper)
+        lay.addSpacing(28) 
+        lay.addWidget(title)
+        lay.addSpacing(10)
+        lay.addWidget(subtitle)
+        lay.addSpacing(45)
+        lay.addWidget(self.btn_ms)
+        lay.addStretch(1)
+
+        return page_container
+
+    # ---------- PAGE 2 ----------
+    def _build_url(self):
+        page_container = QFrame()
+        lay = QVBoxLayout(page_container)
+        lay.setContentsMargins(40, 40, 40, 40)
+        lay.setSpacing(16)
+
+        warning = QLabel(
+            "You will be redirected to a Microsoft page.\n\n"
+            "AFTER SIGNING IN COPY THE ENTIRE URL\n"
+            "from your browser and paste it below.\n\n"
+            "DO THIS QUICKLY before the code disappears for \"safety\"."
+        )
+        warning.setObjectName("AuthWarning")
+        warning.setAlignment(Qt.AlignCenter)
+        warning.setWordWrap(True)
+
+        self.url_input = QLineEdit()
+        self.url_input.setObjectName("AuthInput")
+        self.url_input.setPlaceholderText("Paste redirected URL here…")
+        self.url_input.setMinimumHeight(44)
+
+        self.status = QLabel("")
+        self.status.setObjectName("AuthStatus")
+        self.status.setAlignment(Qt.AlignCenter)
+
+        submit = QPushButton("Submit URL")
+        submit.setObjectName("PrimaryButton")
+        submit.setMinimumHeight(50)
+        submit.setCursor(Qt.PointingHandCursor)
+        submit.clicked.connect(self._submit_url)
+
+        lay.addStretch()
+        lay.addWidget(warning)
+        lay.addSpacing(10)
+        lay.addWidget(self.url_input)
+        lay.addWidget(self.status)
+        lay.addSpacing(10)
+        lay.addWidget(submit)
+        lay.addStretch()
+
+        return page_container
+
+    # ---------- FLOW ----------
+    def _start_ms_flow(self):
+        self.stack.setCurrentWidget(self.page_url)
+
+        def open_browser():
+            url = (
+                "https://login.live.com/oauth20_authorize.srf"
+                "?client_id=00000000402b5328"
+                "&response_type=code"
+                "&scope=service::user.auth.xboxlive.com::MBI_SSL"
+                "&redirect_uri=https://login.live.com/oauth20_desktop.srf"
+            )
+            webbrowser.open(url)
+
+        QTimer.singleShot(5000, open_browser)
+
+    def _submit_url(self):
+        raw = self.url_input.text().strip()
+        parsed = urlparse(raw)
+
+        if parsed.hostname != "login.live.com":
+            QMessageBox.critical(self, "Invalid URL", "That is not a Microsoft redirect URL.")
+            return
+
+        code = parse_qs(parsed.query).get("code", [None])[0]
+        if not code:
+            QMessageBox.critical(self, "Invalid URL", "Authorization code not found.")
+            return
+
+        self.status.setText("Authenticating…")
+        self.url_input.setEnabled(False)
+        self.worker = AuthWorker(code)
+        self.worker.status.connect(self.status.setText)
+        self.worker.success.connect(self._on_success)
+        self.worker.failure.connect(self._on_failure)
+        self.worker.start()
+
+    def _on_success(self, data):
+        self.account_updated.emit(data)
+        self.accept()
+
+    def _on_failure(self, msg):
+        QMessageBox.critical(self, "Login Failed", msg)
+        self.status.setText("")
+        self.url_input.setEnabled(True)
+        self.url_input.clear()
+
+    # ---------- ICON ----------
+    def _load_ms_logo(self, size: int) -> QPixmap:
+        svg = """<svg viewBox="0 0 24 24" fill="none"
+        xmlns="http://www.w3.org/2000/svg">
+        <path d="M0 0h11.4v11.4H0z" fill="#F25022"/>
+        <path d="M12.6 0H24v11.4H12.6z" fill="#7FBA00"/>
+        <path d="M0 12.6h11.4V24H0z" fill="#00A4EF"/>
+        <path d="M12.6 12.6H24V24H12.6z" fill="#FFB900"/>
+        </svg>"""
+        renderer = QSvgRenderer(bytearray(svg, "utf-8"))
+        pm = QPixmap(size, size)
+        pm.fill(Qt.transparent)
+        p = QPainter(pm)
+        renderer.render(p)
+        p.end()
+        return pm
+
+    # ---------- STYLES ----------
+    def apply_styles(self):
+        # We use explicit ID selectors to ensure they apply even if parent styles conflict
+        self.setStyleSheet("""
+        /* Window Background */
+        QDialog#AccountWindow {
+            background: #18181b; 
+        }
+
+        /* The Card - Dark Grey */
+        QFrame#AuthCard {
+            background-color: #27272a;
+            border: 1px solid #3f3f46;
+            border-radius: 24px;
+        }
+
+        /* The White Square - GUARANTEED WHITE BACKGROUND */
+        QFrame#LogoTile {
+            background-color: #ffffff;
+            border-radius: 20px;
+        }
+
+        /* Title - Large and Bold */
+        QLabel#AuthTitle {
+            color: #ffffff;
+            font-family: "Segoe UI", sans-serif;
+            font-size: 26px;
+            font-weight: 800;
+        }
+
+        /* Subtitle - Small and Gray */
+        QLabel#AuthSubtitle {
+            color: #a1a1aa;
+            font-family: "Segoe UI", sans-serif;
+            font-size: 14px;
+            font-weight: 300;
+            padding: 0 10px;
+        }
+
+        /* Button: Green */
+        QPushButton#LaunchButton {
+            background-color: #10b981;
+            color: white;
+            border: none;
+            border-radius: 14px;
+            font-size: 17px;
+            font-weight: 700;
+        }
+        QPushButton#LaunchButton:hover {
+            background-color: #059669;
+        }
+
+        /* Inputs */
+        QLineEdit#AuthInput {
+            background: #18181b;
+            border: 1px solid #3f3f46;
+            color: white;
+            padding: 0 12px;
+            border-radius: 8px;
+        }
+        
+        /* Secondary Buttons inside Auth Window */
+        QPushButton#PrimaryButton {
+            background-color: #27272a;
+            border: 1px solid #52525b;
+            color: white;
+            border-radius: 12px;
+            font-size: 15px;
+            font-weight: 700;
+        }
+        QPushButton#PrimaryButton:hover {
+            background-color: #3f3f46;
+        }
+        
+        QLabel#AuthWarning { color: #facc15; font-weight: 700; }
+        QLabel#AuthStatus { color: #34d399; font-weight: 600; }
+        """)
@@ -0,0 +1,177 @@
+import os
+import time
+
+from PyQt5.QtWidgets import (
+    QCheckBox, QDialog, QFileDialog, QHBoxLayout, QLabel, QLineEdit, QPushButton, QTextEdit,
+    QVBoxLayout
+)
+from PyQt5.QtGui import QCursor
+from PyQt5.QtCore import Qt, pyqtSignal
+
+from http_client import HTTP
+from startup_timeline import STARTUP
+
+from ..core import CATALOG
+
+
+class LogWindow(QDialog):
+    """Simple window to view game logs"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Game Output")
+        self.resize(800, 600)
+        self.setStyleSheet("background: #18181b;")
+        
+        layout = QVBoxLayout(self)
+        self.text_edit = QTextEdit()
+        self.text_edit.setReadOnly(True)
+        self.text_edit.setStyleSheet("""
+            QTextEdit {
+                background-color: #09090b;
+                color: #d4d4d8;
+                font-family: Consolas, "Courier New", monospace;
+                font-size: 12px;
+                border: 1px solid #27272a;
+                border-radius: 8px;
+                padding: 8px;
+            }
+        """)
+        layout.addWidget(self.text_edit)
+
+    def append_log(self, text):
+        self.text_edit.append(text)
+        # Auto-scroll
+        cursor = self.text_edit.textCursor()
+        cursor.movePosition(QCursor.End)
+        self.text_edit.setTextCursor(cursor)
+
+
+class StartupTimelineDialog(QDialog):
+    """Debug view: where the last launch spent its time, plus HTTP totals so far."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Startup Timeline")
+        self.resize(520, 420)
+        self.setStyleSheet("""
+            QDialog { background-color: #18181b; color: #e4e4e7; }
+            QLabel { color: #a1a1aa; font-size: 13px; }
+            QTextEdit { background-color: #27272a; color: #e4e4e7; border: 1px solid #3f3f46;
+                        border-radius: 8px; font-family: Menlo, monospace; font-size: 12px; }
+        """)
+        lay = QVBoxLayout(self)
+
+        first = STARTUP.at("first frame")
+        ready = STARTUP.at("interactive")
+        fmt = lambda ms: f"{ms:.0f} ms" if ms is not None else "—"
+        lay.addWidget(QLabel(f"Time to first frame: {fmt(first)}    Time to interactive: {fmt(ready)}"))
+
+        view = QTextEdit()
+        view.setReadOnly(True)
+        view.setPlainText(STARTUP.summary() + "\n\n[HTTP]\n" + (HTTP.summary() or "no requests yet"))
+        lay.addWidget(view, 1)
+
+
+class SettingsWindow(QDialog):
+    settings_saved = pyqtSignal(str, bool) # Emits the new java path, offline catalog on/off
+
+    def __init__(self, current_java_path, offline_catalog=False, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Launcher Settings")
+        self.setFixedSize(600, 340)
+        self.setObjectName("SettingsWindow")
+        
+        # Default fallback if empty
+        self.default_macos_path = "/Library/Java/JavaVirtualMachines/jdk-21.jdk/Contents/Home/bin/java"
+        
+        self.current_path = current_java_path if current_java_path else self.default_macos_path
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(30, 30, 30, 30)
+        layout.setSpacing(20)
+
+        # Title
+        title = QLabel("Java Runtime Environment")
+        title.setStyleSheet("color: white; font-size: 18px; font-weight: bold;")
+        layout.addWidget(title)
+
+        # Description
+        desc = QLabel("Select the Java executable (java) to use for launching Minecraft.")
+        desc.setStyleSheet("color: #a1a1aa; font-size: 13px;")
+        desc.setWordWrap(True)
+        layout.addWidget(desc)
+
+        # Input Row
+        row = QHBoxLayout()
+        self.path_input = QLineEdit()
+        self.path_input.setText(self.current_path)
+        self.path_input.setPlaceholderText("Path to java executable...")
+        self.path_input.setStyleSheet("""
+            QLineEdit {
+                background: #27272a; border: 1px solid #3f3f46; 
+                border-radius: 8px; color: white; padding: 10px;
+            }
+            QLineEdit:focus { border: 1px solid #10b981; }
+        """)
+        
+        btn_browse = QPushButton("Browse")
+        btn_browse.setCursor(Qt.PointingHandCursor)
+        btn_browse.setFixedSize(80, 40)
+        btn_browse.clicked.connect(self.browse_file)
+        btn_browse.setStyleSheet("""
+            QPushButton {
+                background: #3f3f46; color: white; border-radius: 8px; font-weight: bold;
+            }
+            QPushButton:hover { background: #52525b; }
+        """)
+
+        row.addWidget(self.path_input)
+        row.addWidget(btn_browse)
+        layout.addLayout(row)
+
+        # Offline catalog
+        self.chk_catalog = QCheckBox("Search an offline Modrinth catalog")
+        self.chk_catalog.setChecked(offline_catalog)
+        self.chk_catalog.setStyleSheet("color: white; font-size: 13px;")
+        layout.addWidget(self.chk_catalog)
+
+        refreshed = CATALOG.refreshed_at()
+        catalog_desc = QLabel(
+            "Browse and modpack search run against a local snapshot that refreshes daily. "
+            + (f"Last refreshed {time.strftime('%Y-%m-%d %H:%M', time.localtime(refreshed))}."
+               if refreshed else "Not downloaded yet.")
+        )
+        catalog_desc.setStyleSheet("color: #a1a1aa; font-size: 12px;")
+        catalog_desc.setWordWrap(True)
+        layout.addWidget(catalog_desc)
+
+        layout.addStretch()
+
+        # Save Button
+        btn_save = QPushButton("Save Settings")
+        btn_save.setCursor(Qt.PointingHandCursor)
+        btn_save.setFixedHeight(45)
+        btn_save.clicked.connect(self.save_and_close)
+        btn_save.setStyleSheet("""
+            QPushButton {
+                background: #059669; color: white; border-radius: 8px; font-weight: bold; font-size: 14px;
+            }
+            QPushButton:hover { background: #10b981; }
+        """)
+        layout.addWidget(btn_save)
+
+        self.apply_styles()
+
+    def browse_file(self):
+        # On Mac, we usually look for the 'java' binary inside Home/bin
+        start_dir = "/Library/Java/JavaVirtualMachines" if os.path.exists("/Library/Java/JavaVirtualMachines") else ""
+        path, _ = QFileDialog.getOpenFileName(self, "Select Java Executable", start_dir)
+        if path:
+            self.path_input.setText(path)
+
+    def save_and_close(self):
+        new_path = self.path_input.text().strip()
+        self.settings_saved.emit(new_path, self.chk_catalog.isChecked())
+        self.accept()
+
+    def apply_styles(self):
+        self.setStyleSheet("QDialog#SettingsWindow { background: #18181b; }")
@@ -0,0 +1,2413 @@
+import sys
+import os
+import shutil
+import subprocess
+import time
+import sqlite3
+from collections import OrderedDict
+
+from PyQt5.QtWidgets import (
+    QAbstractItemView, QDialog, QFrame, QGridLayout, QHBoxLayout, QInputDialog, QLabel,
+    QLineEdit, QListView, QListWidget, QListWidgetItem, QMenu, QMessageBox, QProgressDialog,
+    QPushButton, QScrollArea, QSizePolicy, QStackedWidget, QStyledItemDelegate, QToolTip,
+    QVBoxLayout, QWidget
+)
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QPainter, QPainterPath, QPixmap
+from PyQt5.QtCore import (
+    QEvent, QFileSystemWatcher, QPoint, QRect, QRectF, QSize, QThread, QTimer, Qt, pyqtSignal
+)
+
+from http_client import HTTP
+from mod_index import mod_data_from_meta
+from mod_resolver import commit_install, discard_plan
+from mod_search import ModSearchIndex, mod_search_fields
+from mod_sets import capture_set, check_set, plan_set, rename_all
+from mod_update import UpdateTransaction, recover_interrupted_update
+
+from ..core import GAME_DIR, PROJECT_DIR, ICONS_DIR, THUMBNAILS, IMAGES, INSTANCE_DB, SVG_ICONS
+from ..mods import (
+    InstalledModsFilter, InstalledModsModel, ModIdentifier, ModIndexLoader, ModInstallPlanner, ModUpdateFinder,
+    ModUpdateStager, ModrinthInstaller, ModrinthSearchWorker,
+    ModrinthVersionFetcher, ProjectHydrator
+)
+
+
+class ModGridCard(QFrame):
+    clicked = pyqtSignal(dict) # emits full mod data
+
+    def __init__(self, mod_data, parent=None):
+        super().__init__(parent)
+        self.mod_data = mod_data
+        self.setCursor(Qt.PointingHandCursor)
+        
+        # 🔥 CHANGED: Full width, shorter fixed height (like ModRow)
+        self.setFixedHeight(110) 
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.setObjectName("ModGridCard")
+        
+        # Style (Card look)
+        self.setStyleSheet("""
+            QFrame#ModGridCard {
+                background: #27272a; border: 1px solid #3f3f46; border-radius: 12px;
+            }
+            QFrame#ModGridCard:hover {
+                background: #3f3f46; border: 1px solid #52525b;
+            }
+            QLabel { background: transparent; border: none; }
+        """)
+
+        # 🔥 CHANGED: Horizontal Layout for the row look
+        main_layout = QHBoxLayout(self)
+        main_layout.setContentsMargins(12, 12, 12, 12)
+        main_layout.setSpacing(16)
+
+        # 1. Icon (Left)
+        self.icon_lbl = QLabel()
+        self.icon_lbl.setFixedSize(64, 64)
+        self.icon_lbl.setAlignment(Qt.AlignCenter)
+        self.icon_lbl.setStyleSheet("background: #18181b; border-radius: 8px;")
+        
+        icon_url = mod_data.get("icon_url")
+        if icon_url:
+            self._load_icon(icon_url)
+        else:
+            self.icon_lbl.setText("?")
+            self.icon_lbl.setStyleSheet("background: #18181b; border-radius: 8px; color: #71717a; font-weight: bold; font-size: 24px;")
+
+        main_layout.addWidget(self.icon_lbl)
+
+        # 2. Details Column (Middle)
+        details_col = QVBoxLayout()
+        details_col.setSpacing(4)
+        details_col.setContentsMargins(0, 4, 0, 4)
+
+        # Title
+        title = mod_data.get("title", "Unknown")
+        lbl_title = QLabel(title)
+        lbl_title.setStyleSheet("color: white; font-weight: bold; font-size: 15px;")
+        details_col.addWidget(lbl_title)
+
+        # Author
+        author = mod_data.get("author", "Unknown")
+        lbl_auth = QLabel(f"by {author}")
+        lbl_auth.setStyleSheet("color: #a1a1aa; font-size: 12px;")
+        details_col.addWidget(lbl_auth)
+
+        # Description (Truncated)
+        desc_text = mod_data.get("description", "")
+        # Strip newlines for cleaner row view
+        desc_text = desc_text.replace("\n", " ")
+        if len(desc_text) > 90: 
+            desc_text = desc_text[:90] + "..."
+            
+        lbl_desc = QLabel(desc_text)
+        lbl_desc.setWordWrap(True)
+        lbl_desc.setStyleSheet("color: #71717a; font-size: 12px;")
+        lbl_desc.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        
+        details_col.addWidget(lbl_desc)
+        details_col.addStretch()
+        
+        main_layout.addLayout(details_col, 1) # 1 = stretch factor
+
+        # 3. Stats Column (Right)
+        stats_col = QVBoxLayout()
+        stats_col.setContentsMargins(0, 4, 0, 4)
+        stats_col.setSpacing(4)
+        stats_col.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+
+        # Downloads
+        dls = self._format_number(mod_data.get("downloads", 0))
+        lbl_dls = QLabel(f"⬇ {dls}")
+        lbl_dls.setStyleSheet("color: #34d399; font-size: 12px; font-weight: bold;")
+        lbl_dls.setAlignment(Qt.AlignRight)
+        
+        # Updated Date
+        date_str = mod_data.get("date_modified", "")[:10]
+        lbl_date = QLabel(date_str)
+        lbl_date.setStyleSheet("color: #52525b; font-size: 11px;")
+        lbl_date.setAlignment(Qt.AlignRight)
+        
+        stats_col.addWidget(lbl_dls)
+        stats_col.addWidget(lbl_date)
+        
+        main_layout.addLayout(stats_col)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.clicked.emit(self.mod_data)
+        super().mousePressEvent(event)
+
+    def _format_number(self, num):
+        if num >= 1_000_000: return f"{num/1_000_000:.1f}M"
+        if num >= 1_000: return f"{num/1_000:.1f}K"
+        return str(num)
+
+    def _load_icon(self, url):
+        IMAGES.set_label(self.icon_lbl, url, 64, 8)
+
+
+class VersionSelectDialog(QDialog):
+    """
+    Dialog to let the user choose a specific version to install.
+    """
+    def __init__(self, current_version, versions_list, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Select Version")
+        self.setFixedSize(700, 600) # Increased width to fit extra text
+        self.selected_file = None
+        self.selected_version_number = None
+        self.selected_version = None
+        
+        # Styles
+        self.setStyleSheet("""
+            QDialog { background: #18181b; }
+            QLabel { color: white; }
+            QListWidget { 
+                background: #27272a; border: 1px solid #3f3f46; border-radius: 8px; 
+                outline: none;
+            }
+            QListWidget::item { 
+                padding: 12px; border-bottom: 1px solid #3f3f46; color: #d4d4d8;
+            }
+            QListWidget::item:selected { 
+                background: #059669; color: white; border: 1px solid #10b981; border-radius: 4px;
+            }
+            QPushButton#PrimaryButton {
+                background: #059669; color: white; border: none; border-radius: 8px; padding: 10px; font-weight: bold;
+            }
+            QPushButton#PrimaryButton:hover { background: #10b981; }
+            QPushButton#SecondaryButton {
+                background: #3f3f46; color: white; border: none; border-radius: 8px; padding: 10px;
+            }
+            QPushButton#SecondaryButton:hover { background: #52525b; }
+        """)
+
+        layout = QVBoxLayout(self)
+        layout.setSpacing(12)
+
+        # Header
+        lbl = QLabel(f"Current Version: {current_version}")
+        lbl.setStyleSheet("color: #a1a1aa; font-weight: bold;")
+        layout.addWidget(lbl)
+
+        # List
+        self.list_widget = QListWidget()
+        self.populate_list(versions_list, current_version)
+        layout.addWidget(self.list_widget)
+
+        # Buttons
+        btn_box = QHBoxLayout()
+        btn_cancel = QPushButton("Cancel")
+        btn_cancel.setObjectName("SecondaryButton")
+        btn_cancel.clicked.connect(self.reject)
+        
+        self.btn_install = QPushButton("Install Selected")
+        self.btn_install.setObjectName("PrimaryButton")
+        self.btn_install.clicked.connect(self.confirm_selection)
+        self.btn_install.setEnabled(False) # Disabled until selection
+
+        btn_box.addWidget(btn_cancel)
+        btn_box.addWidget(self.btn_install)
+        layout.addLayout(btn_box)
+        
+        self.list_widget.itemClicked.connect(lambda: self.btn_install.setEnabled(True))
+
+    def populate_list(self, versions, current_ver):
+        
+        for v in versions:
+            v_num = v.get("version_number", "Unknown")
+            v_type = v.get("version_type", "release").capitalize()
+            date_str = v.get("date_published", "")[:10] # YYYY-MM-DD
+            
+            # --- GAME VERSIONS ---
+            game_versions = v.get("game_versions", [])
+            gv_str = ", ".join(game_versions[:2]) 
+            if len(game_versions) > 2:
+                gv_str += "..."
+            if not gv_str: gv_str = "Any"
+
+            # --- LOADERS ---
+            loaders = v.get("loaders", [])
+            # Capitalize each loader (fabric -> Fabric)
+            loaders = [l.capitalize() for l in loaders]
+            loaders_str = ", ".join(loaders)
+            if not loaders_str: loaders_str = "All"
+
+            # Find primary file
+            files = v.get("files", [])
+            primary_file = next((f for f in files if f.get("primary")), files[0] if files else None)
+            
+            if not primary_file: continue
+
+            # Format: Version • Type • Loaders • Game Version • Date
+            item_text = f"{v_num}  •  {v_type}  •  {loaders_str}  •  {gv_str}  •  {date_str}"
+            
+            if v_num == current_ver:
+                item_text += "  (Current)"
+            
+            item = QListWidgetItem(item_text)
+            item.setData(Qt.UserRole, primary_file) 
+            item.setData(Qt.UserRole + 1, v_num)
+            item.setData(Qt.UserRole + 2, v)
+            
+            self.list_widget.addItem(item)
+
+    def confirm_selection(self):
+        item = self.list_widget.currentItem()
+        if item:
+            self.selected_file = item.data(Qt.UserRole)
+            self.selected_version_number = item.data(Qt.UserRole + 1)
+            self.selected_version = item.data(Qt.UserRole + 2)
+            self.accept()
+
+
+class ModRowDelegate(QStyledItemDelegate):
+    """
+    Paints an installed mod as a card (toggle, icon, title, author/version,
+    update + delete buttons). Nothing is a real widget, so a view with
+    uniform row heights only ever paints the rows on screen.
+    Clicks are routed back to the ManageModsPage.
+    """
+    ROW_HEIGHT = 80
+    SPACING = 12
+    ICON_SIZE = 48
+    BTN_SIZE = 36
+    COLORS = ["#7c3aed", "#db2777", "#ea580c", "#059669", "#2563eb"]
+
+    def __init__(self, page):
+        super().__init__(page)
+        self.page = page
+        self._hover = None  # (row, part)
+        self._btn_update = SVG_ICONS.icon(os.path.join(ICONS_DIR, "checkupdate.svg"), size=20)
+        self._btn_delete = SVG_ICONS.icon(os.path.join(ICONS_DIR, "delete.svg"), size=20, color="#ef4444")
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT + self.SPACING)
+
+    # ---- geometry ----
+
+    def _rects(self, rect):
+        card = QRect(rect.x(), rect.y(), rect.width(), self.ROW_HEIGHT)
+        cy = card.center().y()
+        toggle = QRect(card.x() + 12, cy - 14, 50, 28)
+        icon = QRect(toggle.right() + 1 + 8 + 16 + 8, cy - self.ICON_SIZE // 2, self.ICON_SIZE, self.ICON_SIZE)
+        delete = QRect(card.right() - 12 - self.BTN_SIZE + 1, cy - self.BTN_SIZE // 2, self.BTN_SIZE, self.BTN_SIZE)
+        update = QRect(delete.x() - 8 - self.BTN_SIZE, delete.y(), self.BTN_SIZE, self.BTN_SIZE)
+        text = QRect(icon.right() + 1 + 8, card.y() + 10, update.x() - 8 - (icon.right() + 1 + 8), card.height() - 20)
+        return {"card": card, "toggle": toggle, "icon": icon, "update": update, "delete": delete, "text": text}
+
+    def _hit(self, rect, pos):
+        rects = self._rects(rect)
+        for part in ("toggle", "update", "delete"):
+            if rects[part].contains(pos):
+                return part
+        return None
+
+    # ---- painting ----
+
+    def paint(self, painter, option, index):
+        mod = index.data(InstalledModsModel.ModRole) or {}
+        r = self._rects(option.rect)
+        enabled = mod.get("enabled", True)
+        hover_part = self._hover[1] if self._hover and self._hover[0] == index.row() else None
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # card
+        painter.setPen(QColor("#3f3f46"))
+        painter.setBrush(QColor("#27272a"))
+        painter.drawRoundedRect(QRectF(r["card"]).adjusted(0.5, 0.5, -0.5, -0.5), 12, 12)
+
+        # toggle
+        t = r["toggle"]
+        track = QRectF(t.x(), t.y() + 2, 46, 24)
+        if enabled:
+            track_color = "#059669"
+        else:
+            track_color = "#52525b" if hover_part == "toggle" else "#3f3f46"
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(track_color))
+        painter.drawRoundedRect(track, 12, 12)
+        painter.setBrush(Qt.white)
+        painter.drawEllipse(QRectF(t.x() + (24 if enabled else 2), t.y() + 4, 20, 20))
+
+        # icon
+        icon_rect = r["icon"]
+        icon_path = mod.get("icon_path")
+        pix = None
+        if icon_path:
+            # memory only; a miss is loaded off the GUI thread and repaints the row when ready
+            pix = THUMBNAILS.load(icon_path, self.ICON_SIZE, 8, painter.device().devicePixelRatioF(),
+                                  lambda _pix, mod=mod: self.page.mods_model.mod_changed(mod))
+        if pix is not None and not pix.isNull():
+            painter.drawPixmap(icon_rect.topLeft(), pix)
+        else:
+            nameish = (mod.get("title") or mod.get("name") or "?")
+            painter.setBrush(QColor(self.COLORS[len(nameish) % len(self.COLORS)]))
+            painter.drawRoundedRect(QRectF(icon_rect), 8, 8)
+            f = QFont(option.font)
+            f.setPixelSize(20)
+            f.setBold(True)
+            painter.setFont(f)
+            painter.setPen(Qt.white)
+            painter.drawText(icon_rect, Qt.AlignCenter, nameish[:1].upper())
+
+        # text
+        text_rect = r["text"]
+        title = mod.get("title") or mod.get("name", "Unknown Mod")
+        tf = QFont(option.font)
+        tf.setPixelSize(14)
+        tf.setBold(True)
+        tf.setStrikeOut(not enabled)
+        sf = QFont(option.font)
+        sf.setPixelSize(12)
+        tfm, sfm = QFontMetrics(tf), QFontMetrics(sf)
+        block = tfm.height() + 4 + sfm.height()
+        y = text_rect.y() + (text_rect.height() - block) // 2
+
+        painter.setFont(tf)
+        painter.setPen(QColor("white" if enabled else "#d4d4d8"))
+        painter.drawText(QRect(text_rect.x(), y, text_rect.width(), tfm.height()),
+                         Qt.AlignLeft | Qt.AlignVCenter,
+                         tfm.elidedText(title, Qt.ElideRight, text_rect.width()))
+
+        sub = f"by {mod.get('author', 'Unknown')}  •  v{mod.get('version', 'Unknown')}"
+        painter.setFont(sf)
+        painter.setPen(QColor("#a1a1aa"))
+        painter.drawText(QRect(text_rect.x(), y + tfm.height() + 4, text_rect.width(), sfm.height()),
+                         Qt.AlignLeft | Qt.AlignVCenter,
+                         sfm.elidedText(sub, Qt.ElideRight, text_rect.width()))
+
+        # update button
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor("#52525b" if hover_part == "update" else "#3f3f46"))
+        painter.drawRoundedRect(QRectF(r["update"]), 8, 8)
+        self._btn_update.paint(painter, r["update"].adjusted(8, 8, -8, -8))
+        if mod.get("_has_update"):
+            painter.setBrush(QColor("#10b981"))
+            painter.drawEllipse(QRectF(r["update"].right() - 9, r["update"].y() + 3, 7, 7))
+
+        # delete button
+        painter.setBrush(QColor(220, 38, 38, 77 if hover_part == "delete" else 51))
+        painter.drawRoundedRect(QRectF(r["delete"]), 8, 8)
+        self._btn_delete.paint(painter, r["delete"].adjusted(8, 8, -8, -8))
+
+        painter.restore()
+
+    # ---- interaction ----
+
+    def editorEvent(self, event, model, option, index):
+        etype = event.type()
+        if etype == QEvent.MouseMove:
+            part = self._hit(option.rect, event.pos())
+            hover = (index.row(), part) if part else None
+            if hover != self._hover:
+                self._hover = hover
+                view = self.parent_view()
+                if view:
+                    view.viewport().setCursor(Qt.PointingHandCursor if part else Qt.ArrowCursor)
+                    view.viewport().update()
+            return False
+
+        if etype == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            part = self._hit(option.rect, event.pos())
+            mod = index.data(InstalledModsModel.ModRole)
+            if not part or mod is None:
+                return False
+            # defer so the model can change without pulling rows out from under the view
+            if part == "toggle":
+                QTimer.singleShot(0, lambda: self.page.toggle_mod(mod, not mod.get("enabled", True)))
+            elif part == "update":
+                QTimer.singleShot(0, lambda: self.page.update_single_mod(mod))
+            elif part == "delete":
+                QTimer.singleShot(0, lambda: self.page.delete_mod(mod))
+            return True
+
+        return super().editorEvent(event, model, option, index)
+
+    def clear_hover(self):
+        self._hover = None
+
+    def parent_view(self):
+        return getattr(self.page, "mods_view", None)
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip:
+            part = self._hit(option.rect, event.pos())
+            tips = {"toggle": "Enable / Disable", "update": "Download New Version", "delete": "Delete Mod"}
+            if part:
+                QToolTip.showText(event.globalPos(), tips[part], view)
+                return True
+            QToolTip.hideText()
+            return True
+        return super().helpEvent(event, view, option, index)
+
+
+class InstalledModsView(QListView):
+    """List view that clears the delegate's hover state when the mouse leaves."""
+
+    def leaveEvent(self, event):
+        delegate = self.itemDelegate()
+        if isinstance(delegate, ModRowDelegate):
+            delegate.clear_hover()
+            self.viewport().setCursor(Qt.ArrowCursor)
+            self.viewport().update()
+        super().leaveEvent(event)
+
+
+# ---------------------------
+# ManageModsPage
+# ---------------------------
+
+
+class ManageModsPage(QWidget):
+    back_clicked = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("ManageModsPage")
+        self.current_instance = {}
+        self.current_instance_name = ""
+        self._active_update_refs = []  # keep threads/workers/dialogs alive
+        self._check_thread = None
+        self._check_worker = None
+        self._identify_busy = False
+        self._identify_then_check = False
+        self._identify_pending = None  # then_check of a request that came in while busy
+        self._hydrate_busy = False
+        self._hydrate_save_timer = QTimer(self)
+        self._hydrate_save_timer.setSingleShot(True)
+        self._hydrate_save_timer.setInterval(1000)
+        self._hydrate_save_timer.timeout.connect(self._save_launcher_config)
+        self.mod_index = None
+        self.mod_search = ModSearchIndex()
+
+        # Browse paging: (total hits, page hits) cached per (query, sort, mc version, offset)
+        self._browse_pages = OrderedDict()
+        self._browse_loading = set()
+        self._browse_workers = []
+        self._browse_key = None
+        self._browse_total = 0
+        self._browse_next = 0        # offset of the next page to show
+        self._browse_waiting = None  # offset the list is waiting on
+        self._browse_row = 0
+        self._browse_status = None
+
+        # Browse search-as-you-type
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(300)
+        self._search_timer.timeout.connect(self.trigger_search)
+
+        # Watches the open instance's mods/ folder. Bursts of events (a sync
+        # tool copying 40 jars) keep restarting the timer and are applied once.
+        self._mods_watcher = QFileSystemWatcher(self)
+        self._mods_watcher.directoryChanged.connect(self.on_mods_dir_changed)
+        self._mods_watcher.fileChanged.connect(self.on_mods_dir_changed)
+        self._watch_timer = QTimer(self)
+        self._watch_timer.setSingleShot(True)
+        self._watch_timer.setInterval(400)
+        self._watch_timer.timeout.connect(self.apply_mods_dir_changes)
+        self._watch_hold = 0  # > 0 while the launcher itself is writing into mods/
+
+        self.init_ui()
+        self.apply_styles()
+
+    def _launcher(self):
+        # The top-level window is LauncherV2
+        return self.window()
+
+    def _instances_using(self, mod_data):
+        """Instances (from the instance catalog) with the same project, or the same jar by hash."""
+        project_id = mod_data.get("project_id")
+        sha1 = None
+        if not project_id or str(project_id).lower() in ("unknown", "none", "null"):
+            project_id = None
+            entry = self.mod_index.entries.get((mod_data.get("filenames") or [""])[0]) if self.mod_index else None
+            sha1 = (entry or {}).get("sha1")
+            if not sha1:
+                return []
+        try:
+            return INSTANCE_DB.instances_using(project_id=project_id, sha1=sha1)
+        except sqlite3.Error as e:
+            print(f"[INSTANCEDB] Lookup failed: {e}")
+            return []
+
+    def init_ui(self):
+        main_lay = QHBoxLayout(self)
+        main_lay.setContentsMargins(0, 0, 0, 0)
+        main_lay.setSpacing(0)
+
+        # --- LEFT SIDEBAR ---
+        self.sidebar = QFrame()
+        self.sidebar.setObjectName("Sidebar")
+        self.sidebar.setFixedWidth(280)
+        side_lay = QVBoxLayout(self.sidebar)
+        side_lay.setContentsMargins(24, 24, 24, 24)
+        side_lay.setSpacing(20)
+
+        btn_back = QPushButton("← Back to Launcher")
+        btn_back.setObjectName("LinkButton")
+        btn_back.setCursor(Qt.PointingHandCursor)
+        btn_back.clicked.connect(self.go_back)
+        side_lay.addWidget(btn_back)
+
+        header_row = QHBoxLayout()
+        self.inst_icon = QLabel()
+        self.inst_icon.setFixedSize(48, 48)
+        self.inst_icon.setAlignment(Qt.AlignCenter)
+        self.inst_icon.setStyleSheet("background: #3f3f46; border-radius: 8px;")
+
+        info_col = QVBoxLayout()
+        self.inst_name = QLabel("Instance Name")
+        self.inst_name.setStyleSheet("color: white; font-weight: bold; font-size: 16px;")
+        self.inst_count = QLabel("0 mods installed")
+        self.inst_count.setStyleSheet("color: #71717a; font-size: 12px;")
+        info_col.addWidget(self.inst_name)
+        info_col.addWidget(self.inst_count)
+
+        header_row.addWidget(self.inst_icon)
+        header_row.addLayout(info_col)
+        side_lay.addLayout(header_row)
+
+        div = QFrame()
+        div.setFixedHeight(1)
+        div.setStyleSheet("background: #27272a;")
+        side_lay.addWidget(div)
+
+        self.btn_update_all = QPushButton("Update All Mods")
+        self.btn_update_all.setObjectName("UpdateAllBtn")
+        self.btn_update_all.setCursor(Qt.PointingHandCursor)
+        self.btn_update_all.setFixedHeight(40)
+        self.btn_update_all.clicked.connect(self.update_all_mods)
+        side_lay.addWidget(self.btn_update_all)
+
+        self.btn_mod_sets = QPushButton("Mod Sets")
+        self.btn_mod_sets.setObjectName("ModSetsBtn")
+        self.btn_mod_sets.setCursor(Qt.PointingHandCursor)
+        self.btn_mod_sets.setFixedHeight(40)
+        self.btn_mod_sets.clicked.connect(self.show_mod_sets_menu)
+        side_lay.addWidget(self.btn_mod_sets)
+
+        side_lay.addStretch()
+
+        # Open folder bottom row
+        bottom_row = QHBoxLayout()
+        bottom_row.setSpacing(10)
+
+        self.btn_folder = QPushButton()
+        self.btn_folder.setObjectName("IconButton")
+        self.btn_folder.setFixedSize(44, 44)
+        self.btn_folder.setCursor(Qt.PointingHandCursor)
+        self.btn_folder.setToolTip("Open Mods Folder")
+        self.btn_folder.clicked.connect(self.open_mods_folder)
+
+        lbl_folder = QLabel("Open Mods Folder")
+        lbl_folder.setStyleSheet("color: #a1a1aa; font-size: 13px; font-weight: 600;")
+
+        bottom_row.addWidget(self.btn_folder)
+        bottom_row.addWidget(lbl_folder)
+        bottom_row.addStretch()
+
+        side_lay.addLayout(bottom_row)
+
+        main_lay.addWidget(self.sidebar)
+
+        # --- RIGHT CONTENT ---
+        content = QWidget()
+        content_lay = QVBoxLayout(content)
+        content_lay.setContentsMargins(0, 0, 0, 0)
+        content_lay.setSpacing(0)
+
+        tabs_frame = QFrame()
+        tabs_frame.setObjectName("TabsHeader")
+        tabs_lay = QHBoxLayout(tabs_frame)
+        tabs_lay.setContentsMargins(32, 0, 32, 0)
+        tabs_lay.setSpacing(24)
+
+        self.btn_tab_installed = QPushButton("Installed")
+        self.btn_tab_installed.setObjectName("TabButtonActive")
+        self.btn_tab_installed.clicked.connect(lambda: self.switch_tab("installed"))
+
+        self.btn_tab_browse = QPushButton("Browse")
+        self.btn_tab_browse.setObjectName("TabButtonInactive")
+        self.btn_tab_browse.clicked.connect(lambda: self.switch_tab("browse"))
+
+        tabs_lay.addWidget(self.btn_tab_installed)
+        tabs_lay.addWidget(self.btn_tab_browse)
+        tabs_lay.addStretch()
+        content_lay.addWidget(tabs_frame)
+        
+        # Tool Bar (Search + Sort)
+        tool_frame = QFrame()
+        tool_lay = QHBoxLayout(tool_frame)
+        tool_lay.setContentsMargins(32, 24, 32, 10)
+        tool_lay.setSpacing(16)
+
+        self.inp_search = QLineEdit()
+        self.inp_search.setPlaceholderText("Search...")
+        self.inp_search.setObjectName("SearchInput")
+        self.inp_search.returnPressed.connect(self.trigger_search) # Connect Enter key
+        tool_lay.addWidget(self.inp_search, 1)
+
+        # Sort Dropdown
+        from PyQt5.QtWidgets import QComboBox
+        self.combo_sort = QComboBox()
+        self.combo_sort.addItems(["Relevance", "Downloads", "Newest", "Updated"])
+        self.combo_sort.setFixedSize(120, 42)
+        # Quick styling for combo
+        self.combo_sort.setStyleSheet("""
+            QComboBox { 
+                background: #27272a; color: white; border: 1px solid #3f3f46; 
+                border-radius: 8px; padding-left: 10px; 
+            }
+            QComboBox::drop-down { border: none; }
+            QComboBox QAbstractItemView { background: #27272a; color: white; selection-background-color: #059669; }
+        """)
+        self.combo_sort.currentIndexChanged.connect(self.trigger_search)
+        tool_lay.addWidget(self.combo_sort)
+
+        content_lay.addWidget(tool_frame)
+
+        self.stack = QStackedWidget()
+
+        # Page 1: Installed (Existing code)
+        page_installed = QWidget()
+        pi_lay = QVBoxLayout(page_installed)
+        pi_lay.setContentsMargins(32, 10, 32, 32)
+
+        # Rows are painted by ModRowDelegate; uniform heights let the view
+        # lay out and draw only what is on screen, however many mods there are.
+        self.mods_model = InstalledModsModel(self)
+        self.mods_proxy = InstalledModsFilter(self)
+        self.mods_proxy.setSourceModel(self.mods_model)
+
+        self.mods_view = InstalledModsView()
+        self.mods_view.setModel(self.mods_proxy)
+        self.mods_view.setItemDelegate(ModRowDelegate(self))
+        self.mods_view.setUniformItemSizes(True)
+        self.mods_view.setMouseTracking(True)
+        self.mods_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.mods_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.mods_view.setFocusPolicy(Qt.NoFocus)
+        self.mods_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.mods_view.verticalScrollBar().setSingleStep(24)
+        self.mods_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.mods_view.setFrameShape(QFrame.NoFrame)
+        self.mods_view.setStyleSheet("QListView { background: transparent; border: none; }")
+
+        self.mods_empty_lbl = QLabel("No mods found.")
+        self.mods_empty_lbl.setStyleSheet("color: #52525b; margin-top: 20px;")
+        self.mods_empty_lbl.setAlignment(Qt.AlignHCenter | Qt.AlignTop)
+        self.mods_empty_lbl.hide()
+
+        pi_lay.addWidget(self.mods_empty_lbl)
+        pi_lay.addWidget(self.mods_view, 1)
+        self.stack.addWidget(page_installed)
+
+        # Page 2: Browse (Replaces placeholder)
+        page_browse = QWidget()
+        pb_lay = QVBoxLayout(page_browse)
+        pb_lay.setContentsMargins(32, 10, 32, 32)
+        
+        scroll_browse = QScrollArea()
+        scroll_browse.setWidgetResizable(True)
+        scroll_browse.setFrameShape(QFrame.NoFrame)
+        scroll_browse.setStyleSheet("background: transparent;")
+        scroll_browse.verticalScrollBar().valueChanged.connect(self.maybe_load_more_results)
+        self.scroll_browse = scroll_browse
+        
+        self.browse_container = QWidget()
+        self.browse_grid = QGridLayout(self.browse_container)
+        self.browse_grid.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        self.browse_grid.setSpacing(20)
+        
+        scroll_browse.setWidget(self.browse_container)
+        pb_lay.addWidget(scroll_browse)
+        self.stack.addWidget(page_browse)
+
+        content_lay.addWidget(self.stack, 1)
+        main_lay.addWidget(content, 1)
+        self.switch_tab("installed")
+
+    # --------------------------
+    # Public load
+    # --------------------------
+
+    def load_instance_data(self, instance_data):
+        self.current_instance = instance_data or {}
+        self.current_instance_name = self.current_instance.get("name", "")
+
+        name = self.current_instance.get("name", "Unknown")
+        self.inst_name.setText(name)
+
+        # Icon handling: match your launcher logic
+        image = self.current_instance.get("image")
+        image_path = None
+
+        if isinstance(image, dict):
+            image_path = image.get("saved_path")
+        elif isinstance(image, str):
+            image_path = image
+
+        if image_path and not os.path.isabs(image_path):
+            image_path = os.path.join(PROJECT_DIR, image_path)
+
+        rounded = QPixmap()
+        if image_path and image_path != "🟩":
+            rounded = THUMBNAILS.get(image_path, 48, 8, self.devicePixelRatioF())
+
+        if not rounded.isNull():
+            self.inst_icon.setPixmap(rounded)
+            self.inst_icon.setStyleSheet("background: transparent;")
+            self.inst_icon.setText("")
+        else:
+            colors = ["#7c3aed", "#db2777", "#ea580c", "#059669", "#2563eb"]
+            color = colors[len(name) % len(colors)]
+            self.inst_icon.setText(name[0].upper())
+            self.inst_icon.setStyleSheet(
+                f"background: {color}; border-radius: 8px; font-size: 24px; font-weight: bold; color: white;"
+            )
+            self.inst_icon.setPixmap(QPixmap())
+
+        mod_data = self.current_instance.get("mod_data", []) or []
+        self.render_mod_rows(mod_data)
+        self.sync_mods_with_index()
+        self.watch_mods_folder()
+
+        # folder icon
+        folder_icon_path = os.path.join(ICONS_DIR, "folder.svg")
+        self.btn_folder.setIcon(SVG_ICONS.icon(folder_icon_path, size=20, color="#ffffff"))
+        self.btn_folder.setIconSize(QSize(20, 20))
+
+        # update category counts (simple)
+        self.refresh_category_counts()
+
+    # --------------------------
+    # Rendering / filtering
+    # --------------------------
+
+    def render_mod_rows(self, mod_data):
+        self.mod_search.clear()
+        for mod in mod_data:
+            self.index_mod_for_search(mod)
+
+        self.mods_model.set_mods(mod_data)
+        self.inst_count.setText(f"{len(mod_data)} mods installed")
+        self.mods_empty_lbl.setVisible(not mod_data)
+        self.apply_search_filter(self.inp_search.text().strip())
+
+    def apply_search_filter(self, text: str):
+        text = (text or "").strip()
+        if not text:
+            self.mods_proxy.set_ranking(None)
+            return
+        self.mods_proxy.set_ranking([key for key, _ in self.mod_search.search(text)])
+
+    def jar_meta(self, mod):
+        """The mod index's metadata for one of the mod's jars, or None."""
+        if not self.mod_index:
+            return None
+        for fn in mod.get("filenames", []) or []:
+            twin = fn[:-9] if fn.endswith(".disabled") else fn + ".disabled"
+            meta = self.mod_index.get(fn) or self.mod_index.get(twin)
+            if meta:
+                return meta
+        return None
+
+    def index_mod_for_search(self, mod):
+        """(Re)indexes one mod. mod_id/description come from the jar index when known."""
+        self.mod_search.add(id(mod), mod_search_fields(mod, self.jar_meta(mod)))
+
+    def refresh_installed_count(self):
+        count = self.mods_model.rowCount()
+        self.inst_count.setText(f"{count} mods installed")
+        self.mods_empty_lbl.setVisible(count == 0)
+
+    def refresh_category_counts(self):
+        # Optional: you can recompute categories dynamically later.
+        pass
+
+    # --------------------------
+    # Mod index (jars on disk -> mod_data)
+    # --------------------------
+
+    def sync_mods_with_index(self):
+        """
+        Refreshes the instance's mod index on a worker (only changed jars are
+        opened); on_mod_index_loaded then adds an entry to mod_data for every
+        jar that isn't tracked yet, e.g. jars dropped into mods/ by hand.
+        """
+        self.mod_index = None
+        inst_name = self.current_instance_name
+        if not inst_name:
+            return
+
+        instance_dir = os.path.join(GAME_DIR, "instances", inst_name)
+        recover_interrupted_update(instance_dir)
+
+        thread = QThread()
+        worker = ModIndexLoader(instance_dir, os.path.join(GAME_DIR, "cache", "mod_icons"))
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.loaded.connect(self.on_mod_index_loaded)
+        worker.error.connect(self.on_mod_index_error)
+        worker.loaded.connect(thread.quit)
+        worker.error.connect(thread.quit)
+        thread.finished.connect(self._release_update_checks)
+
+        self._active_update_refs.append((thread, worker))
+        thread.start()
+
+    def on_mod_index_loaded(self, index):
+        inst_name = self.current_instance_name
+        if not inst_name or index.instance_dir != os.path.join(GAME_DIR, "instances", inst_name):
+            return  # another instance was opened in the meantime
+        self.mod_index = index
+
+        mods = self.current_instance.get("mod_data", []) or []
+        tracked = set()
+        for m in mods:
+            for fn in m.get("filenames", []) or []:
+                tracked.add(fn)
+                # a toggle may have happened outside the launcher
+                tracked.add(fn[:-9] if fn.endswith(".disabled") else fn + ".disabled")
+
+        added = [mod_data_from_meta(e["meta"]) for fn, e in sorted(index.entries.items()) if fn not in tracked]
+        if added:
+            mods.extend(added)
+            self.current_instance["mod_data"] = mods
+            self.current_instance["mod_count"] = len(mods)
+
+            launcher = self._launcher()
+            if launcher and hasattr(launcher, "instances_data") and inst_name in launcher.instances_data:
+                launcher.instances_data[inst_name] = self.current_instance
+                launcher.save_config(inst_name)
+            self.render_mod_rows(mods)
+        else:
+            # the rows are already shown; search picks up mod ids/descriptions from the jars
+            for m in self.mods_model.mods():
+                self.index_mod_for_search(m)
+            self.apply_search_filter(self.inp_search.text().strip())
+
+        self._watch_jars()
+        QTimer.singleShot(150, self.start_identification)
+
+    def on_mod_index_error(self, msg):
+        print(f"[MODS] Could not index mods: {msg}")
+        QTimer.singleShot(150, self.start_identification)
+
+    # --------------------------
+    # Mods folder watcher (jars added/removed/renamed outside the launcher)
+    # --------------------------
+
+    def watch_mods_folder(self):
+        """Points the watcher at the open instance's mods/ (or the instance dir until mods/ exists)."""
+        self.unwatch_mods_folder()
+        if not self.current_instance_name:
+            return
+        instance_dir = os.path.join(GAME_DIR, "instances", self.current_instance_name)
+        mods_dir = os.path.join(instance_dir, "mods")
+        if os.path.isdir(mods_dir):
+            self._mods_watcher.addPath(mods_dir)
+            self._watch_jars()
+        elif os.path.isdir(instance_dir):
+            self._mods_watcher.addPath(instance_dir)
+
+    def _watch_jars(self):
+        """
+        The directory watch only reports entries added, removed or renamed;
+        a jar overwritten in place needs a watch of its own.
+        """
+        if not self.mod_index:
+            return
+        watched = set(self._mods_watcher.files())
+        paths = [os.path.join(self.mod_index.mods_dir, fn) for fn in self.mod_index.entries]
+        paths = [p for p in paths if p not in watched]
+        if paths:
+            self._mods_watcher.addPaths(paths)
+
+    def unwatch_mods_folder(self):
+        self._watch_timer.stop()
+        paths = self._mods_watcher.directories() + self._mods_watcher.files()
+        if paths:
+            self._mods_watcher.removePaths(paths)
+
+    def hold_mods_watcher(self):
+        """Call around launcher writes into mods/ that finish on a worker thread."""
+        self._watch_hold += 1
+
+    def release_mods_watcher(self):
+        self._watch_hold = max(0, self._watch_hold - 1)
+        if not self._watch_hold and self._mods_watcher.directories():
+            self._watch_timer.start()
+
+    def on_mods_dir_changed(self, path):
+        self._watch_timer.start()  # restarts the countdown: one pass per burst
+
+    def apply_mods_dir_changes(self):
+        """
+        Applies what changed in mods/ since the last pass to mod_data. Only
+        jars whose stat changed are opened; every other entry is left alone.
+        """
+        if self._watch_hold or not self.mod_index or not self.current_instance_name:
+            return
+        # mods/ may have just been created, or deleted and re-created
+        mods_dir = self.mod_index.mods_dir
+        if mods_dir not in self._mods_watcher.directories():
+            self.watch_mods_folder()
+
+        changes = self.mod_index.refresh()
+        if not any(changes.values()):
+            return
+        self._watch_jars()
+
+        mods = self.current_instance.get("mod_data", []) or []
+        owner = {}
+        for m in mods:
+            for fn in m.get("filenames", []) or []:
+                owner[fn] = m
+
+        touched, gone, added = [], [], []
+
+        # 1. Renames (enabled/disabled by hand). Our own toggles have already updated mod_data.
+        for old, new in changes["renamed"].items():
+            m = owner.get(old)
+            if m is None or new in owner:
+                continue
+            files = m["filenames"]
+            files[files.index(old)] = new
+            m["enabled"] = not new.endswith(".disabled")
+            owner[new] = owner.pop(old)
+            touched.append(m)
+
+        # 2. Removed jars; a mod with no files left is dropped
+        for fn in changes["removed"]:
+            m = owner.pop(fn, None)
+            if m is None:
+                continue
+            m["filenames"].remove(fn)
+            if m["filenames"]:
+                touched.append(m)
+            else:
+                gone.append(m)
+
+        # 3. New or overwritten jars
+        for fn in changes["read"]:
+            meta = self.mod_index.get(fn)
+            if meta is None:
+                continue
+            m = owner.get(fn)
+            if m is None:
+                m = mod_data_from_meta(meta)
+                owner[fn] = m
+                added.append(m)
+                continue
+            if not m.get("project_id"):
+                # a local jar replaced in place: everything shown came from the jar
+                fresh = mod_data_from_meta(meta)
+                for key in ("name", "mod_id", "version", "author", "icon_path"):
+                    m[key] = fresh[key]
+            touched.append(m)
+
+        if not (touched or gone or added):
+            return
+
+        gone_ids = {id(m) for m in gone}
+        mods = [m for m in mods if id(m) not in gone_ids] + added
+        self.current_instance["mod_data"] = mods
+        self.current_instance["mods"] = len(mods)
+        self.current_instance["mod_count"] = len(mods)
+
+        inst_name = self.current_instance_name
+        launcher = self._launcher()
+        if launcher and hasattr(launcher, "instances_data") and inst_name in launcher.instances_data:
+            launcher.instances_data[inst_name] = self.current_instance
+            launcher.save_config(inst_name)
+
+        for m in gone:
+            self.mod_search.remove(id(m))
+            self.mods_model.remove_mod(m)
+        for m in touched:
+            if id(m) not in gone_ids:
+                # a re-read jar extracts its icon over the old one
+                THUMBNAILS.forget(m.get("icon_path"))
+                self.index_mod_for_search(m)
+                self.mods_model.mod_changed(m)
+        for m in added:
+            self.index_mod_for_search(m)
+            self.mods_model.add_mod(m)
+        self.refresh_installed_count()
+        if self.inp_search.text().strip() and self.stack.currentIndex() == 0:
+            self.apply_search_filter(self.inp_search.text())
+        if added:
+            self.start_identification(then_check=False)
+
+        print(f"[WATCH] {inst_name}: {len(added)} added, {len(gone)} removed, {len(touched)} changed")
+
+    # --------------------------
+    # Persistence back to LauncherV2
+    # --------------------------
+
+    def persist_mod_change(self, updated_mod_data: dict):
+        launcher = self._launcher()
+        if not launcher or not hasattr(launcher, "instances_data"):
+            return
+
+        inst_name = self.current_instance_name
+        if not inst_name:
+            return
+
+        inst = launcher.instances_data.get(inst_name, {})
+        mods = inst.get("mod_data", []) or []
+
+        uid = updated_mod_data.get("id")
+        title = updated_mod_data.get("title") or updated_mod_data.get("name")
+
+        replaced = False
+        for i, m in enumerate(mods):
+            if uid and m.get("id") == uid:
+                mods[i] = updated_mod_data
+                replaced = True
+                break
+
+        if not replaced:
+            for i, m in enumerate(mods):
+                if (m.get("title") or m.get("name")) == title:
+                    mods[i] = updated_mod_data
+                    replaced = True
+                    break
+
+        inst["mod_data"] = mods
+        inst["mods"] = len(mods)
+        inst["mod_count"] = len(mods)
+
+        launcher.instances_data[inst_name] = inst
+        launcher.save_config(inst_name)
+
+        self.current_instance = inst
+        self.index_mod_for_search(updated_mod_data)
+        self.mods_model.mod_changed(updated_mod_data)
+        self.inst_count.setText(f"{len(mods)} mods installed")
+
+    def remove_mod_from_instance(self, mod_data: dict):
+        launcher = self._launcher()
+        if not launcher or not hasattr(launcher, "instances_data"):
+            return
+
+        inst_name = self.current_instance_name
+        if not inst_name:
+            return
+
+        inst = launcher.instances_data.get(inst_name, {})
+        mods = inst.get("mod_data", []) or []
+
+        uid = mod_data.get("id")
+        title = mod_data.get("title") or mod_data.get("name")
+
+        new_mods = []
+        for m in mods:
+            if uid and m.get("id") == uid:
+                continue
+            if (not uid) and ((m.get("title") or m.get("name")) == title):
+                continue
+            new_mods.append(m)
+
+        inst["mod_data"] = new_mods
+        inst["mods"] = len(new_mods)
+        inst["mod_count"] = len(new_mods)
+
+        launcher.instances_data[inst_name] = inst
+        launcher.save_config(inst_name)
+
+        self.current_instance = inst
+
+        kept = {id(m) for m in new_mods}
+        for m in [m for m in self.mods_model.mods() if id(m) not in kept]:
+            self.mod_search.remove(id(m))
+            self.mods_model.remove_mod(m)
+        self.refresh_installed_count()
+
+    # --------------------------
+    # Row actions (called from ModRowDelegate)
+    # --------------------------
+
+    def _mods_dir(self):
+        if not self.current_instance_name:
+            return ""
+        return os.path.join(GAME_DIR, "instances", self.current_instance_name, "mods")
+
+    def toggle_mod(self, mod_data: dict, checked: bool):
+        """Enables/disables a mod by renaming its jar to/from .disabled."""
+        mods_dir = self._mods_dir()
+        if not mods_dir:
+            QMessageBox.warning(self, "Toggle failed", "No instance mods directory.")
+            return
+        os.makedirs(mods_dir, exist_ok=True)
+
+        filenames = mod_data.get("filenames", []) or []
+        if not filenames:
+            mod_data["enabled"] = checked
+            self.persist_mod_change(mod_data)
+            return
+
+        # find an actual existing file
+        existing = None
+        for fn in filenames:
+            if os.path.exists(os.path.join(mods_dir, fn)):
+                existing = fn
+                break
+        if existing is None:
+            existing = filenames[0]
+
+        old_path = os.path.join(mods_dir, existing)
+
+        if checked:
+            new_name = existing[:-9] if existing.endswith(".disabled") else existing
+        else:
+            new_name = existing if existing.endswith(".disabled") else (existing + ".disabled")
+
+        new_path = os.path.join(mods_dir, new_name)
+
+        if old_path != new_path and os.path.exists(old_path):
+            try:
+                os.rename(old_path, new_path)
+            except Exception as e:
+                QMessageBox.warning(self, "Toggle failed", f"Could not rename:\n{e}")
+                return
+
+        # update mod_data
+        new_files = filenames[:]
+        if existing in new_files:
+            new_files[new_files.index(existing)] = new_name
+        elif new_files:
+            new_files[0] = new_name
+
+        mod_data["filenames"] = new_files
+        mod_data["enabled"] = checked
+        self.persist_mod_change(mod_data)
+
+    def reenable_mods(self, filenames):
+        """Enables the disabled jars a Browse install depends on."""
+        mods = (self.current_instance or {}).get("mod_data", []) or []
+        mods_dir = self._mods_dir()
+        for fn in filenames:
+            m = next((m for m in mods if fn in (m.get("filenames") or [])), None)
+            if m is not None:
+                self.toggle_mod(m, True)
+            elif mods_dir and fn.endswith(".disabled"):
+                # Not in mod_data yet; the folder watcher picks up the rename
+                try:
+                    os.rename(os.path.join(mods_dir, fn), os.path.join(mods_dir, fn[:-9]))
+                except OSError as e:
+                    print(f"[MODS] Could not enable {fn}: {e}")
+
+    def delete_mod(self, mod_data: dict):
+        title = mod_data.get("title") or mod_data.get("name", "this mod")
+        question = f"Remove '{title}'?"
+        others = [n for n in self._instances_using(mod_data) if n != self.current_instance_name]
+        if others:
+            shown = ", ".join(others[:5]) + (f" and {len(others) - 5} more" if len(others) > 5 else "")
+            question += f"\n\nIt stays installed in {shown}."
+        if QMessageBox.question(self, "Remove Mod", question) != QMessageBox.Yes:
+            return
+
+        mods_dir = self._mods_dir()
+        if mods_dir:
+            for fn in mod_data.get("filenames", []) or []:
+                p = os.path.join(mods_dir, fn)
+                if os.path.exists(p):
+                    try:
+                        os.remove(p)
+                    except Exception:
+                        pass
+
+        self.remove_mod_from_instance(mod_data)
+
+    # --------------------------
+    # Identify jars with no Modrinth project (by file hash)
+    # --------------------------
+
+    def start_identification(self, then_check=True):
+        """
+        Looks up every mod without a project_id by the sha1 of its jar so it
+        gets update checks too, then starts the update checks. Hashes already
+        asked about (found or not) are answered from the cache, never re-sent.
+        """
+        if self._identify_busy:
+            self._identify_pending = bool(self._identify_pending) or then_check
+            return
+
+        def known(v):
+            return bool(v) and str(v).lower() not in ["unknown", "", "none", "null"]
+
+        inst_name = self.current_instance_name
+        mods = [m for m in self.mods_model.mods() if m.get("filenames") and not known(m.get("project_id"))]
+        if not inst_name or not mods:
+            if then_check:
+                self.start_update_checks()
+            return
+
+        thread = QThread()
+        worker = ModIdentifier(
+            os.path.join(GAME_DIR, "instances", inst_name),
+            mods,
+            os.path.join(GAME_DIR, "cache", "modrinth_hashes.json"),
+        )
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.identified.connect(self.on_mods_identified)
+        worker.error.connect(self.on_identify_error)
+        worker.identified.connect(thread.quit)
+        worker.error.connect(thread.quit)
+        thread.finished.connect(self._release_update_checks)
+
+        self._identify_busy = True
+        self._identify_then_check = then_check
+        self._active_update_refs.append((thread, worker))
+        thread.start()
+
+    def on_mods_identified(self, results):
+        changed = []
+        for mod, info in results:
+            if mod.get("project_id") and str(mod["project_id"]).lower() not in ["unknown", "none", "null"]:
+                continue  # picked up a project some other way in the meantime
+            mod["project_id"] = info["project_id"]
+            mod["version_id"] = info.get("version_id")
+            if info.get("version_number"):
+                mod["version"] = info["version_number"]
+            changed.append(mod)
+
+        if changed:
+            # the dicts are the ones in instances_data, so one save covers them
+            self._save_launcher_config()
+            for m in changed:
+                if self.mods_model.row_of(m) >= 0:
+                    self.index_mod_for_search(m)
+                    self.mods_model.mod_changed(m)
+            print(f"[IDENTIFY] Matched {len(changed)} jar(s) to Modrinth projects by hash")
+
+        self._identification_done(bool(changed))
+
+    def on_identify_error(self, msg):
+        print(f"[IDENTIFY] Lookup failed: {msg}")
+        self._identification_done(False)
+
+    def _identification_done(self, found_any):
+        self._identify_busy = False
+        self.start_hydration()
+        pending, self._identify_pending = self._identify_pending, None
+        if pending is not None:
+            self.start_identification(pending or self._identify_then_check or found_any)
+        elif self._identify_then_check or found_any:
+            self.start_update_checks()
+
+    # --------------------------
+    # Project hydration (display info for installed mods)
+    # --------------------------
+
+    HYDRATE_MAX_AGE = 24 * 60 * 60
+
+    def start_hydration(self):
+        """
+        Brings title, author, categories and icon of every mod with a known
+        project up to date from Modrinth: one batched /projects + /teams
+        lookup for the whole instance, at most once a day per mod (or when
+        the icon of a project that has one went missing).
+        """
+        if self._hydrate_busy:
+            return
+
+        def known(v):
+            return bool(v) and str(v).lower() not in ["unknown", "", "none", "null"]
+
+        now = time.time()
+        stale = [m for m in self.mods_model.mods() if known(m.get("project_id")) and (
+            now - (m.get("hydrated_at") or 0) > self.HYDRATE_MAX_AGE
+            or (m.get("icon_url") and not (m.get("icon_path") and os.path.exists(m["icon_path"])))
+        )]
+        if not stale:
+            return
+
+        thread = QThread()
+        worker = ProjectHydrator({m["project_id"] for m in stale})
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.hydrated.connect(self.on_projects_hydrated)
+        worker.error.connect(self.on_hydrate_error)
+        worker.hydrated.connect(thread.quit)
+        worker.error.connect(thread.quit)
+        thread.finished.connect(self._release_update_checks)
+
+        self._hydrate_busy = True
+        self._active_update_refs.append((thread, worker))
+        thread.start()
+
+    def on_projects_hydrated(self, projects):
+        self._hydrate_busy = False
+        now = time.time()
+        changed = []
+        for m in self.mods_model.mods():
+            project = projects.get(str(m.get("project_id")))
+            if not project:
+                continue
+            m["title"] = project.get("title") or m.get("title")
+            if project.get("author"):
+                m["author"] = project["author"]
+            m["categories"] = project.get("categories") or []
+            if project.get("description"):
+                m["description"] = project["description"]
+            m["hydrated_at"] = now
+            icon_url = project.get("icon_url")
+            if not icon_url:
+                m.pop("icon_url", None)  # no Modrinth icon: a missing icon_path isn't a reason to ask again
+            has_icon = m.get("icon_path") and os.path.exists(m["icon_path"])
+            if icon_url and (icon_url != m.get("icon_url") or not has_icon):
+                m["icon_url"] = icon_url
+                IMAGES.load(icon_url, ModRowDelegate.ICON_SIZE, 8, self.devicePixelRatioF(),
+                            lambda pix, m=m, url=icon_url: self._hydrated_icon(m, url))
+            changed.append(m)
+
+        if changed:
+            # the dicts are the ones in instances_data, so one save covers them
+            self._save_launcher_config()
+            for m in changed:
+                self.index_mod_for_search(m)
+                self.mods_model.mod_changed(m)
+            print(f"[HYDRATE] Updated display info for {len(changed)} mod(s) from {len(projects)} project(s)")
+
+    def on_hydrate_error(self, msg):
+        self._hydrate_busy = False
+        print(f"[HYDRATE] Project lookup failed: {msg}")
+
+    def _hydrated_icon(self, mod, url):
+        """An icon from hydration arrived: keep a copy beside the ones installs download."""
+        src = IMAGES.cached_file(url)
+        if not src or mod.get("icon_url") != url:
+            return
+        ext = os.path.splitext(url.split("?")[0])[1]
+        if not ext or len(ext) > 5:
+            ext = ".png"
+        icon_dir = os.path.join(GAME_DIR, "cache", "mod_icons")
+        dest = os.path.join(icon_dir, f"{mod.get('project_id', 'unknown_mod')}{ext}")
+        try:
+            os.makedirs(icon_dir, exist_ok=True)
+            shutil.copyfile(src, dest)
+        except OSError as e:
+            print(f"[HYDRATE] Could not keep icon for {mod.get('title')}: {e}")
+            return
+        THUMBNAILS.forget(dest)
+        mod["icon_path"] = dest
+        if self.mods_model.row_of(mod) >= 0:
+            self.mods_model.mod_changed(mod)
+        # icons trickle in one by one; save once they've settled
+        self._hydrate_save_timer.start()
+
+    def _save_launcher_config(self):
+        launcher = self._launcher()
+        if launcher and hasattr(launcher, "save_config"):
+            launcher.save_config(self.current_instance_name)
+
+    # --------------------------
+    # Background update check (all rows, one thread)
+    # --------------------------
+
+    def start_update_checks(self):
+        self.stop_update_checks()
+
+        def known(v):
+            return bool(v) and str(v).lower() not in ["unknown", "", "none", "null"]
+
+        mods = [m for m in self.mods_model.mods() if known(m.get("project_id")) and known(m.get("version"))]
+        if not mods:
+            return
+
+        inst = self.current_instance or {}
+        mc_version = (inst.get("version") or "").strip()
+        loader = (inst.get("modloader") or inst.get("loader") or "").strip()
+
+        self._check_thread = QThread()
+        self._check_worker = ModUpdateFinder(
+            os.path.join(GAME_DIR, "instances", self.current_instance_name), mods, mc_version, loader
+        )
+        self._check_worker.moveToThread(self._check_thread)
+
+        self._check_thread.started.connect(self._check_worker.run)
+        self._check_worker.mod_checked.connect(self.on_mod_update_checked)
+        self._check_worker.error.connect(self.on_update_check_error)
+        self._check_worker.finished.connect(self._check_thread.quit)
+        self._check_thread.finished.connect(self._release_update_checks)
+
+        # held until the thread has actually finished, even after a newer check replaces it
+        self._active_update_refs.append((self._check_thread, self._check_worker))
+        self._check_thread.start()
+
+    def stop_update_checks(self):
+        if self._check_worker:
+            self._check_worker.stop()
+            try:
+                self._check_worker.mod_checked.disconnect(self.on_mod_update_checked)
+            except TypeError:
+                pass
+        self._check_thread = None
+        self._check_worker = None
+
+    def _release_update_checks(self):
+        alive = []
+        for thread, worker in self._active_update_refs:
+            if thread.isFinished():
+                if worker is self._check_worker:
+                    self._check_thread = None
+                    self._check_worker = None
+                worker.deleteLater()
+                thread.deleteLater()
+            else:
+                alive.append((thread, worker))
+        self._active_update_refs = alive
+
+    def on_update_check_error(self, msg):
+        # keep whatever the last successful check found
+        print(f"[UPDATE] Mod update check failed: {msg}")
+
+    def on_mod_update_checked(self, mod_data, has_update: bool, latest_version: str):
+        changed = (mod_data.get("_has_update", False), mod_data.get("_latest_version", "")) != \
+                  (bool(has_update), latest_version or "")
+        mod_data["_has_update"] = bool(has_update)
+        mod_data["_latest_version"] = latest_version or ""
+        self.mods_model.mod_changed(mod_data)
+        if changed:
+            # saved so the instance catalog's "updates waiting" (sidebar tooltips) follows
+            self._hydrate_save_timer.start()
+
+    # --------------------------
+    # Update flow (single mod)
+    # --------------------------
+
+    # --------------------------
+    # Update flow (Dialog based)
+    # --------------------------
+
+    def update_single_mod(self, mod_data: dict):
+        """Step 1: Fetch versions"""
+        inst = self.current_instance or {}
+        mc_version = (inst.get("version") or "").strip()
+        loader = (inst.get("modloader") or inst.get("loader") or "").strip()
+        project_id = mod_data.get("project_id")
+        
+        if not project_id:
+            QMessageBox.warning(self, "Error", "Cannot update: Missing Project ID.")
+            return
+
+        # Show a quick loading indicator (could be a dialog or status bar)
+        self.loading_dlg = QProgressDialog("Fetching versions...", "Cancel", 0, 0, self)
+        self.loading_dlg.setWindowModality(Qt.WindowModal)
+        self.loading_dlg.show()
+        
+        # Start Fetch Worker
+        self._fetch_thread = QThread()
+        self._fetch_worker = ModrinthVersionFetcher(project_id, mc_version, loader)
+        self._fetch_worker.moveToThread(self._fetch_thread)
+        
+        # Connect signals
+        self._fetch_thread.started.connect(self._fetch_worker.run)
+        self._fetch_worker.versions_ready.connect(
+            lambda v: self.on_versions_fetched(v, mod_data)
+        )
+        self._fetch_worker.error.connect(
+            lambda e: QMessageBox.warning(self, "Error", f"Failed to fetch versions:\n{e}")
+        )
+        
+        # Cleanup
+        self._fetch_worker.versions_ready.connect(self.loading_dlg.close)
+        self._fetch_worker.error.connect(self.loading_dlg.close)
+        self._fetch_worker.versions_ready.connect(self._fetch_thread.quit)
+        self._fetch_worker.error.connect(self._fetch_thread.quit)
+        
+        self._fetch_thread.start()
+
+    def on_versions_fetched(self, versions, mod_data):
+        """Step 2: Show Dialog"""
+        if not versions:
+            QMessageBox.information(self, "No Updates", "No compatible versions found for this instance.")
+            return
+            
+        current_ver = mod_data.get("version", "Unknown")
+        
+        dlg = VersionSelectDialog(current_ver, versions, self)
+        if dlg.exec_() == QDialog.Accepted:
+            # User chose a file!
+            file_info = dlg.selected_file
+            new_ver_num = dlg.selected_version_number
+            # Update this line in on_versions_fetched/confirm_selection flow:
+            self.install_specific_version(file_info, new_ver_num, mod_data, is_new_install=False)
+
+    # --------------------------
+    # Update all (bulk, transactional)
+    # --------------------------
+
+    def update_all_mods(self):
+        """
+        1. One bulk lookup for every jar's newest compatible version.
+        2. Parallel downloads into staging.
+        3. Swap the whole set into mods/ and save the config once; any
+           failure puts the previous jars back.
+        """
+        inst_name = self.current_instance_name
+        if not inst_name:
+            return
+        inst = self.current_instance or {}
+        mc_version = (inst.get("version") or "").strip()
+        loader = (inst.get("modloader") or inst.get("loader") or "").strip()
+        instance_dir = os.path.join(GAME_DIR, "instances", inst_name)
+
+        self.btn_update_all.setEnabled(False)
+        self.update_dlg = QProgressDialog("Checking for updates...", "Cancel", 0, 0, self)
+        self.update_dlg.setWindowModality(Qt.WindowModal)
+        self.update_dlg.show()
+
+        self._find_thread = QThread()
+        self._find_worker = ModUpdateFinder(instance_dir, inst.get("mod_data", []) or [], mc_version, loader)
+        self._find_worker.moveToThread(self._find_thread)
+
+        self._find_thread.started.connect(self._find_worker.run)
+        self._find_worker.mod_checked.connect(self.on_mod_update_checked)
+        self._find_worker.found.connect(self.on_updates_found)
+        self._find_worker.error.connect(self.on_update_all_error)
+        self._find_worker.finished.connect(self._find_thread.quit)
+        self._find_thread.start()
+
+    def on_update_all_error(self, msg):
+        self.update_dlg.close()
+        self.btn_update_all.setEnabled(True)
+        if msg != "Cancelled":
+            QMessageBox.warning(self, "Update Failed", f"Nothing was changed.\n\n{msg}")
+
+    def on_updates_found(self, updates):
+        # check before close(): closing a QProgressDialog counts as cancelling it
+        cancelled = self.update_dlg.wasCanceled()
+        self.update_dlg.close()
+        if cancelled:
+            self.btn_update_all.setEnabled(True)
+            return
+        if not updates:
+            self.btn_update_all.setEnabled(True)
+            QMessageBox.information(self, "Up to Date", "All mods are up to date.")
+            return
+
+        lines = [f"•  {u['title']}  {u['old_version'] or '?'} → {u['version_number']}" for u in updates[:25]]
+        if len(updates) > 25:
+            lines.append(f"…and {len(updates) - 25} more")
+        if QMessageBox.question(self, "Update All", f"Update {len(updates)} mods?\n\n" + "\n".join(lines)) != QMessageBox.Yes:
+            self.btn_update_all.setEnabled(True)
+            return
+
+        staging_dir = os.path.join(GAME_DIR, "instances", self.current_instance_name,
+                                   ".staging", f"update-{int(time.time() * 1000)}")
+        self.update_dlg = QProgressDialog(f"Downloading {len(updates)} updates...", "Cancel", 0, 0, self)
+        self.update_dlg.setWindowModality(Qt.WindowModal)
+        self.update_dlg.show()
+
+        self._stage_thread = QThread()
+        self._stage_worker = ModUpdateStager(updates, staging_dir)
+        self._stage_worker.moveToThread(self._stage_thread)
+
+        self._stage_thread.started.connect(self._stage_worker.run)
+        self._stage_worker.progress.connect(self.update_dlg.setLabelText)
+        self._stage_worker.staged.connect(lambda ups: self.apply_staged_updates(ups, staging_dir))
+        self._stage_worker.error.connect(self.on_update_all_error)
+        self.update_dlg.canceled.connect(self._stage_worker.stop)
+        self._stage_worker.staged.connect(self._stage_thread.quit)
+        self._stage_worker.error.connect(self._stage_thread.quit)
+        self._stage_thread.start()
+
+    def apply_staged_updates(self, updates, staging_dir):
+        self.update_dlg.close()
+        self.btn_update_all.setEnabled(True)
+        inst_name = self.current_instance_name
+        instance_dir = os.path.join(GAME_DIR, "instances", inst_name)
+        launcher = self._launcher()
+
+        tx = UpdateTransaction(instance_dir)
+        before = [(u["mod"], dict(u["mod"])) for u in updates]
+        try:
+            tx.swap(updates)
+            for u in updates:
+                mod = u["mod"]
+                mod["filenames"] = [u["new_name"]]
+                mod["version"] = u["version_number"]
+                mod["project_id"] = mod.get("project_id") or u["project_id"]
+                mod["_has_update"] = False
+                mod["_latest_version"] = ""
+            launcher.instances_data[inst_name] = self.current_instance
+            # the backups go with tx.commit(), so the new filenames must be on disk first
+            launcher.save_config(inst_name)
+            launcher.flush_config(wait=True)
+        except Exception as e:
+            for mod, old in before:
+                mod.clear()
+                mod.update(old)
+            try:
+                tx.rollback()
+                detail = "The previous mods have been restored."
+            except Exception as re_err:
+                detail = f"Rolling back also failed ({re_err}); it will be retried next time this instance is opened."
+            QMessageBox.warning(self, "Update Failed", f"{e}\n\n{detail}")
+            return
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        tx.commit()
+
+        if self.mod_index is not None:
+            self.mod_index.load()
+            self.mod_index.refresh()
+        for u in updates:
+            THUMBNAILS.forget(u["mod"].get("icon_path"))
+            self.index_mod_for_search(u["mod"])
+            self.mods_model.mod_changed(u["mod"])
+        QMessageBox.information(self, "Updated", f"Updated {len(updates)} mods.")
+
+    # --------------------------
+    # Mod sets (named enabled/disabled states per instance)
+    # --------------------------
+
+    def _mod_sets(self):
+        sets = self.current_instance.get("mod_sets")
+        if not isinstance(sets, dict):
+            sets = self.current_instance["mod_sets"] = {}
+        return sets
+
+    def show_mod_sets_menu(self):
+        if not self.current_instance_name:
+            return
+        sets = self._mod_sets()
+        menu = QMenu(self)
+
+        if sets:
+            for name in sorted(sets, key=str.lower):
+                act = menu.addAction(f"Apply \"{name}\"")
+                act.triggered.connect(lambda _=False, n=name: self.apply_mod_set(n))
+        else:
+            empty = menu.addAction("No saved sets")
+            empty.setEnabled(False)
+
+        menu.addSeparator()
+        menu.addAction("Save current as set...").triggered.connect(self.save_mod_set)
+        if sets:
+            remove = menu.addMenu("Delete set")
+            for name in sorted(sets, key=str.lower):
+                act = remove.addAction(name)
+                act.triggered.connect(lambda _=False, n=name: self.delete_mod_set(n))
+
+        menu.exec_(self.btn_mod_sets.mapToGlobal(QPoint(0, self.btn_mod_sets.height())))
+
+    def save_mod_set(self):
+        name, ok = QInputDialog.getText(self, "Save Mod Set", "Name for the current enabled/disabled mods:")
+        name = (name or "").strip()
+        if not ok or not name:
+            return
+        sets = self._mod_sets()
+        if name in sets and QMessageBox.question(
+                self, "Save Mod Set", f"Replace the set '{name}'?") != QMessageBox.Yes:
+            return
+        sets[name] = capture_set(self.current_instance.get("mod_data", []) or [])
+        self._save_instance()
+
+    def delete_mod_set(self, name):
+        if QMessageBox.question(self, "Delete Mod Set", f"Delete the set '{name}'?") != QMessageBox.Yes:
+            return
+        self._mod_sets().pop(name, None)
+        self._save_instance()
+
+    def apply_mod_set(self, name):
+        """
+        Switches the instance to a saved set: one dependency check for the
+        whole result, all renames in one batch, one config save.
+        """
+        mod_set = self._mod_sets().get(name)
+        mods_dir = self._mods_dir()
+        if mod_set is None or not mods_dir:
+            return
+        mods = self.current_instance.get("mod_data", []) or []
+        changes = plan_set(mods, mod_set)
+        if not changes:
+            QMessageBox.information(self, "Mod Sets", f"'{name}' is already active.")
+            return
+
+        enabled_after = {id(m): m.get("enabled", True) for m in mods}
+        for mod, enable in changes:
+            enabled_after[id(mod)] = enable
+        problems = check_set(mods, {id(m): self.jar_meta(m) for m in mods}, enabled_after)
+        if problems:
+            shown = "\n".join(f"• {p}" for p in problems[:12])
+            if len(problems) > 12:
+                shown += f"\n…and {len(problems) - 12} more"
+            if QMessageBox.question(
+                    self, "Mod Sets", f"Applying '{name}' leaves these problems:\n\n{shown}\n\nApply anyway?"
+            ) != QMessageBox.Yes:
+                return
+
+        # the watcher would otherwise see dozens of renames mod_data doesn't know yet
+        self.hold_mods_watcher()
+        try:
+            try:
+                new_files = rename_all(mods_dir, changes)
+            except Exception as e:
+                QMessageBox.warning(self, "Mod Sets", f"Could not apply '{name}', nothing was changed:\n{e}")
+                return
+            for mod, enable in changes:
+                mod["filenames"] = new_files[id(mod)]
+                mod["enabled"] = enable
+            try:
+                self._save_instance(wait=True)
+            except OSError as e:
+                QMessageBox.warning(self, "Mod Sets", f"'{name}' was applied but could not be saved:\n{e}\n\n"
+                                                      "It will be saved again with the next change.")
+        finally:
+            self.release_mods_watcher()
+
+        for mod, _ in changes:
+            self.mods_model.mod_changed(mod)
+        print(f"[MODSETS] Applied '{name}' to {self.current_instance_name}: {len(changes)} mod(s) switched")
+
+    def _save_instance(self, wait=False):
+        """wait=True returns once it is on disk (raises OSError if it couldn't be written)."""
+        launcher = self._launcher()
+        inst_name = self.current_instance_name
+        if launcher and hasattr(launcher, "instances_data") and inst_name in launcher.instances_data:
+            launcher.instances_data[inst_name] = self.current_instance
+            launcher.save_config(inst_name)
+            if wait:
+                launcher.flush_config(wait=True)
+
+    def go_back(self):
+        self.unwatch_mods_folder()
+        self.back_clicked.emit()
+
+    def install_specific_version(self, file_info, new_ver_num, mod_data_target, is_new_install=False):
+        """
+        Reused for both Updates and New Installs.
+        """
+        inst_name = self.current_instance_name
+        mods_dir = os.path.join(GAME_DIR, "instances", inst_name, "mods")
+        
+        prog = QDialog(self)
+        prog.setWindowTitle("Installing")
+        prog.setFixedSize(300, 100)
+        lay = QVBoxLayout(prog)
+        lbl = QLabel(f"Installing {new_ver_num}...")
+        lbl.setStyleSheet("color: white;")
+        lay.addWidget(lbl)
+        prog.show()
+        
+        self._inst_thread = QThread()
+        self._inst_worker = ModrinthInstaller(file_info, new_ver_num, mod_data_target, mods_dir)
+        self._inst_worker.moveToThread(self._inst_thread)
+        # the jar lands before mod_data knows about it; keep the watcher from adopting it
+        self.hold_mods_watcher()
+        
+        def on_finish(success, msg, updated_data):
+            prog.close()
+            if success:
+                # Merge the new file info into our target data
+                mod_data_target.update(updated_data)
+                
+                if is_new_install:
+                    # --- FIX START: Download the icon if it's a new install ---
+                    icon_url = mod_data_target.get("icon_url")
+                    if icon_url:
+                        try:
+                            # 1. Define cache location
+                            icon_cache_dir = os.path.join(GAME_DIR, "cache", "mod_icons")
+                            os.makedirs(icon_cache_dir, exist_ok=True)
+                            
+                            # 2. Determine filename from URL or Project ID
+                            ext = os.path.splitext(icon_url)[1]
+                            if not ext or len(ext) > 5: ext = ".png"
+                            
+                            # Use project ID for filename to avoid collisions/weird characters
+                            safe_name = mod_data_target.get("project_id", "unknown_mod")
+                            save_path = os.path.join(icon_cache_dir, f"{safe_name}{ext}")
+                            
+                            # 3. Download the image (using requests synchronously here is okay 
+                            #    since it's small and we are already in a "finished" callback)
+                            print(f"[Icon] Downloading icon from {icon_url}...")
+                            r = HTTP.get(icon_url, kind="image")
+                            if r.status_code == 200:
+                                with open(save_path, "wb") as f:
+                                    f.write(r.content)
+                                # 4. Update the data with the LOCAL path
+                                mod_data_target["icon_path"] = save_path
+                        except Exception as e:
+                            print(f"[Icon] Failed to download icon: {e}")
+                    # --- FIX END ---
+
+                    self.add_mod_to_instance(mod_data_target)
+                else:
+                    self.persist_mod_change(mod_data_target)
+                
+                QMessageBox.information(self, "Success", f"Installed {mod_data_target.get('title')}")
+            else:
+                QMessageBox.warning(self, "Failed", msg)
+        
+        self._inst_thread.started.connect(self._inst_worker.run)
+        self._inst_worker.finished.connect(on_finish)
+        self._inst_worker.finished.connect(lambda *_: self.release_mods_watcher())
+        self._inst_worker.finished.connect(self._inst_thread.quit)
+        self._inst_thread.start()
+
+    # --------------------------
+    # Folder open
+    # --------------------------
+
+    def open_mods_folder(self):
+        name = self.current_instance_name or self.current_instance.get("name")
+        if not name:
+            return
+
+        path = os.path.join(GAME_DIR, "instances", name, "mods")
+        if not os.path.exists(path):
+            try:
+                os.makedirs(path, exist_ok=True)
+            except Exception as e:
+                QMessageBox.warning(self, "Error", f"Could not create folder:\n{e}")
+                return
+
+        try:
+            if sys.platform == "darwin":
+                subprocess.run(["open", path])
+            elif sys.platform == "win32":
+                os.startfile(path)
+            else:
+                subprocess.run(["xdg-open", path])
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Could not open folder:\n{e}")
+
+    # --------------------------
+    # Navigation
+    # --------------------------
+    def switch_tab(self, tab):
+        # 1. Disconnect signals to prevent overlap
+        try: self.inp_search.returnPressed.disconnect()
+        except: pass
+        try: self.inp_search.textChanged.disconnect()
+        except: pass
+
+        if tab == "installed":
+            self.stack.setCurrentIndex(0)
+            self.btn_tab_installed.setObjectName("TabButtonActive")
+            self.btn_tab_browse.setObjectName("TabButtonInactive")
+            
+            self.inp_search.setPlaceholderText("Filter installed mods...")
+            self.inp_search.clear() 
+            
+            # Connect local filter
+            self._search_timer.stop()
+            self.inp_search.textChanged.connect(self.apply_search_filter)
+            self.combo_sort.hide()
+
+        else:
+            self.stack.setCurrentIndex(1)
+            self.btn_tab_installed.setObjectName("TabButtonInactive")
+            self.btn_tab_browse.setObjectName("TabButtonActive")
+            
+            self.inp_search.setPlaceholderText("Search Modrinth...")
+            self.inp_search.clear() # Reset text to empty
+            
+            # Connect API search: debounced while typing, immediate on Enter
+            self.inp_search.textChanged.connect(self._search_timer.start)
+            self.inp_search.returnPressed.connect(self.search_now)
+            self.combo_sort.show()
+            
+            # 🔥 FIX: Force a search refresh immediately. 
+            # This makes the grid load the default "Popular/Relevant" list 
+            # so it matches the empty search bar, effectively "resetting" the view.
+            self.trigger_search()
+
+        # Refresh styles
+        self.btn_tab_installed.style().unpolish(self.btn_tab_installed)
+        self.btn_tab_installed.style().polish(self.btn_tab_installed)
+        self.btn_tab_browse.style().unpolish(self.btn_tab_browse)
+        self.btn_tab_browse.style().polish(self.btn_tab_browse)
+
+    # --- BROWSE LOGIC ---
+
+    BROWSE_PAGE_SIZE = 20
+    BROWSE_PAGE_CACHE = 60       # pages kept in memory across searches
+    BROWSE_LOAD_MARGIN = 600     # px from the bottom that triggers the next page
+
+    def search_now(self):
+        """Enter: run the pending search right away (or nothing if it already ran)."""
+        pending = self._search_timer.isActive()
+        self._search_timer.stop()
+        inst = self.current_instance or {}
+        key = (self.inp_search.text().strip(), self.combo_sort.currentText().lower(), inst.get("version", ""))
+        if pending or key != self._browse_key:
+            self.trigger_search()
+
+    def trigger_search(self):
+        self._search_timer.stop()
+        query = self.inp_search.text().strip()
+        sort_mode = self.combo_sort.currentText().lower()
+
+        # Get current instance MC version
+        inst = self.current_instance or {}
+        mc_ver = inst.get("version", "")
+
+        # Pages still in flight for an older search land in the cache but aren't shown
+        self._browse_key = (query, sort_mode, mc_ver)
+        self._browse_total = 0
+        self._browse_next = 0
+        self._browse_waiting = None
+        self._browse_row = 0
+        self._browse_status = None
+
+        # Clear Grid
+        while self.browse_grid.count():
+            item = self.browse_grid.takeAt(0)
+            if item.widget(): item.widget().deleteLater()
+        self.scroll_browse.verticalScrollBar().setValue(0)
+
+        self.show_browse_page(0)
+
+    def _set_browse_status(self, text):
+        if self._browse_status is not None:
+            self.browse_grid.removeWidget(self._browse_status)
+            self._browse_status.deleteLater()
+            self._browse_status = None
+        if text:
+            lbl = QLabel(text)
+            lbl.setStyleSheet("color: #a1a1aa; font-size: 16px;" if self._browse_row == 0 else "color: #a1a1aa;")
+            lbl.setAlignment(Qt.AlignCenter)
+            self.browse_grid.addWidget(lbl, self._browse_row, 0)
+            self._browse_status = lbl
+
+    def show_browse_page(self, offset):
+        key = self._browse_key + (offset,)
+        cached = self._browse_pages.get(key)
+        if cached is not None:
+            self._browse_pages.move_to_end(key)
+            self._browse_total, hits = cached
+            self.append_browse_page(offset, hits)
+            return
+        self._browse_waiting = offset
+        self._set_browse_status("Searching Modrinth..." if offset == 0 else "Loading more...")
+        self.fetch_browse_page(offset)
+
+    def fetch_browse_page(self, offset):
+        """Starts fetching one page unless it is cached or already on its way."""
+        key = self._browse_key + (offset,)
+        if key in self._browse_pages or key in self._browse_loading:
+            return
+        self._browse_loading.add(key)
+
+        query, sort_mode, mc_ver = self._browse_key
+        thread = QThread()
+        worker = ModrinthSearchWorker(query, mc_ver, sort_mode, offset, self.BROWSE_PAGE_SIZE, tag=key,
+                                      is_current=lambda: self._browse_key == key[:3])
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.results_ready.connect(self.on_browse_page)
+        worker.error.connect(self.on_browse_error)
+        worker.results_ready.connect(thread.quit)
+        worker.error.connect(thread.quit)
+        thread.finished.connect(self._release_browse_workers)
+
+        self._browse_workers.append((thread, worker))
+        thread.start()
+
+    def _release_browse_workers(self):
+        alive = []
+        for thread, worker in self._browse_workers:
+            if thread.isFinished():
+                worker.deleteLater()
+                thread.deleteLater()
+            else:
+                alive.append((thread, worker))
+        self._browse_workers = alive
+
+    def on_browse_page(self, key, total, hits):
+        self._browse_loading.discard(key)
+        self._browse_pages[key] = (total, hits)
+        while len(self._browse_pages) > self.BROWSE_PAGE_CACHE:
+            self._browse_pages.popitem(last=False)
+
+        if key[:3] != self._browse_key:
+            return
+        self._browse_total = total
+        if self._browse_waiting == key[3]:
+            self._browse_waiting = None
+            self.append_browse_page(key[3], hits)
+
+    def on_browse_error(self, key, msg):
+        self._browse_loading.discard(key)
+        if key[:3] != self._browse_key:
+            return  # superseded by a newer search
+        print("Search error:", msg)
+        if self._browse_waiting == key[3]:
+            self._browse_waiting = None
+            self._set_browse_status(f"Could not load results: {msg}")
+
+    def append_browse_page(self, offset, hits):
+        if offset != self._browse_next:
+            return
+        self._set_browse_status(None)
+
+        if offset == 0 and not hits:
+            self._set_browse_status("No results found.")
+            return
+
+        for hit in hits:
+            card = ModGridCard(hit)
+            card.clicked.connect(self.on_browse_card_clicked)
+            self.browse_grid.addWidget(card, self._browse_row, 0)
+            self._browse_row += 1
+
+        self._browse_next = offset + len(hits)
+        if self._has_more_results():
+            # Prefetch so the next page is usually there before the user scrolls to it
+            self.fetch_browse_page(self._browse_next)
+            QTimer.singleShot(0, self.maybe_load_more_results)
+
+    def _has_more_results(self):
+        return self._browse_key is not None and 0 < self._browse_next < self._browse_total
+
+    def maybe_load_more_results(self, *_):
+        if self._browse_waiting is not None or not self._has_more_results():
+            return
+        if self.stack.currentIndex() != 1:
+            return
+        bar = self.scroll_browse.verticalScrollBar()
+        if bar.maximum() - bar.value() > self.BROWSE_LOAD_MARGIN:
+            return
+        self.show_browse_page(self._browse_next)
+
+    def on_browse_card_clicked(self, mod_data):
+        """
+        1. Fetch versions for this mod (filtered by current instance version).
+        2. Show VersionSelectDialog.
+        3. Install.
+        """
+        project_id = mod_data.get("project_id")
+        inst = self.current_instance or {}
+        mc_version = inst.get("version", "")
+        loader = inst.get("modloader", "fabric").lower() 
+
+        # Loading Dialog
+        self.loading_dlg = QProgressDialog("Fetching versions...", "Cancel", 0, 0, self)
+        self.loading_dlg.setWindowModality(Qt.WindowModal)
+        self.loading_dlg.show()
+
+        self._fetch_thread = QThread()
+        self._fetch_worker = ModrinthVersionFetcher(project_id, mc_version, loader)
+        self._fetch_worker.moveToThread(self._fetch_thread)
+        
+        # --- CONNECT SIGNALS ---
+        self._fetch_thread.started.connect(self._fetch_worker.run) # <--- THIS WAS MISSING
+        
+        self._fetch_worker.versions_ready.connect(
+            lambda v: self.show_install_dialog(v, mod_data)
+        )
+        # Handle errors too so the dialog doesn't get stuck open
+        self._fetch_worker.error.connect(lambda e: print(f"Fetch error: {e}"))
+        self._fetch_worker.error.connect(self.loading_dlg.close)
+
+        self._fetch_worker.versions_ready.connect(self.loading_dlg.close)
+        self._fetch_worker.versions_ready.connect(self._fetch_thread.quit)
+        self._fetch_worker.error.connect(self._fetch_thread.quit)
+        
+        self._fetch_thread.start()
+
+    def show_install_dialog(self, versions, mod_data):
+        if not versions:
+            QMessageBox.warning(self, "Incompatible", "No versions found for your Minecraft version.")
+            return
+
+        dlg = VersionSelectDialog(current_version=None, versions_list=versions, parent=self)
+        
+        if dlg.exec_() == QDialog.Accepted:
+            # Resolve dependencies/conflicts first; nothing touches mods/ until confirmed
+            self.plan_browse_install(dlg.selected_version, mod_data)
+
+    # --------------------------
+    # Browse install with dependency resolution
+    # --------------------------
+
+    def plan_browse_install(self, version, mod_data):
+        inst_name = self.current_instance_name
+        if not inst_name or not version:
+            return
+        inst = self.current_instance or {}
+        mc_version = (inst.get("version") or "").strip()
+        loader = (inst.get("modloader") or inst.get("loader") or "fabric").strip()
+
+        instance_dir = os.path.join(GAME_DIR, "instances", inst_name)
+        icon_cache_dir = os.path.join(GAME_DIR, "cache", "mod_icons")
+        # still loading (ModIndexLoader): the planner reads the index on its own thread
+        installed_metas = None
+        if self.mod_index is not None:
+            installed_metas = [e["meta"] for e in self.mod_index.entries.values()]
+        staging_dir = os.path.join(instance_dir, ".staging", f"install-{int(time.time() * 1000)}")
+
+        self.plan_dlg = QProgressDialog("Resolving dependencies...", "Cancel", 0, 0, self)
+        self.plan_dlg.setWindowModality(Qt.WindowModal)
+        self.plan_dlg.show()
+
+        self._plan_thread = QThread()
+        self._plan_worker = ModInstallPlanner(
+            version, mod_data, mc_version, loader,
+            list(self.current_instance.get("mod_data", []) or []), installed_metas,
+            staging_dir, icon_cache_dir, instance_dir
+        )
+        self._plan_worker.moveToThread(self._plan_thread)
+
+        self._plan_thread.started.connect(self._plan_worker.run)
+        self._plan_worker.progress.connect(self.plan_dlg.setLabelText)
+        self._plan_worker.planned.connect(self.on_install_planned)
+        self._plan_worker.error.connect(self.on_install_plan_error)
+        self.plan_dlg.canceled.connect(self._plan_worker.stop)
+
+        self._plan_worker.planned.connect(self._plan_thread.quit)
+        self._plan_worker.error.connect(self._plan_thread.quit)
+        self._plan_thread.start()
+
+    def on_install_plan_error(self, msg):
+        self.plan_dlg.close()
+        if msg != "Cancelled":
+            QMessageBox.warning(self, "Install Failed", f"Could not resolve this mod:\n{msg}")
+
+    def on_install_planned(self, plan):
+        self.plan_dlg.close()
+        items = plan["items"]
+        root = items[0]
+
+        if plan["conflicts"]:
+            discard_plan(plan)
+            QMessageBox.warning(
+                self, "Can't Install",
+                f"{root['title']} can't be installed in this instance:\n\n"
+                + "\n".join(f"•  {c}" for c in plan["conflicts"])
+            )
+            return
+
+        deps = items[1:]
+        reenable = plan.get("reenable") or {}
+        if deps or reenable or plan["warnings"]:
+            lines = [f"Install {root['title']} {root['version_number']}"]
+            if deps:
+                lines.append("\nRequired dependencies that will also be installed:")
+                lines += [f"•  {d['title']} {d['version_number']}" for d in deps]
+            if reenable:
+                lines.append("\nDisabled dependencies that will be enabled again:")
+                lines += [f"•  {title}" for title in reenable.values()]
+            if plan["warnings"]:
+                lines.append("\nWarnings:")
+                lines += [f"•  {w}" for w in plan["warnings"]]
+            if QMessageBox.question(self, "Install Mod", "\n".join(lines)) != QMessageBox.Yes:
+                discard_plan(plan)
+                return
+
+        mods_dir = os.path.join(GAME_DIR, "instances", self.current_instance_name, "mods")
+        try:
+            entries, paths = commit_install(plan, mods_dir)
+        except Exception as e:
+            QMessageBox.warning(self, "Failed", f"Could not install:\n{e}")
+            return
+
+        if self.mod_index is not None:
+            for item, path in zip(items, paths):
+                self.mod_index.put(path, item["meta"])
+            self.mod_index.save()
+
+        for e in entries:
+            THUMBNAILS.forget(e.get("icon_path"))  # a reinstall can reuse an icon file name
+        self.reenable_mods(reenable)
+        self.add_mods_to_instance(entries)
+        extra = f" (+{len(deps)} dependencies)" if deps else ""
+        QMessageBox.information(self, "Success", f"Installed {root['title']}{extra}")
+
+    def install_specific_version(self, file_info, new_ver_num, mod_data_target, is_new_install=False):
+        inst_name = self.current_instance_name
+        mods_dir = os.path.join(GAME_DIR, "instances", inst_name, "mods")
+        
+        print(f"\n[DEBUG] Starting install for: {mod_data_target.get('title')}")
+        print(f"[DEBUG] Target Data before install: {mod_data_target}")
+
+        prog = QDialog(self)
+        prog.setWindowTitle("Installing")
+        prog.setFixedSize(300, 100)
+        lay = QVBoxLayout(prog)
+        lbl = QLabel(f"Installing {new_ver_num}...")
+        lbl.setStyleSheet("color: white;")
+        lay.addWidget(lbl)
+        prog.show()
+        
+        self._inst_thread = QThread()
+        self._inst_worker = ModrinthInstaller(file_info, new_ver_num, mod_data_target, mods_dir)
+        self._inst_worker.moveToThread(self._inst_thread)
+        # the jar lands before mod_data knows about it; keep the watcher from adopting it
+        self.hold_mods_watcher()
+        
+        def on_finish(success, msg, updated_data):
+            prog.close()
+            if success:
+                print(f"[DEBUG] Installer finished successfully.")
+                # Merge the new file info into our target data
+                mod_data_target.update(updated_data)
+                
+                if is_new_install:
+                    print("[DEBUG] This is a new install. Attempting icon download...")
+                    icon_url = mod_data_target.get("icon_url")
+                    print(f"[DEBUG] Icon URL from data: {icon_url}")
+
+                    if icon_url:
+                        try:
+                            # 1. Define cache location
+                            icon_cache_dir = os.path.join(GAME_DIR, "cache", "mod_icons")
+                            os.makedirs(icon_cache_dir, exist_ok=True)
+                            
+                            # 2. Determine filename
+                            ext = os.path.splitext(icon_url)[1]
+                            if not ext or len(ext) > 5: ext = ".png"
+                            
+                            safe_name = str(mod_data_target.get("project_id", "unknown")).replace("/", "_")
+                            save_path = os.path.join(icon_cache_dir, f"{safe_name}{ext}")
+                            
+                            print(f"[DEBUG] Downloading to: {save_path}")
+
+                            # 3. Download
+                            r = HTTP.get(icon_url, kind="image")
+                            print(f"[DEBUG] Download status code: {r.status_code}")
+                            
+                            if r.status_code == 200:
+                                with open(save_path, "wb") as f:
+                                    f.write(r.content)
+                                
+                                if os.path.exists(save_path):
+                                    print(f"[DEBUG] File successfully saved. Size: {os.path.getsize(save_path)} bytes")
+                                    # 4. Update the data with the LOCAL path
+                                    mod_data_target["icon_path"] = save_path
+                                else:
+                                    print("[DEBUG] CRITICAL: File write finished but file not found on disk.")
+                            else:
+                                print(f"[DEBUG] Failed to download icon. HTTP {r.status_code}")
+                        except Exception as e:
+                            print(f"[DEBUG] Exception during icon download: {e}")
+                    else:
+                        print("[DEBUG] No icon_url found in mod_data_target.")
+
+                    print(f"[DEBUG] Final data sending to instance: {mod_data_target}")
+                    self.add_mod_to_instance(mod_data_target)
+                else:
+                    self.persist_mod_change(mod_data_target)
+                
+                QMessageBox.information(self, "Success", f"Installed {mod_data_target.get('title')}")
+            else:
+                print(f"[DEBUG] Installer failed: {msg}")
+                QMessageBox.warning(self, "Failed", msg)
+        
+        self._inst_thread.started.connect(self._inst_worker.run)
+        self._inst_worker.finished.connect(on_finish)
+        self._inst_worker.finished.connect(lambda *_: self.release_mods_watcher())
+        self._inst_worker.finished.connect(self._inst_thread.quit)
+        self._inst_thread.start()
+
+    def add_mod_to_instance(self, new_mod_data):
+        self.add_mods_to_instance([new_mod_data])
+
+    def add_mods_to_instance(self, new_mods):
+        launcher = self._launcher()
+        inst = launcher.instances_data.get(self.current_instance_name, {})
+        mods = inst.get("mod_data", [])
+        mods.extend(new_mods)
+        
+        inst["mod_data"] = mods
+        inst["mod_count"] = len(mods)
+        launcher.save_config(self.current_instance_name)
+        try:
+            # the jars are already in mods/; don't let a crash forget what they are
+            launcher.flush_config(wait=True)
+        except OSError as e:
+            QMessageBox.warning(self, "Mods", f"The mods were installed but the instance could not be saved:\n{e}")
+        self.current_instance = inst
+
+        for m in new_mods:
+            self.index_mod_for_search(m)
+            self.mods_model.add_mod(m)
+        self.refresh_installed_count()
+        if self.inp_search.text().strip() and self.stack.currentIndex() == 0:
+            self.apply_search_filter(self.inp_search.text())
+
+    # --------------------------
+    # Rounding
+    # --------------------------
+
+    def rounded_pixmap(self, pixmap: QPixmap, radius: int) -> QPixmap:
+        if pixmap.isNull():
+            return pixmap
+
+        w, h = pixmap.width(), pixmap.height()
+        out = QPixmap(w, h)
+        out.fill(Qt.transparent)
+
+        path = QPainterPath()
+        path.addRoundedRect(0, 0, w, h, radius, radius)
+
+        painter = QPainter(out)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setClipPath(path)
+        painter.drawPixmap(0, 0, pixmap)
+        painter.end()
+        return out
+
+    # --------------------------
+    # Styles
+    # --------------------------
+
+    def apply_styles(self):
+        self.setStyleSheet("""
+            QWidget#ManageModsPage { background: #09090b; }
+            QFrame#Sidebar { background: #09090b; border-right: 1px solid #27272a; }
+            QFrame#TabsHeader { background: #09090b; border-bottom: 1px solid #27272a; }
+
+            QPushButton#LinkButton { background: transparent; color: #a1a1aa; text-align: left; font-size: 13px; border: none; }
+            QPushButton#LinkButton:hover { color: white; }
+
+            QPushButton#CategoryBtn { background: transparent; color: #a1a1aa; border: none; border-radius: 8px; text-align: left; }
+            QPushButton#CategoryBtn:hover { background: #27272a; color: white; }
+            QPushButton#CategoryBtn:checked { background: #059669; color: white; }
+
+            QPushButton#IconButton {
+                background: rgba(63,63,70,0.7);
+                color: white;
+                border: 1px solid rgba(39,39,42,0.9);
+                border-radius: 12px;
+                font-weight: 800;
+            }
+            QPushButton#IconButton:hover { background: rgba(82,82,91,0.9); }
+
+            QPushButton#UpdateAllBtn { background: #059669; color: white; border: none; border-radius: 8px; font-weight: bold; font-size: 13px; }
+            QPushButton#UpdateAllBtn:hover { background: #10b981; }
+            QPushButton#UpdateAllBtn:disabled { background: #3f3f46; color: #a1a1aa; }
+
+            QPushButton#ModSetsBtn { background: #27272a; color: white; border: 1px solid #3f3f46; border-radius: 8px; font-weight: bold; font-size: 13px; }
+            QPushButton#ModSetsBtn:hover { background: #3f3f46; }
+
+            QMenu { background: #18181b; color: white; border: 1px solid #27272a; padding: 4px; }
+            QMenu::item { padding: 6px 20px; border-radius: 4px; }
+            QMenu::item:selected { background: #059669; }
+            QMenu::item:disabled { color: #71717a; }
+            QMenu::separator { height: 1px; background: #27272a; margin: 4px 8px; }
+
+            QPushButton#TabButtonActive { background: transparent; color: white; font-weight: bold; font-size: 14px; border: none; border-bottom: 2px solid #059669; padding-bottom: 14px; padding-top: 14px; margin-bottom: -1px; }
+            QPushButton#TabButtonInactive { background: transparent; color: #a1a1aa; font-weight: bold; font-size: 14px; border: none; border-bottom: 2px solid transparent; padding-bottom: 14px; padding-top: 14px; }
+            QPushButton#TabButtonInactive:hover { color: white; }
+
+            QLineEdit#SearchInput { background: #27272a; border: 1px solid #3f3f46; border-radius: 12px; color: white; padding: 12px 16px; font-size: 14px; }
+            QLineEdit#SearchInput:focus { border: 1px solid #059669; }
+        """)
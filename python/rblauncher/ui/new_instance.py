@@ -0,0 +1,983 @@
+import os
+import shutil
+
+from PyQt5.QtWidgets import (
+    QCheckBox, QFileDialog, QFrame, QGridLayout, QHBoxLayout, QLabel, QLineEdit, QMessageBox,
+    QPushButton, QScrollArea, QStackedWidget, QVBoxLayout, QWidget
+)
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import QTimer, Qt, pyqtSignal
+
+from http_client import HTTP
+
+from ..core import PROJECT_DIR, ICONS_DIR, IMAGES
+from ..network import ApiWorker
+from .widgets import WizardCard
+
+
+class NewInstancePage(QWidget):
+    created = pyqtSignal(dict) # Emits the final instance data
+    cancelled = pyqtSignal()   # Emits when user wants to go back to home
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("NewInstancePage")
+        
+        # State
+        self.step = 1
+        self.instance_type = "custom" 
+        self.selected_image_path = None  # <--- NEW: Store file path
+        
+        self.data = {
+            "name": "",
+            "version": None,
+            "loader": "vanilla",
+            "loader_version": None,
+            "modpack_info": None,
+            "modpack_version_id": None
+        }
+        self.modpack_results = []
+
+        # Search-as-you-type: typing restarts the timer; only the newest
+        # search (by generation) is ever rendered.
+        self._modpack_search_gen = 0
+        self._modpack_search_workers = []
+        self._modpack_search_timer = QTimer(self)
+        self._modpack_search_timer.setSingleShot(True)
+        self._modpack_search_timer.setInterval(350)
+        self._modpack_search_timer.timeout.connect(self.search_modpacks)
+        
+        self.init_ui()
+        self.apply_styles()
+
+    def init_ui(self):
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.setSpacing(0)
+
+        # --- 1. Header (Gradient Bar) ---
+        self.header = QFrame()
+        self.header.setObjectName("WizardHeader")
+        hl = QVBoxLayout(self.header)
+        hl.setContentsMargins(28, 20, 28, 20)
+        self.title_lbl = QLabel("Create New Instance")
+        self.title_lbl.setObjectName("WizardTitle")
+        self.subtitle_lbl = QLabel("Step 1 of 3")
+        self.subtitle_lbl.setObjectName("WizardSubtitle")
+        hl.addWidget(self.title_lbl)
+        hl.addWidget(self.subtitle_lbl)
+        main_layout.addWidget(self.header)
+
+        # --- 2. Progress Bar (Thin) ---
+        self.progress_container = QFrame()
+        self.progress_container.setObjectName("ProgressContainer")
+        pl = QHBoxLayout(self.progress_container)
+        pl.setContentsMargins(28, 0, 28, 0)
+        pl.setSpacing(4)
+        self.progress_bars = []
+        for i in range(3):
+            bar = QFrame()
+            bar.setFixedHeight(4)
+            bar.setObjectName("ProgressBarInactive")
+            self.progress_bars.append(bar)
+            pl.addWidget(bar)
+        main_layout.addWidget(self.progress_container)
+
+        # --- 3. Content Area (Stacked) ---
+        self.stack = QStackedWidget()
+        main_layout.addWidget(self.stack, 1)
+
+        # Step 1: Type & Name
+        self.page_step1 = self.build_step_1()
+        self.stack.addWidget(self.page_step1)
+
+        # Step 2: Custom (Game Version)
+        self.page_step2_custom = self.build_step_2_custom()
+        self.stack.addWidget(self.page_step2_custom)
+        
+        # Step 2: Modpack (Search)
+        self.page_step2_modpack = self.build_step_2_modpack()
+        self.stack.addWidget(self.page_step2_modpack)
+
+        # Step 3: Custom (Loader)
+        self.page_step3_custom = self.build_step_3_custom()
+        self.stack.addWidget(self.page_step3_custom)
+        
+        # Step 3: Modpack (Version Select)
+        self.page_step3_modpack = self.build_step_3_modpack()
+        self.stack.addWidget(self.page_step3_modpack)
+
+        # --- 4. Footer (Buttons) ---
+        self.footer = QFrame()
+        self.footer.setObjectName("WizardFooter")
+        fl = QHBoxLayout(self.footer)
+        fl.setContentsMargins(28, 20, 28, 20)
+        
+        self.btn_back = QPushButton("Cancel")
+        self.btn_back.setObjectName("SecondaryButton")
+        self.btn_back.clicked.connect(self.go_back)
+        
+        self.btn_next = QPushButton("Next")
+        self.btn_next.setObjectName("PrimaryButton")
+        self.btn_next.clicked.connect(self.go_next)
+        
+        fl.addWidget(self.btn_back)
+        fl.addStretch()
+        fl.addWidget(self.btn_next)
+        main_layout.addWidget(self.footer)
+
+        self.update_ui_state()
+
+    # ================= UI BUILDERS =================
+
+    def build_step_1(self):
+        w = QWidget()
+        lay = QVBoxLayout(w)
+        lay.setContentsMargins(40, 30, 40, 30)
+        lay.setSpacing(20)
+
+        # Type Selection
+        lbl = QLabel("Instance Type")
+        lbl.setObjectName("SectionLabel")
+        lay.addWidget(lbl)
+
+        cards_layout = QHBoxLayout()
+        cards_layout.setSpacing(15)
+        
+        # UPDATED: Use .icons/new.svg and .icons/quickmods.svg
+        # Ensure ICONS_DIR is available or use relative path string
+        icon_new = os.path.join(ICONS_DIR, "new.svg")
+        icon_mods = os.path.join(ICONS_DIR, "quickmods.svg")
+
+        self.card_custom = WizardCard(icon_new, "Custom Instance", "Build your own setup from scratch", "custom")
+        self.card_custom.setChecked(True)
+        self.card_custom.clicked.connect(lambda: self.set_type("custom"))
+        
+        self.card_modpack = WizardCard(icon_mods, "Import Modpack", "Install from Modrinth", "modpack")
+        self.card_modpack.clicked.connect(lambda: self.set_type("modpack"))
+
+        cards_layout.addWidget(self.card_custom)
+        cards_layout.addWidget(self.card_modpack)
+        lay.addLayout(cards_layout)
+
+        # Name Input
+        lbl_name = QLabel("Instance Name")
+        lbl_name.setObjectName("SectionLabel")
+        lay.addWidget(lbl_name)
+        
+        self.inp_name = QLineEdit()
+        self.inp_name.setPlaceholderText("My New Instance")
+        self.inp_name.setObjectName("WizardInput")
+        lay.addWidget(self.inp_name)
+
+        # Image Upload Area
+        # We wrap this in a QWidget so we can hide/show the whole block easily
+        self.upload_container = QWidget()
+        upload_lay = QVBoxLayout(self.upload_container)
+        upload_lay.setContentsMargins(0,0,0,0)
+        upload_lay.setSpacing(10)
+
+        lbl_icon = QLabel("Instance Icon")
+        lbl_icon.setObjectName("SectionLabel")
+        upload_lay.addWidget(lbl_icon)
+
+        img_row = QHBoxLayout()
+        img_row.setSpacing(15)
+        
+        self.img_preview = QLabel()
+        self.img_preview.setFixedSize(70, 70)
+        self.img_preview.setObjectName("ImagePreview")
+        self.img_preview.setStyleSheet("background: #27272a; border-radius: 12px; border: 1px dashed #52525b;")
+        self.img_preview.setAlignment(Qt.AlignCenter)
+        
+        btn_upload = QPushButton("Upload Image...")
+        btn_upload.setObjectName("SecondaryButton")
+        btn_upload.setCursor(Qt.PointingHandCursor)
+        btn_upload.clicked.connect(self.upload_image)
+        
+        img_row.addWidget(self.img_preview)
+        img_row.addWidget(btn_upload)
+        img_row.addStretch()
+        upload_lay.addLayout(img_row)
+        
+        lay.addWidget(self.upload_container) # Add container to main layout
+
+        lay.addStretch()
+        return w
+
+    def set_type(self, t):
+        self.instance_type = t
+        
+        # Toggle Card Selection Visuals
+        self.card_custom.setChecked(t == "custom")
+        self.card_modpack.setChecked(t == "modpack")
+        
+        # Toggle Upload Visibility
+        # If custom -> Show Upload. If modpack -> Hide Upload.
+        if hasattr(self, 'upload_container'):
+            self.upload_container.setVisible(t == "custom")
+            
+        self.update_ui_state()
+
+    def upload_image(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Select Icon", "", "Images (*.png *.jpg *.jpeg *.bmp *.gif)"
+        )
+        if path:
+            self.selected_image_path = path
+            # Update Preview
+            pm = QPixmap(path).scaled(
+                70, 70, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation
+            )
+            self.img_preview.setPixmap(pm)
+            # Remove dashed border when image is set
+            self.img_preview.setStyleSheet("background: transparent; border: none; border-radius: 12px;")
+
+    def build_step_2_custom(self):
+        w = QWidget()
+        lay = QVBoxLayout(w)
+        lay.setContentsMargins(40, 30, 40, 30)
+        
+        lbl = QLabel("Game Version")
+        lbl.setObjectName("SectionLabel")
+        lay.addWidget(lbl)
+
+        # --- UPDATED: Search & Filter Row ---
+        filter_row = QHBoxLayout()
+        
+        self.inp_version_search = QLineEdit()
+        self.inp_version_search.setPlaceholderText("Search versions...")
+        self.inp_version_search.setObjectName("WizardInput")
+        self.inp_version_search.textChanged.connect(self.filter_vanilla_list) # Connect search
+        
+        self.chk_snapshots = QCheckBox("Show Snapshots")
+        self.chk_snapshots.setStyleSheet("color: #a1a1aa; spacing: 8px;")
+        self.chk_snapshots.stateChanged.connect(self.filter_vanilla_list) # Connect toggle
+        
+        filter_row.addWidget(self.inp_version_search, 1)
+        filter_row.addWidget(self.chk_snapshots)
+        lay.addLayout(filter_row)
+        lay.addSpacing(10)
+        # ------------------------------------
+
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setObjectName("WizardScroll")
+        content = QWidget()
+        self.versions_layout = QVBoxLayout(content)
+        scroll.setWidget(content)
+        lay.addWidget(scroll)
+        
+        self.version_btns = [] 
+        self.all_vanilla_versions = [] # Store raw data for filtering
+        return w
+
+    # Logic to handle the API result and filtering
+    # ================= REPLACEMENT METHODS =================
+    def populate_vanilla_list(self, versions_data):
+        """
+        Receives list of dicts from ApiWorker: 
+        [{'id': '1.20.4', 'type': 'release'}, {'id': '24w04a', 'type': 'snapshot'}...]
+        """
+        # 1. Store the raw data
+        self.all_vanilla_versions = versions_data
+        
+        # 2. Trigger the filter to draw the UI
+        self.filter_vanilla_list()
+
+    def filter_vanilla_list(self):
+        """
+        Filters the stored data based on search text and snapshot toggle,
+        then draws the buttons.
+        """
+        # 1. Clear current list UI
+        while self.versions_layout.count():
+            item = self.versions_layout.takeAt(0)
+            if item.widget(): 
+                item.widget().deleteLater()
+            
+        self.version_btns = []
+        
+        # Safely get search text and toggle state
+        if hasattr(self, 'inp_version_search'):
+            search_txt = self.inp_version_search.text().lower()
+        else:
+            search_txt = ""
+            
+        if hasattr(self, 'chk_snapshots'):
+            show_snap = self.chk_snapshots.isChecked()
+        else:
+            show_snap = False
+        
+        # 2. Filter and Draw
+        count = 0
+        limit = 50 # Optimization: only show top 50 matches to prevent lag
+        
+        # Initialize if missing
+        if not hasattr(self, 'all_vanilla_versions'):
+            self.all_vanilla_versions = []
+
+        for v in self.all_vanilla_versions:
+            # EXTRACT DATA FROM DICT (Fixes the TypeError)
+            v_id = v.get("id", "Unknown")
+            v_type = v.get("type", "release")
+            
+            # Logic: Must match search AND (be release OR (be snapshot AND show_snap is true))
+            if search_txt in v_id.lower():
+                if v_type == "release" or (show_snap and v_type == "snapshot"):
+                    
+                    # Prepare text
+                    display_text = v_id
+                    if v_type == "snapshot":
+                        display_text = f"{v_id} (Snapshot)"
+
+                    # Create Button with STRING, not Dict
+                    btn = QPushButton(display_text)
+                    btn.setCheckable(True)
+                    btn.setObjectName("ListItem")
+                        
+                    # Restore selection if it was already selected
+                    if self.data.get("version") == v_id:
+                        btn.setChecked(True)
+                        
+                    # Connect click event
+                    btn.clicked.connect(lambda _, ver=v_id, b=btn: self.select_vanilla_version(ver, b))
+                    
+                    self.versions_layout.addWidget(btn)
+                    self.version_btns.append(btn)
+                    
+                    count += 1
+                    if count >= limit: 
+                        break
+
+    def build_step_2_modpack(self):
+        w = QWidget()
+        lay = QVBoxLayout(w)
+        lay.setContentsMargins(40, 30, 40, 30)
+        
+        # Search Bar
+        search_lay = QHBoxLayout()
+        self.inp_search = QLineEdit()
+        self.inp_search.setPlaceholderText("Search Modpacks on Modrinth...")
+        self.inp_search.setObjectName("WizardInput")
+        self.inp_search.returnPressed.connect(self.search_modpacks)
+        self.inp_search.textChanged.connect(self._modpack_search_timer.start)
+        
+        btn_search = QPushButton("Search")
+        btn_search.setObjectName("SecondaryButton")
+        btn_search.clicked.connect(self.search_modpacks)
+        
+        search_lay.addWidget(self.inp_search)
+        search_lay.addWidget(btn_search)
+        lay.addLayout(search_lay)
+        
+        lay.addSpacing(10)
+
+        # Results Grid
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setObjectName("WizardScroll")
+        content = QWidget()
+        self.modpack_grid = QGridLayout(content)
+        self.modpack_grid.setAlignment(Qt.AlignTop)
+        scroll.setWidget(content)
+        lay.addWidget(scroll)
+        
+        return w
+
+    def build_step_3_custom(self):
+        w = QWidget()
+        lay = QVBoxLayout(w)
+        lay.setContentsMargins(40, 30, 40, 30)
+
+        lbl = QLabel("Mod Loader")
+        lbl.setObjectName("SectionLabel")
+        lay.addWidget(lbl)
+        
+        self.loader_group = []
+        loaders = [
+            ("vanilla", "Vanilla", "Official Minecraft release"),
+            ("fabric", "Fabric", "Lightweight mod loader"),
+            # ("forge", "Forge", "Coming soon...") 
+        ]
+        
+        for lid, title, desc in loaders:
+            btn = QPushButton()
+            btn.setCheckable(True)
+            btn.setObjectName("LoaderItem")
+            btn.setFixedHeight(70)
+            btn.setCursor(Qt.PointingHandCursor)
+            
+            l = QVBoxLayout(btn)
+            t = QLabel(title)
+            t.setStyleSheet("font-weight: bold; font-size: 15px; color: white; background: transparent;")
+            d = QLabel(desc)
+            d.setStyleSheet("color: #a1a1aa; font-size: 12px; background: transparent;")
+            l.addWidget(t)
+            l.addWidget(d)
+            
+            btn.clicked.connect(lambda _, x=lid: self.set_loader(x))
+            lay.addWidget(btn)
+            self.loader_group.append((lid, btn))
+            
+        self.loader_group[0][1].setChecked(True)
+        lay.addStretch()
+        return w
+
+    def build_step_3_modpack(self):
+        w = QWidget()
+        lay = QVBoxLayout(w)
+        lay.setContentsMargins(40, 30, 40, 30)
+        
+        # Modpack Info Preview
+        self.mp_preview = QFrame()
+        self.mp_preview.setObjectName("ModpackPreview")
+        pl = QHBoxLayout(self.mp_preview)
+        
+        self.mp_icon = QLabel()
+        self.mp_icon.setFixedSize(64, 64)
+        self.mp_icon.setScaledContents(True)
+        self.mp_icon.setStyleSheet("background: #27272a; border-radius: 8px;")
+        
+        info_l = QVBoxLayout()
+        self.mp_title = QLabel("Title")
+        self.mp_title.setStyleSheet("font-size: 18px; font-weight: bold; color: white;")
+        self.mp_author = QLabel("Author")
+        self.mp_author.setStyleSheet("color: #a1a1aa;")
+        info_l.addWidget(self.mp_title)
+        info_l.addWidget(self.mp_author)
+        
+        pl.addWidget(self.mp_icon)
+        pl.addLayout(info_l)
+        pl.addStretch()
+        
+        lay.addWidget(self.mp_preview)
+        lay.addSpacing(20)
+        
+        lbl = QLabel("Select Version")
+        lbl.setObjectName("SectionLabel")
+        lay.addWidget(lbl)
+        
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setObjectName("WizardScroll")
+        content = QWidget()
+        self.mp_versions_layout = QVBoxLayout(content)
+        scroll.setWidget(content)
+        lay.addWidget(scroll)
+        
+        return w
+
+    # ================= LOGIC & FLOW =================
+
+    def set_icon(self, char):
+        self.data["icon"] = char
+        for btn in self.icon_buttons:
+            btn.setChecked(btn.text() == char)
+
+    def set_loader(self, loader):
+        self.data["loader"] = loader
+        for lid, btn in self.loader_group:
+            btn.setChecked(lid == loader)
+
+    def go_next(self):
+        # Validation
+        if self.step == 1:
+            if not self.inp_name.text().strip():
+                # Provide default if empty
+                self.inp_name.setText("New Instance")
+            self.data["name"] = self.inp_name.text()
+            
+            # Branching
+            if self.instance_type == "custom":
+                self.step = 2
+                self.stack.setCurrentWidget(self.page_step2_custom)
+                if not self.data["version"]:
+                    self.fetch_vanilla()
+            else:
+                self.step = 2
+                self.stack.setCurrentWidget(self.page_step2_modpack)
+                # Load default modpacks if empty
+                if not self.modpack_results:
+                    self.search_modpacks()
+
+        elif self.step == 2:
+            if self.instance_type == "custom":
+                if not self.data["version"]:
+                    QMessageBox.warning(self, "Selection Required", "Please select a game version.")
+                    return
+                self.step = 3
+                self.stack.setCurrentWidget(self.page_step3_custom)
+            else:
+                if not self.data["modpack_info"]:
+                    QMessageBox.warning(self, "Selection Required", "Please select a modpack.")
+                    return
+                self.step = 3
+                self.stack.setCurrentWidget(self.page_step3_modpack)
+                self.fetch_modpack_versions()
+
+        elif self.step == 3:
+            # Finish
+            self.finish()
+            return
+
+        self.update_ui_state()
+
+    def go_back(self):
+        if self.step == 1:
+            self.cancelled.emit()
+        else:
+            self.step -= 1
+            if self.step == 1:
+                self.stack.setCurrentWidget(self.page_step1)
+            elif self.step == 2:
+                if self.instance_type == "custom":
+                    self.stack.setCurrentWidget(self.page_step2_custom)
+                else:
+                    self.stack.setCurrentWidget(self.page_step2_modpack)
+        self.update_ui_state()
+
+    def update_ui_state(self):
+        # Progress Bars
+        for i, bar in enumerate(self.progress_bars):
+            if i < self.step:
+                bar.setObjectName("ProgressBarActive")
+            else:
+                bar.setObjectName("ProgressBarInactive")
+            # Force style refresh
+            bar.style().unpolish(bar)
+            bar.style().polish(bar)
+            
+        self.subtitle_lbl.setText(f"Step {self.step} of 3")
+        
+        # Button text
+        if self.step == 1:
+            self.btn_back.setText("Cancel")
+            self.btn_next.setText("Next")
+        elif self.step == 3:
+            self.btn_next.setText("Create Instance" if self.instance_type=="custom" else "Install")
+        else:
+            self.btn_back.setText("Back")
+            self.btn_next.setText("Next")
+
+    # ================= DATA FETCHING =================
+
+    def fetch_vanilla(self):
+        # Clear existing
+        while self.versions_layout.count():
+            item = self.versions_layout.takeAt(0)
+            if item.widget(): item.widget().deleteLater()
+            
+        lbl = QLabel("Loading versions...")
+        lbl.setStyleSheet("color: #a1a1aa; padding: 20px;")
+        self.versions_layout.addWidget(lbl)
+        
+        self.worker = ApiWorker("vanilla")
+        self.worker.data_ready.connect(self.populate_vanilla_list)
+        self.worker.start()
+
+    def select_vanilla_version(self, version, btn):
+        self.data["version"] = version
+        for b in self.version_btns:
+            b.setChecked(b == btn)
+
+    def search_modpacks(self):
+        self._modpack_search_timer.stop()
+        query = self.inp_search.text().strip()
+        self._modpack_search_gen += 1
+        
+        # clear grid
+        while self.modpack_grid.count():
+            item = self.modpack_grid.takeAt(0)
+            if item.widget(): item.widget().deleteLater()
+            
+        loading = QLabel("Searching Modrinth...")
+        loading.setStyleSheet("color: #a1a1aa;")
+        self.modpack_grid.addWidget(loading, 0, 0)
+        
+        # Older searches can't be interrupted mid-request; they finish and get
+        # dropped in on_modpack_results. Keep them referenced until then.
+        worker = ApiWorker("modpack_search", query)
+        worker.generation = self._modpack_search_gen
+        worker.data_ready.connect(self.on_modpack_results)
+        worker.error.connect(self.on_modpack_results_error)
+        worker.finished.connect(self._release_modpack_search_workers)
+        self._modpack_search_workers.append(worker)
+        worker.start()
+
+    def _release_modpack_search_workers(self):
+        self._modpack_search_workers = [w for w in self._modpack_search_workers if not w.isFinished()]
+
+    def on_modpack_results(self, results):
+        if getattr(self.sender(), "generation", None) != self._modpack_search_gen:
+            return
+        self.populate_modpack_grid(results)
+
+    def on_modpack_results_error(self, msg):
+        if getattr(self.sender(), "generation", None) != self._modpack_search_gen:
+            return
+        print("Modpack search error:", msg)
+        self.populate_modpack_grid([])
+
+    def populate_modpack_grid(self, results):
+        # Clear loading
+        while self.modpack_grid.count():
+            item = self.modpack_grid.takeAt(0)
+            if item.widget(): item.widget().deleteLater()
+            
+        self.modpack_results = results
+        self.modpack_btns = []
+        
+        row, col = 0, 0
+        for info in results:
+            # Card-like button
+            btn = QPushButton()
+            btn.setCheckable(True)
+            btn.setFixedSize(190, 220)
+            btn.setObjectName("ModpackCard")
+            
+            l = QVBoxLayout(btn)
+            l.setContentsMargins(10, 10, 10, 10)
+            
+            # Icon Label
+            ico = QLabel()
+            ico.setFixedSize(60, 60)
+            ico.setStyleSheet("background: #3f3f46; border-radius: 8px;")
+            ico.setAlignment(Qt.AlignCenter)
+            
+            # --- IMAGE LOADING LOGIC ---
+            url = info.get('icon_url')
+            if url:
+                # Shared loader: painted at once if it's been seen before
+                IMAGES.set_label(ico, url, 60, 8)
+            else:
+                # Fallback if no URL
+                ico.setText("?")
+                ico.setStyleSheet("background: #3f3f46; border-radius: 8px; color: #71717a; font-size: 24px; font-weight: bold;")
+            # ---------------------------
+
+            title = QLabel(info['title'])
+            title.setWordWrap(True)
+            title.setStyleSheet("font-weight: bold; color: white; background: transparent;")
+            title.setAlignment(Qt.AlignHCenter)
+            
+            auth = QLabel(f"by {info['author']}")
+            auth.setStyleSheet("color: #a1a1aa; font-size: 11px; background: transparent;")
+            auth.setAlignment(Qt.AlignHCenter)
+
+            desc = QLabel(info['desc'][:60] + "..." if info['desc'] else "")
+            desc.setWordWrap(True)
+            desc.setStyleSheet("color: #71717a; font-size: 10px; background: transparent;")
+            desc.setAlignment(Qt.AlignHCenter | Qt.AlignTop)
+            
+            l.addWidget(ico, 0, Qt.AlignHCenter)
+            l.addWidget(title)
+            l.addWidget(auth)
+            l.addWidget(desc)
+            l.addStretch()
+            
+            btn.clicked.connect(lambda _, i=info, b=btn: self.select_modpack(i, b))
+            
+            self.modpack_grid.addWidget(btn, row, col)
+            self.modpack_btns.append(btn)
+            
+            col += 1
+            if col > 3: # 4 columns
+                col = 0
+                row += 1
+
+    def select_modpack(self, info, btn):
+        # 1. Get the currently displayed text
+        current_name = self.inp_name.text().strip()
+        
+        # 2. Check if we should auto-update the name.
+        # We update if:
+        #   a) The name is still the generic "New Instance"
+        #   b) OR the name matches the PREVIOUS modpack's title (meaning the user hasn't manually typed a custom name)
+        should_update = False
+        
+        if current_name == "New Instance" or not current_name:
+            should_update = True
+        elif self.data.get("modpack_info") and current_name == self.data["modpack_info"].get("title"):
+            should_update = True
+
+        # 3. Update data
+        if should_update:
+            self.inp_name.setText(info['title'])
+            self.data["name"] = info['title']
+
+        self.data["modpack_info"] = info
+            
+        # 4. Visual selection update
+        for b in self.modpack_btns:
+            b.setChecked(b == btn)
+
+    def clear_layout(self, layout):
+        if hasattr(layout, 'count'):
+            while layout.count():
+                item = layout.takeAt(0)
+                if item.widget():
+                    item.widget().deleteLater()
+
+    def fetch_modpack_versions(self):
+        info = self.data["modpack_info"]
+        
+        # 1. Update Text Info
+        self.mp_title.setText(info['title'])
+        self.mp_author.setText(f"by {info['author']}")
+        
+        # 2. Async Load Icon
+        url = info.get("icon_url")
+        if url:
+            IMAGES.set_label(self.mp_icon, url, 64, 8,
+                             placeholder_style="background: #27272a; border-radius: 8px;")
+        else:
+            # Fallback
+            IMAGES.set_label(self.mp_icon, None, 64)
+            self.mp_icon.clear()
+            self.mp_icon.setText("?")
+            self.mp_icon.setStyleSheet("background: #27272a; border-radius: 8px; color: #71717a; font-size: 24px; font-weight: bold;")
+            self.mp_icon.setAlignment(Qt.AlignCenter)
+
+        # 3. Start fetching versions
+        self.clear_layout(self.mp_versions_layout)
+        self.mp_versions_layout.addWidget(QLabel("Loading versions...", styleSheet="color:#a1a1aa;"))
+        self.worker = ApiWorker("modpack_versions", info['id'])
+        self.worker.data_ready.connect(self.populate_modpack_versions)
+        self.worker.start()
+
+    def populate_modpack_versions(self, versions):
+        while self.mp_versions_layout.count():
+            item = self.mp_versions_layout.takeAt(0)
+            if item.widget(): item.widget().deleteLater()
+            
+        self.mp_ver_btns = []
+        for v in versions:
+            v_num = v['version_number']
+            v_name = v.get('name', v_num)
+            mc_ver = v['game_versions'][0] if v['game_versions'] else "Unknown"
+            loader = v['loaders'][0] if v['loaders'] else "Unknown"
+            
+            btn = QPushButton()
+            btn.setCheckable(True)
+            btn.setObjectName("ListItem")
+            btn.setFixedHeight(50)
+            
+            l = QHBoxLayout(btn)
+            l.addWidget(QLabel(v_name, styleSheet="color: white; font-weight: bold; background: transparent;"))
+            l.addStretch()
+            l.addWidget(QLabel(f"{mc_ver} • {loader}", styleSheet="color: #a1a1aa; background: transparent;"))
+            
+            # Store full version object to get file url later
+            btn.clicked.connect(lambda _, ver_obj=v, b=btn: self.select_modpack_version(ver_obj, b))
+            
+            self.mp_versions_layout.addWidget(btn)
+            self.mp_ver_btns.append(btn)
+
+    def select_modpack_version(self, ver_obj, btn):
+        self.data["modpack_version_id"] = ver_obj # Store full object
+        for b in self.mp_ver_btns:
+            b.setChecked(b == btn)
+
+    def finish(self):
+        # 1. Prepare Image Data (Default fallback)
+        image_data = "🟩" 
+        
+        # Check 1: User uploaded custom image (Local File)
+        if self.selected_image_path and os.path.exists(self.selected_image_path):
+            try:
+                icons_dir = os.path.join(PROJECT_DIR, ".icons")
+                os.makedirs(icons_dir, exist_ok=True)
+                
+                ext = os.path.splitext(self.selected_image_path)[1]
+                safe_name = self.data["name"].lower().replace(" ", "_")
+                filename = f"{safe_name}{ext}"
+                
+                saved_path = os.path.join(".icons", filename)
+                abs_dest = os.path.join(PROJECT_DIR, saved_path)
+                
+                shutil.copy2(self.selected_image_path, abs_dest)
+                
+                image_data = {
+                    "original_path": self.selected_image_path,
+                    "saved_path": saved_path
+                }
+            except Exception as e:
+                print(f"Failed to save custom image: {e}")
+
+        # Check 2: Modpack icon (Download asynchronously)
+        elif self.instance_type == "modpack" and self.data["modpack_info"]:
+            mp_info = self.data["modpack_info"]
+            icon_url = mp_info.get("icon_url")
+            
+            if icon_url:
+                try:
+                    icons_dir = os.path.join(PROJECT_DIR, ".icons")
+                    os.makedirs(icons_dir, exist_ok=True)
+                    
+                    ext = os.path.splitext(icon_url)[1]
+                    if not ext or len(ext) > 5: ext = ".png"
+                    
+                    safe_name = self.data["name"].lower().replace(" ", "_")
+                    filename = f"{safe_name}{ext}"
+                    
+                    saved_path = os.path.join(".icons", filename)
+                    abs_dest = os.path.join(PROJECT_DIR, saved_path)
+                    
+                    cached = IMAGES.cached_file(icon_url)
+                    if cached:
+                        # Already downloaded for the modpack card
+                        shutil.copyfile(cached, abs_dest)
+                        image_data = {
+                            "original_path": icon_url,
+                            "saved_path": saved_path
+                        }
+                    else:
+                        print(f"Downloading icon from {icon_url}...")
+                        r = HTTP.get(icon_url, kind="image")
+                        if r.ok:
+                            with open(abs_dest, 'wb') as f:
+                                f.write(r.content)
+
+                            image_data = {
+                                "original_path": icon_url,
+                                "saved_path": saved_path
+                            }
+                        else:
+                            print(f"Download Error: HTTP {r.status_code}")
+
+                except Exception as e:
+                    print(f"Failed to save modpack image: {e}")
+
+        # 2. Build Final Data
+        final_data = {}
+        
+        if self.instance_type == "custom":
+            is_fabric = self.data["loader"] == "fabric"
+
+            final_data = {
+                "type": "Custom",
+                "name": self.data["name"],
+                "version": self.data["version"],
+                "modloader": "Fabric" if self.data["loader"] == "fabric" else "Vanilla",
+                "loader_version": "latest" if is_fabric else None,
+                "fabric_version": "latest" if is_fabric else None,
+                "image": image_data,
+                "last_played": None
+            }
+        else:
+            # Modpack logic
+            mp_info = self.data["modpack_info"]
+            mp_ver = self.data["modpack_version_id"]
+            
+            if not mp_ver:
+                 QMessageBox.warning(self, "Error", "No version selected")
+                 return
+                 
+            files = mp_ver.get("files", [])
+            primary_file = next((f for f in files if f.get("primary")), files[0] if files else None)
+            
+            if not primary_file:
+                QMessageBox.critical(self, "Error", "Modpack has no files to download.")
+                return
+
+            final_data = {
+                "type": "Modrinth",
+                "name": self.data["name"],
+                "version": mp_ver['game_versions'][0],
+                "modloader": mp_ver['loaders'][0].capitalize(),
+                "image": image_data, # Use the downloaded image data
+                "modpack_url": primary_file['url'],
+                "modpack_hash": primary_file['hashes']['sha1'],
+                "last_played": None
+            }
+
+        self.created.emit(final_data)
+        
+        # Reset wizard
+        self.step = 1
+        self.inp_name.clear()
+        self.selected_image_path = None
+        self.img_preview.clear()
+        self.img_preview.setStyleSheet("background: #27272a; border-radius: 12px; border: 1px dashed #52525b;")
+        self.stack.setCurrentWidget(self.page_step1)
+        self.update_ui_state()
+
+    # ================= STYLES =================
+    
+    def apply_styles(self):
+        self.setStyleSheet("""
+
+            QWidget#NewInstancePage { background: #09090b; }
+            QFrame#WizardHeader { 
+                background: #09090b; 
+                border-bottom: 1px solid #27272a; 
+            }
+            QLabel#WizardTitle { font-size: 24px; font-weight: bold; color: white; background: transparent; }
+            QLabel#WizardSubtitle { font-size: 14px; color: #ffffff; background: transparent; }
+            
+            QFrame#ProgressContainer { background: #18181b; }
+            QFrame#ProgressBarActive { background: #10b981; border-radius: 2px; }
+            QFrame#ProgressBarInactive { background: #3f3f46; border-radius: 2px; }
+            
+            QFrame#WizardFooter { background: #18181b; border-top: 1px solid #27272a; }
+            
+            QLabel#SectionLabel { font-size: 16px; font-weight: bold; color: white; margin-bottom: 8px; }
+            
+            QPushButton#WizardCard {
+                background: #27272a; border: 2px solid transparent; border-radius: 16px; text-align: left;
+            }
+            QPushButton#WizardCard:checked {
+                background: #059669; border: 2px solid #34d399;
+            }
+            QPushButton#WizardCard:hover:!checked {
+                background: #3f3f46;
+            }
+            
+            QLineEdit#WizardInput {
+                background: #27272a; border: 1px solid #3f3f46; border-radius: 12px;
+                color: white; padding: 12px; font-size: 14px;
+            }
+            QLineEdit#WizardInput:focus { border: 1px solid #10b981; }
+            
+            QPushButton#IconBtn { background: #27272a; border-radius: 8px; font-size: 20px; border: none; }
+            QPushButton#IconBtn:checked { background: #059669; }
+            QPushButton#IconBtn:hover:!checked { background: #3f3f46; }
+            
+            QPushButton#PrimaryButton {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #059669, stop:1 #0d9488);
+                color: white; border-radius: 12px; padding: 10px 24px; font-weight: bold; font-size: 14px; border: none;
+            }
+            QPushButton#PrimaryButton:hover { background: #10b981; }
+            
+            QPushButton#SecondaryButton {
+                background: #3f3f46; color: white; border-radius: 12px; padding: 10px 24px; font-weight: bold; border: none;
+            }
+            QPushButton#SecondaryButton:hover { background: #52525b; }
+            
+            QScrollArea#WizardScroll { border: none; background: transparent; }
+            QScrollArea#WizardScroll QWidget { background: transparent; }
+            
+            QPushButton#ListItem {
+                background: #27272a; border: 1px solid transparent; border-radius: 10px; color: white; text-align: left; padding: 10px;
+            }
+            QPushButton#ListItem:checked {
+                background: #059669; border: 1px solid #34d399;
+            }
+            QPushButton#ListItem:hover:!checked { background: #3f3f46; }
+            
+            QPushButton#LoaderItem {
+                background: #27272a; border: 2px solid transparent; border-radius: 12px; text-align: left; padding: 0 15px;
+            }
+            QPushButton#LoaderItem:checked {
+                background: #059669; border: 2px solid #34d399;
+            }
+            
+            QPushButton#ModpackCard {
+                background: #27272a; border: 2px solid transparent; border-radius: 16px;
+            }
+            QPushButton#ModpackCard:checked {
+                background: #059669; border: 2px solid #34d399;
+            }
+            QPushButton#ModpackCard:hover:!checked { background: #3f3f46; }
+        """)
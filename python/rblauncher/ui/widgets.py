@@ -0,0 +1,99 @@
+import os
+
+from PyQt5.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QVBoxLayout
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import Qt
+
+from ..core import SVG_ICONS
+
+
+class WizardCard(QPushButton):
+    """A large selectable card (custom vs modpack) with SVG support."""
+    def __init__(self, icon_path, title, subtitle, value, parent=None):
+        super().__init__(parent)
+        self.value = value
+        self.setCheckable(True)
+        self.setCursor(Qt.PointingHandCursor)
+        self.setFixedHeight(140)
+        self.setObjectName("WizardCard")
+        
+        # Layout
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(20, 20, 20, 20)
+        lay.setSpacing(10)
+        
+        # Icon (Pixmap)
+        self.icon_lbl = QLabel()
+        self.icon_lbl.setFixedSize(40, 40)
+        self.icon_lbl.setStyleSheet("background: transparent; border: none;")
+        self.icon_lbl.setScaledContents(True)
+        
+        # Load Icon
+        # Load Icon
+        if icon_path and os.path.exists(icon_path) and icon_path.lower().endswith(".svg"):
+            self.icon_lbl.setPixmap(SVG_ICONS.pixmap(icon_path, size=40, color="#ffffff"))
+        elif os.path.exists(icon_path):
+            pm = QPixmap(icon_path)
+            if not pm.isNull():
+                self.icon_lbl.setPixmap(pm)
+        else:
+            self.icon_lbl.setText("?")
+
+        
+        # Title
+        self.title_lbl = QLabel(title)
+        self.title_lbl.setStyleSheet("font-size: 18px; font-weight: bold; background: transparent; border: none; color: white;")
+        
+        # Subtitle
+        self.sub_lbl = QLabel(subtitle)
+        self.sub_lbl.setWordWrap(True)
+        self.sub_lbl.setStyleSheet("font-size: 13px; color: #a1a1aa; background: transparent; border: none;")
+        
+        lay.addWidget(self.icon_lbl)
+        lay.addWidget(self.title_lbl)
+        lay.addWidget(self.sub_lbl)
+        lay.addStretch()
+
+# ================= WORKERS (Ported from old code) =================
+
+
+# ---------- Helper widgets ----------
+class Card(QFrame):
+    def __init__(self, title: str, value: str):
+        super().__init__()
+        self.setObjectName("Card")
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(16, 16, 16, 16)
+        lay.setSpacing(6)
+        self.title = QLabel(title)
+        self.title.setObjectName("CardTitle")
+        self.value = QLabel(value)
+        self.value.setObjectName("CardValue")
+        lay.addWidget(self.title)
+        lay.addWidget(self.value)
+
+
+class SectionRow(QFrame):
+    """A row like: [title/subtitle] .... [action button]"""
+    def __init__(self, title: str, subtitle: str, action_text: str, action_cb=None):
+        super().__init__()
+        self.setObjectName("SectionRow")
+        lay = QHBoxLayout(self)
+        lay.setContentsMargins(0, 10, 0, 10)
+
+        left = QVBoxLayout()
+        left.setSpacing(2)
+        self.title = QLabel(title)
+        self.title.setObjectName("RowTitle")
+        self.subtitle = QLabel(subtitle)
+        self.subtitle.setObjectName("RowSubtitle")
+        left.addWidget(self.title)
+        left.addWidget(self.subtitle)
+
+        lay.addLayout(left, 1)
+
+        self.btn = QPushButton(action_text)
+        self.btn.setObjectName("LinkButton")
+        if action_cb:
+            self.btn.clicked.connect(action_cb)
+        lay.addWidget(self.btn, 0, Qt.AlignRight)
@@ -18,6 +18,20 @@ info()    { echo -e "${GREEN}[INFO]${NC} $1"; }
 warn()    { echo -e "${YELLOW}[WARN]${NC} $1"; }
 error()   { echo -e "${RED}[ERROR]${NC} $1" >&2; }
 
+# Upstream base URLs. RBL_STANDIN=http://host:port sends every download to the
+# local stand-in (python/standin_server.py); RBL_URL_<HOST> overrides one host,
+# e.g. RBL_URL_PISTON_META_MOJANG_COM. Same rules as http_client.base_url.
+rbl_base() {
+    local var="RBL_URL_$(echo "$1" | tr 'a-z.-' 'A-Z__')"
+    if [ -n "${!var}" ]; then echo "${!var%/}"
+    elif [ -n "$RBL_STANDIN" ]; then echo "${RBL_STANDIN%/}/$1"
+    else echo "https://$1"; fi
+}
+rbl_url() {
+    local rest="${1#https://}"
+    echo "$(rbl_base "${rest%%/*}")/${rest#*/}"
+}
+
 # Arguments
 MINECRAFT_VERSION=$1
 JAVA_PATH=$2
@@ -56,7 +70,7 @@ mkdir -p "$LIBRARIES_DIR"
 # 2. Get Manifest & Version
 MANIFEST_FILE="$MODRINTH_DIR/version_manifest.json"
 info "Downloading version manifest..."
-curl -fsSL "https://piston-meta.mojang.com/mc/game/version_manifest.json" -o "$MANIFEST_FILE"
+curl -fsSL "$(rbl_url https://piston-meta.mojang.com/mc/game/version_manifest.json)" -o "$MANIFEST_FILE"
 
 if [ -z "$MINECRAFT_VERSION" ]; then
     MINECRAFT_VERSION=$(python3 -c "import json; print(json.load(open('$MANIFEST_FILE'))['latest']['release'])")
@@ -74,13 +88,13 @@ for v in json.load(open('$MANIFEST_FILE'))['versions']:
     if v['id'] == '$MINECRAFT_VERSION':
         print(v['url']); break
 ")
-curl -fsSL "$VERSION_URL" -o "$VERSION_JSON"
+curl -fsSL "$(rbl_url "$VERSION_URL")" -o "$VERSION_JSON"
 
 # 4. Download Client JAR
 CLIENT_JAR="$VERSION_DIR/$MINECRAFT_VERSION.jar"
 CLIENT_URL=$(python3 -c "import json; print(json.load(open('$VERSION_JSON'))['downloads']['client']['url'])")
 info "Downloading Client JAR..."
-curl -fsSL "$CLIENT_URL" -o "$CLIENT_JAR"
+curl -fsSL "$(rbl_url "$CLIENT_URL")" -o "$CLIENT_JAR"
 
 # 5. Handle Natives (MinecraftNativesDownloader)
 NATIVES_DIR="$VERSION_DIR/natives"
@@ -115,6 +129,15 @@ fi
 cat > /tmp/mc_downloader.py << 'EOF'
 import json, os, sys, urllib.request, hashlib, concurrent.futures, ssl, certifi
 
+def resolve(url):
+    # scripts/rbl_url, for URLs read out of JSON
+    if not url.startswith('https://'): return url
+    host, _, rest = url[8:].partition('/')
+    override = os.environ.get('RBL_URL_' + host.upper().replace('.', '_').replace('-', '_'))
+    if override: return override.rstrip('/') + '/' + rest
+    if os.environ.get('RBL_STANDIN'): return os.environ['RBL_STANDIN'].rstrip('/') + '/' + host + '/' + rest
+    return url
+
 def download(url, path, sha1=None):
     try:
         os.makedirs(os.path.dirname(path), exist_ok=True)
@@ -123,7 +146,7 @@ def download(url, path, sha1=None):
                 if hashlib.sha1(f.read()).hexdigest() == sha1: return True
         
         ctx = ssl.create_default_context(cafile=certifi.where())
-        with urllib.request.urlopen(url, context=ctx) as r, open(path, 'wb') as f:
+        with urllib.request.urlopen(resolve(url), context=ctx) as r, open(path, 'wb') as f:
             f.write(r.read())
         return True
     except Exception as e:
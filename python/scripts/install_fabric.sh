@@ -10,6 +10,20 @@ NC='\033[0m'
 info() { echo -e "${GREEN}[INFO]${NC} $1"; }
 error() { echo -e "${RED}[ERROR]${NC} $1" >&2; }
 
+# Upstream base URLs. RBL_STANDIN=http://host:port sends every download to the
+# local stand-in (python/standin_server.py); RBL_URL_<HOST> overrides one host,
+# e.g. RBL_URL_PISTON_META_MOJANG_COM. Same rules as http_client.base_url.
+rbl_base() {
+    local var="RBL_URL_$(echo "$1" | tr 'a-z.-' 'A-Z__')"
+    if [ -n "${!var}" ]; then echo "${!var%/}"
+    elif [ -n "$RBL_STANDIN" ]; then echo "${RBL_STANDIN%/}/$1"
+    else echo "https://$1"; fi
+}
+rbl_url() {
+    local rest="${1#https://}"
+    echo "$(rbl_base "${rest%%/*}")/${rest#*/}"
+}
+
 MC_VERSION=$1
 FABRIC_VERSION=$2
 JAVA_PATH=$3
@@ -28,8 +42,9 @@ mkdir -p "$FABRIC_DIR"
 mkdir -p "$LIBRARIES_DIR"
 
 # 3. Download/Run Fabric Installer to generate JSON
+# (the installer itself still asks meta.fabricmc.net for the profile)
 INSTALLER_JAR="$APP_SUPPORT/fabric-installer.jar"
-curl -fsSL "https://maven.fabricmc.net/net/fabricmc/fabric-installer/1.0.3/fabric-installer-1.0.3.jar" -o "$INSTALLER_JAR"
+curl -fsSL "$(rbl_url https://maven.fabricmc.net/net/fabricmc/fabric-installer/1.0.3/fabric-installer-1.0.3.jar)" -o "$INSTALLER_JAR"
 
 JAVA_CMD="${JAVA_PATH:-java}"
 info "Running Fabric Installer..."
@@ -51,7 +66,7 @@ import json, os, urllib.request
 with open('$FABRIC_JSON') as f: data = json.load(f)
 libs = data.get('libraries', [])
 
-base_url = 'https://maven.fabricmc.net/'
+base_url = '$(rbl_base maven.fabricmc.net)/'
 mav_url = 'https://repo1.maven.org/maven2/'
 
 for lib in libs:
@@ -63,7 +78,7 @@ for lib in libs:
     if not os.path.exists(local_path):
         print(f'Downloading {name}...')
         os.makedirs(os.path.dirname(local_path), exist_ok=True)
-        url = lib.get('url', base_url) + path
+        url = lib.get('url', base_url).replace('https://maven.fabricmc.net/', base_url) + path
         try:
             urllib.request.urlretrieve(url, local_path)
         except:
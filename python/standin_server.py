@@ -0,0 +1,713 @@
+"""
+Local stand-in for the services the launcher downloads from, so install,
+search and update paths can be exercised (and benchmarked) without the
+internet.
+
+    python standin_server.py --port 8765 [--latency 80] [--bandwidth 512] ...
+    RBL_STANDIN=http://127.0.0.1:8765 python new_launcher.py
+
+Requests arrive as /<upstream host>/<path> (see http_client.resolve and
+the rbl_url helper in scripts/). Every host has a synthetic implementation:
+a small Mojang version manifest with client jars, libraries and assets; the
+Fabric meta/maven endpoints; and a generated Modrinth catalog (search,
+projects, versions, teams, hash lookups, icons, jars and .mrpack files) whose
+jars carry a real fabric.mod.json and whose hashes all check out.
+
+A file under --fixtures DIR/<host>/<path> is served instead of the synthetic
+answer; --record fills that directory from the real services on a miss.
+
+Faults (all optional, also settable at runtime with
+POST /__standin/faults {"latency_ms": 200, ...}):
+    --latency / --jitter   ms added before every response
+    --bandwidth            KiB/s per response body
+    --rate-429             fraction of requests answered 429 (with X-Ratelimit-*)
+    --truncate             fraction of bodies cut off half way
+GET /__standin/stats returns request counts per host.
+"""
+import io
+import os
+import sys
+import json
+import time
+import zlib
+import random
+import struct
+import hashlib
+import zipfile
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+MC_VERSIONS = ["1.21.1", "1.20.1"]
+LOADER_VERSIONS = ["0.16.5", "0.15.11"]
+WORDS = ("sodium lithium iris create farm storage map mini world ore biome dungeon quest mob "
+         "tool armor food craft tech magic sky cave light fast better simple more extra").split()
+CATEGORIES = ["utility", "optimization", "decoration", "technology", "magic", "adventure", "storage"]
+FIXED_DATE = (2024, 1, 1, 0, 0, 0)
+
+
+def _blob(seed, size):
+    """size deterministic, incompressible bytes for seed."""
+    out = bytearray()
+    counter = 0
+    while len(out) < size:
+        out += hashlib.sha256(f"{seed}:{counter}".encode()).digest()
+        counter += 1
+    return bytes(out[:size])
+
+
+def _jar(entries, padding_seed=None, padding=0):
+    """A zip with fixed timestamps (so the bytes, and their hashes, are stable)."""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
+        for name, data in entries:
+            z.writestr(zipfile.ZipInfo(name, FIXED_DATE), data)
+        if padding:
+            info = zipfile.ZipInfo("assets/standin/padding.bin", FIXED_DATE)
+            z.writestr(info, _blob(padding_seed, padding), compress_type=zipfile.ZIP_STORED)
+    return buf.getvalue()
+
+
+def _png(seed, size=64):
+    """A flat-colour PNG, colour picked by seed."""
+    r, g, b = hashlib.md5(seed.encode()).digest()[:3]
+    row = b"\x00" + bytes([r, g, b]) * size
+    raw = zlib.compress(row * size)
+
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", raw) + chunk(b"IEND", b""))
+
+
+def _hashes(data):
+    return {"sha1": hashlib.sha1(data).hexdigest(), "sha512": hashlib.sha512(data).hexdigest()}
+
+
+class NotFound(Exception):
+    pass
+
+
+# ---------------------------
+# Synthetic upstreams
+# ---------------------------
+
+class Upstreams:
+    """Deterministic fake Mojang, Fabric and Modrinth, generated from a seed."""
+
+    def __init__(self, seed=1, mods=300, modpacks=30, jar_kb=64, assets=300):
+        self.rng = random.Random(seed)
+        self.jar_kb = jar_kb
+        self._build_mojang(assets)
+        self._build_modrinth(mods, modpacks)
+
+    # ---- Mojang ----
+
+    def _build_mojang(self, asset_count):
+        self.blobs = {}  # sha1 -> (kind, key) to rebuild bytes on request
+        self.asset_objects = {}
+        for i in range(asset_count):
+            name = f"minecraft/sounds/standin/{i}.ogg"
+            data = _blob("asset:" + name, 512 + (i * 97) % 8192)
+            digest = hashlib.sha1(data).hexdigest()
+            self.asset_objects[name] = {"hash": digest, "size": len(data)}
+            self.blobs[digest] = ("asset", name, len(data))
+
+        self.versions = {}
+        for mc in MC_VERSIONS:
+            libs = []
+            for j in range(12):
+                path = f"com/standin/lib{j}/{mc}/lib{j}-{mc}.jar"
+                data = self.library_jar(path)
+                libs.append({"name": f"com.standin:lib{j}:{mc}", "downloads": {"artifact": {
+                    "path": path, "url": f"https://libraries.minecraft.net/{path}",
+                    "sha1": hashlib.sha1(data).hexdigest(), "size": len(data)}}})
+            client = self.client_jar(mc)
+            client_sha1 = hashlib.sha1(client).hexdigest()
+            self.blobs[client_sha1] = ("client", mc, len(client))
+            index = json.dumps({"objects": self.asset_objects}).encode()
+            self.versions[mc] = {
+                "id": mc, "type": "release", "mainClass": "net.minecraft.client.main.Main",
+                "assets": mc, "javaVersion": {"majorVersion": 21},
+                "assetIndex": {"id": mc, "sha1": hashlib.sha1(index).hexdigest(), "size": len(index),
+                               "url": f"https://piston-meta.mojang.com/v1/packages/standin/assets-{mc}.json"},
+                "downloads": {"client": {"sha1": client_sha1, "size": len(client),
+                                         "url": f"https://piston-data.mojang.com/v1/objects/{client_sha1}/client.jar"}},
+                "libraries": libs,
+                "arguments": {"game": ["--username", "${auth_player_name}", "--version", "${version_name}"], "jvm": []},
+                "releaseTime": "2024-08-08T12:24:45+00:00", "time": "2024-08-08T12:24:45+00:00",
+            }
+        self.manifest = {
+            "latest": {"release": MC_VERSIONS[0], "snapshot": MC_VERSIONS[0]},
+            "versions": [{"id": mc, "type": "release",
+                          "url": f"https://piston-meta.mojang.com/v1/packages/standin/{mc}.json",
+                          "time": v["time"], "releaseTime": v["releaseTime"]}
+                         for mc, v in self.versions.items()],
+        }
+
+    def library_jar(self, path):
+        return _jar([("META-INF/MANIFEST.MF", "Manifest-Version: 1.0\n"), ("standin.txt", path)],
+                    "lib:" + path, 4096)
+
+    def client_jar(self, mc):
+        return _jar([("version.json", json.dumps({"id": mc}))], "client:" + mc, self.jar_kb * 1024)
+
+    def blob(self, digest):
+        kind, key, size = self.blobs.get(digest, (None, None, None))
+        if kind == "asset":
+            return _blob("asset:" + key, size)
+        if kind == "client":
+            return self.client_jar(key)
+        raise NotFound(digest)
+
+    # ---- Modrinth ----
+
+    def _id(self):
+        alphabet = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+        return "".join(self.rng.choice(alphabet) for _ in range(8))
+
+    def _build_modrinth(self, mod_count, pack_count):
+        self.projects = {}   # id -> project
+        self.slugs = {}      # slug -> id
+        self.project_versions = {}  # project id -> [version], newest first
+        self.version_by_id = {}
+        self.by_hash = {}    # sha1/sha512 -> version
+        self.files = {}      # cdn path -> ("mod"|"pack", version id)
+        self.teams = {}
+
+        for i in range(mod_count + pack_count):
+            project_type = "mod" if i < mod_count else "modpack"
+            pid = self._id()
+            title = " ".join(w.title() for w in self.rng.sample(WORDS, 2)) + (" Pack" if project_type == "modpack" else "")
+            slug = f"{title.lower().replace(' ', '-')}-{i}"
+            cats = sorted(self.rng.sample(CATEGORIES, 2))
+            team = self._id()
+            author = f"dev{self.rng.randint(1, 80)}"
+            self.teams[team] = [{"team_id": team, "role": "Owner", "ordering": 0,
+                                 "user": {"id": self._id(), "username": author}}]
+            created = f"2023-{1 + i % 12:02d}-{1 + i % 28:02d}T00:00:00Z"
+            self.projects[pid] = {
+                "id": pid, "slug": slug, "project_type": project_type, "title": title, "team": team,
+                "description": f"{title}: {' '.join(self.rng.sample(WORDS, 6))}.",
+                "body": "", "categories": cats, "loaders": ["fabric"], "game_versions": list(MC_VERSIONS),
+                "downloads": int(10 ** self.rng.uniform(2, 7)), "followers": self.rng.randint(0, 5000),
+                "icon_url": f"https://cdn.modrinth.com/data/{pid}/icon.png",
+                "published": created, "updated": created, "client_side": "required", "server_side": "optional",
+                "license": {"id": "MIT", "name": "MIT License"}, "versions": [],
+                "_author": author,
+            }
+            self.slugs[slug] = pid
+
+        mod_ids = [p for p in self.projects if self.projects[p]["project_type"] == "mod"]
+        library = mod_ids[0] if mod_ids else None  # the "fabric-api" everything else may need
+        for pid in list(self.projects):
+            project = self.projects[pid]
+            versions = []
+            for n, mc in enumerate(MC_VERSIONS):
+                for patch in (1, 0):
+                    number = f"{2 - n}.{patch}.0+{mc}"
+                    vid = self._id()
+                    version = {
+                        "id": vid, "project_id": pid, "name": f"{project['title']} {number}",
+                        "version_number": number, "version_type": "release", "status": "listed",
+                        "game_versions": [mc], "loaders": ["fabric"], "featured": patch == 1,
+                        "date_published": f"2024-0{6 - n * 2 - (1 - patch)}-01T00:00:00Z",
+                        "downloads": project["downloads"] // 4, "dependencies": [], "files": [],
+                    }
+                    if project["project_type"] == "mod" and pid != library and self.rng.random() < 0.3:
+                        version["dependencies"].append({"project_id": library, "version_id": None,
+                                                        "file_name": None, "dependency_type": "required"})
+                    versions.append(version)
+                    self.version_by_id[vid] = version
+            self.project_versions[pid] = versions
+            project["versions"] = [v["id"] for v in versions]
+            project["updated"] = versions[0]["date_published"]
+
+        # files last: a pack's index needs its mods' hashes
+        for pid, versions in self.project_versions.items():
+            project = self.projects[pid]
+            for version in versions:
+                if project["project_type"] == "mod":
+                    filename = f"{project['slug']}-{version['version_number']}.jar"
+                    data = self.mod_jar(version)
+                else:
+                    filename = f"{project['slug']}-{version['version_number']}.mrpack"
+                    data = self.mrpack(version, mod_ids)
+                path = f"/data/{pid}/versions/{version['id']}/{filename}"
+                self.files[path] = version["id"]
+                version["files"] = [{"url": "https://cdn.modrinth.com" + path, "filename": filename,
+                                     "primary": True, "size": len(data), "hashes": _hashes(data)}]
+                for digest in version["files"][0]["hashes"].values():
+                    self.by_hash[digest] = version
+
+    def mod_jar(self, version):
+        project = self.projects[version["project_id"]]
+        meta = {
+            "schemaVersion": 1, "id": project["slug"].replace("-", "_")[:60], "version": version["version_number"],
+            "name": project["title"], "description": project["description"], "authors": [project["_author"]],
+            "contact": {"homepage": f"https://modrinth.com/mod/{project['slug']}"},
+            "environment": "*", "depends": {"fabricloader": ">=0.15", "minecraft": version["game_versions"][0]},
+            "icon": "assets/icon.png",
+        }
+        return _jar([("fabric.mod.json", json.dumps(meta)), ("assets/icon.png", _png(project["id"]))],
+                    "mod:" + version["id"], self.jar_kb * 1024)
+
+    def mrpack(self, version, mod_ids):
+        mc = version["game_versions"][0]
+        rng = random.Random(version["id"])
+        files = []
+        for pid in rng.sample(mod_ids, min(12, len(mod_ids))):
+            mod_version = next(v for v in self.project_versions[pid] if mc in v["game_versions"])
+            f = mod_version["files"][0]
+            files.append({"path": "mods/" + f["filename"], "hashes": f["hashes"], "downloads": [f["url"]],
+                          "fileSize": f["size"], "env": {"client": "required", "server": "required"}})
+        index = {"formatVersion": 1, "game": "minecraft", "versionId": version["version_number"],
+                 "name": self.projects[version["project_id"]]["title"], "files": files,
+                 "dependencies": {"minecraft": mc, "fabric-loader": LOADER_VERSIONS[0]}}
+        return _jar([("modrinth.index.json", json.dumps(index, indent=1)),
+                     ("overrides/config/standin.txt", "from the stand-in\n")])
+
+    def hit(self, project):
+        return {
+            "project_id": project["id"], "project_type": project["project_type"], "slug": project["slug"],
+            "author": project["_author"], "title": project["title"], "description": project["description"],
+            "categories": project["categories"] + ["fabric"], "display_categories": project["categories"],
+            "versions": project["game_versions"], "downloads": project["downloads"],
+            "follows": project["followers"], "icon_url": project["icon_url"],
+            "date_created": project["published"], "date_modified": project["updated"],
+            "latest_version": project["versions"][0], "license": "MIT", "client_side": "required",
+            "server_side": "optional", "gallery": [],
+        }
+
+    def public(self, project):
+        return {k: v for k, v in project.items() if not k.startswith("_")}
+
+    def project(self, key):
+        pid = key if key in self.projects else self.slugs.get(key)
+        if pid is None:
+            raise NotFound(key)
+        return self.projects[pid]
+
+    def search(self, params):
+        query = (params.get("query") or "").lower().split()
+        facets = json.loads(params.get("facets") or "[]")
+        index = params.get("index") or "relevance"
+        offset = int(params.get("offset") or 0)
+        limit = min(int(params.get("limit") or 10), 100)
+
+        hits = []
+        for project in self.projects.values():
+            h = self.hit(project)
+            have = {"project_type:" + h["project_type"]}
+            have.update("categories:" + c for c in h["categories"])
+            have.update("versions:" + v for v in h["versions"])
+            if any(not (set(group) & have) for group in facets):
+                continue
+            text = f"{h['title']} {h['description']} {h['author']}".lower()
+            if query and not all(w in text for w in query):
+                continue
+            hits.append(h)
+
+        if index == "newest":
+            hits.sort(key=lambda h: h["date_created"], reverse=True)
+        elif index == "updated":
+            hits.sort(key=lambda h: h["date_modified"], reverse=True)
+        elif index == "relevance" and query:
+            hits.sort(key=lambda h: (not h["title"].lower().startswith(query[0]), -h["downloads"]))
+        else:
+            hits.sort(key=lambda h: -h["downloads"])
+        return {"hits": hits[offset:offset + limit], "offset": offset, "limit": limit, "total_hits": len(hits)}
+
+    def versions_of(self, pid, params):
+        loaders = json.loads(params.get("loaders") or "null")
+        game_versions = json.loads(params.get("game_versions") or "null")
+        out = []
+        for v in self.project_versions[self.project(pid)["id"]]:
+            if loaders and not set(loaders) & set(v["loaders"]):
+                continue
+            if game_versions and not set(game_versions) & set(v["game_versions"]):
+                continue
+            out.append(v)
+        return out
+
+    def latest_for(self, version, loaders, game_versions):
+        for v in self.project_versions[version["project_id"]]:
+            if loaders and not set(loaders) & set(v["loaders"]):
+                continue
+            if game_versions and not set(game_versions) & set(v["game_versions"]):
+                continue
+            return v
+        return None
+
+    # ---- routing ----
+
+    def get(self, host, path, params):
+        """(status, content type, body bytes) for a GET."""
+        if host in ("piston-meta.mojang.com", "launchermeta.mojang.com"):
+            if path.startswith("/mc/game/version_manifest"):
+                return self._json(self.manifest)
+            name = path.rsplit("/", 1)[-1]
+            if name.startswith("assets-"):
+                return self._json({"objects": self.asset_objects})
+            mc = name[:-5] if name.endswith(".json") else name
+            if mc in self.versions:
+                return self._json(self.versions[mc])
+        elif host == "piston-data.mojang.com":
+            parts = path.strip("/").split("/")
+            if len(parts) >= 3:
+                return 200, "application/java-archive", self.blob(parts[2])
+        elif host == "resources.download.minecraft.net":
+            return 200, "application/octet-stream", self.blob(path.rsplit("/", 1)[-1])
+        elif host == "libraries.minecraft.net":
+            return 200, "application/java-archive", self.library_jar(path.lstrip("/"))
+        elif host == "maven.fabricmc.net":
+            if path.endswith(".jar"):
+                return 200, "application/java-archive", self.library_jar(path.lstrip("/"))
+            if path.endswith(".pom"):
+                return 200, "text/xml", b"<project/>"
+        elif host == "meta.fabricmc.net":
+            return self._fabric(path)
+        elif host == "api.modrinth.com":
+            return self._modrinth_get(path, params)
+        elif host == "cdn.modrinth.com":
+            return self._cdn(path)
+        raise NotFound(host + path)
+
+    def post(self, host, path, body):
+        if host == "api.modrinth.com":
+            algorithm = body.get("algorithm", "sha1")
+            found = {h: self.by_hash[h] for h in body.get("hashes", []) if h in self.by_hash
+                     and self.by_hash[h]["files"][0]["hashes"].get(algorithm) == h}
+            if path.rstrip("/") == "/v2/version_files":
+                return self._json(found)
+            if path.rstrip("/") == "/v2/version_files/update":
+                out = {}
+                for h, v in found.items():
+                    latest = self.latest_for(v, body.get("loaders"), body.get("game_versions"))
+                    if latest:
+                        out[h] = latest
+                return self._json(out)
+        raise NotFound(host + path)
+
+    def _json(self, obj):
+        return 200, "application/json", json.dumps(obj).encode()
+
+    def _fabric(self, path):
+        parts = path.strip("/").split("/")
+        loaders = [{"separator": ".", "build": 100 - i, "maven": f"net.fabricmc:fabric-loader:{v}",
+                    "version": v, "stable": True} for i, v in enumerate(LOADER_VERSIONS)]
+        if parts[:3] == ["v2", "versions", "loader"]:
+            if len(parts) == 3:
+                return self._json(loaders)
+            mc = parts[3]
+            if mc not in self.versions:
+                return self._json([])
+            entries = [{"loader": l, "intermediary": {"maven": f"net.fabricmc:intermediary:{mc}",
+                                                      "version": mc, "stable": True}}
+                       for l in loaders]
+            if len(parts) == 4:
+                return self._json(entries)
+            loader = parts[4]
+            profile = {
+                "id": f"fabric-loader-{loader}-{mc}", "inheritsFrom": mc, "type": "release",
+                "mainClass": "net.fabricmc.loader.impl.launch.knot.KnotClient",
+                "libraries": [{"name": f"net.fabricmc:fabric-loader:{loader}", "url": "https://maven.fabricmc.net/"},
+                              {"name": f"net.fabricmc:intermediary:{mc}", "url": "https://maven.fabricmc.net/"}],
+            }
+            return self._json(profile)
+        if parts[:3] == ["v2", "versions", "game"]:
+            return self._json([{"version": mc, "stable": True} for mc in MC_VERSIONS])
+        raise NotFound(path)
+
+    def _modrinth_get(self, path, params):
+        parts = path.strip("/").split("/")
+        if parts[0] != "v2" or len(parts) < 2:
+            raise NotFound(path)
+        what = parts[1]
+        if what == "search":
+            return self._json(self.search(params))
+        if what == "project" and len(parts) == 3:
+            return self._json(self.public(self.project(parts[2])))
+        if what == "project" and len(parts) == 4 and parts[3] == "version":
+            return self._json(self.versions_of(parts[2], params))
+        if what == "projects":
+            ids = json.loads(params.get("ids") or "[]")
+            return self._json([self.public(self.projects[i]) for i in ids if i in self.projects])
+        if what == "version" and len(parts) == 3 and parts[2] in self.version_by_id:
+            return self._json(self.version_by_id[parts[2]])
+        if what == "versions":
+            ids = json.loads(params.get("ids") or "[]")
+            return self._json([self.version_by_id[i] for i in ids if i in self.version_by_id])
+        if what == "teams":
+            ids = json.loads(params.get("ids") or "[]")
+            return self._json([self.teams[t] for t in ids if t in self.teams])
+        if what == "team" and len(parts) == 4 and parts[3] == "members" and parts[2] in self.teams:
+            return self._json(self.teams[parts[2]])
+        if what == "tag" and len(parts) == 3:
+            if parts[2] == "game_version":
+                return self._json([{"version": mc, "version_type": "release", "major": True} for mc in MC_VERSIONS])
+            if parts[2] == "loader":
+                return self._json([{"name": "fabric", "supported_project_types": ["mod", "modpack"]}])
+            if parts[2] == "category":
+                return self._json([{"name": c, "project_type": "mod", "header": "categories"} for c in CATEGORIES])
+        raise NotFound(path)
+
+    def _cdn(self, path):
+        parts = path.strip("/").split("/")
+        if len(parts) == 3 and parts[2] == "icon.png" and parts[1] in self.projects:
+            return 200, "image/png", _png(parts[1])
+        vid = self.files.get(path)
+        if vid is None:
+            raise NotFound(path)
+        version = self.version_by_id[vid]
+        if self.projects[version["project_id"]]["project_type"] == "mod":
+            return 200, "application/java-archive", self.mod_jar(version)
+        mod_ids = [p for p in self.projects if self.projects[p]["project_type"] == "mod"]
+        return 200, "application/x-modrinth-modpack+zip", self.mrpack(version, mod_ids)
+
+
+# ---------------------------
+# Fixtures
+# ---------------------------
+
+class Fixtures:
+    """Recorded responses on disk, served in preference to the synthetic ones."""
+
+    def __init__(self, root, record=False):
+        self.root = root
+        self.record = record
+
+    def _path(self, host, path, query):
+        rel = path.strip("/") or "index"
+        if query:
+            rel += "#" + hashlib.sha1(query.encode()).hexdigest()[:12]
+        return os.path.join(self.root, host, *rel.split("/"))
+
+    def get(self, host, path, query):
+        if not self.root:
+            return None
+        p = self._path(host, path, query)
+        if os.path.isfile(p):
+            with open(p, "rb") as f:
+                data = f.read()
+            ctype = "application/json" if data[:1] in (b"{", b"[") else "application/octet-stream"
+            return 200, ctype, data
+        if self.record:
+            return self._record(host, path, query, p)
+        return None
+
+    def _record(self, host, path, query, p):
+        import requests
+        url = f"https://{host}{path}" + (f"?{query}" if query else "")
+        r = requests.get(url, timeout=30, headers={"User-Agent": "RBLauncher stand-in recorder"})
+        if r.status_code != 200:
+            return None
+        os.makedirs(os.path.dirname(p), exist_ok=True)
+        with open(p, "wb") as f:
+            f.write(r.content)
+        print(f"[STANDIN] recorded {url}")
+        return 200, r.headers.get("Content-Type", "application/octet-stream"), r.content
+
+
+# ---------------------------
+# Server
+# ---------------------------
+
+class Faults:
+    def __init__(self, latency_ms=0, jitter_ms=0, bandwidth_kib=0, rate_429=0.0, truncate=0.0, seed=1):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.bandwidth_kib = bandwidth_kib
+        self.rate_429 = rate_429
+        self.truncate = truncate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def update(self, values):
+        for k, v in values.items():
+            if k in ("latency_ms", "jitter_ms", "bandwidth_kib", "rate_429", "truncate"):
+                setattr(self, k, v)
+
+    def as_dict(self):
+        return {k: getattr(self, k) for k in ("latency_ms", "jitter_ms", "bandwidth_kib", "rate_429", "truncate")}
+
+    def roll(self, p):
+        with self.lock:
+            return p > 0 and self.rng.random() < p
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "RBLauncherStandin/1.0"
+
+    def log_message(self, fmt, *args):
+        if self.server.verbose:
+            sys.stderr.write("[STANDIN] " + (fmt % args) + "\n")
+
+    def _split(self):
+        parts = urlsplit(self.path)
+        segments = parts.path.lstrip("/").split("/", 1)
+        host = segments[0].lower()
+        path = "/" + (segments[1] if len(segments) > 1 else "")
+        return host, path, parts.query
+
+    def _count(self, host):
+        with self.server.stats_lock:
+            self.server.stats[host] = self.server.stats.get(host, 0) + 1
+
+    def do_GET(self):
+        host, path, query = self._split()
+        if host == "__standin":
+            return self._control_get(path)
+        self._count(host)
+        params = {k: v[-1] for k, v in parse_qs(query).items()}
+        try:
+            answer = self.server.fixtures.get(host, path, query) or self.server.upstreams.get(host, path, params)
+        except NotFound:
+            answer = (404, "application/json", json.dumps({"error": "not_found"}).encode())
+        except Exception as e:
+            answer = (500, "application/json", json.dumps({"error": str(e)}).encode())
+        self._respond(*answer)
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_POST(self):
+        host, path, _ = self._split()
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if host == "__standin":
+            return self._control_post(path, raw)
+        self._count(host)
+        try:
+            answer = self.server.upstreams.post(host, path, json.loads(raw or b"{}"))
+        except NotFound:
+            answer = (404, "application/json", json.dumps({"error": "not_found"}).encode())
+        except Exception as e:
+            answer = (400, "application/json", json.dumps({"error": str(e)}).encode())
+        self._respond(*answer)
+
+    def _control_get(self, path):
+        if path.rstrip("/") == "/stats":
+            with self.server.stats_lock:
+                body = {"requests": dict(self.server.stats), "faults": self.server.faults.as_dict()}
+            return self._respond(200, "application/json", json.dumps(body).encode(), faults=False)
+        self._respond(404, "text/plain", b"unknown control path", faults=False)
+
+    def _control_post(self, path, raw):
+        if path.rstrip("/") == "/faults":
+            self.server.faults.update(json.loads(raw or b"{}"))
+            return self._respond(200, "application/json", json.dumps(self.server.faults.as_dict()).encode(),
+                                 faults=False)
+        if path.rstrip("/") == "/reset":
+            with self.server.stats_lock:
+                self.server.stats.clear()
+            return self._respond(200, "application/json", b"{}", faults=False)
+        self._respond(404, "text/plain", b"unknown control path", faults=False)
+
+    def _respond(self, status, ctype, body, faults=True):
+        f = self.server.faults
+        if faults:
+            delay = f.latency_ms + (f.rng.uniform(0, f.jitter_ms) if f.jitter_ms else 0)
+            if delay:
+                time.sleep(delay / 1000.0)
+            if f.roll(f.rate_429):
+                status, ctype, body = 429, "application/json", b'{"error":"ratelimited"}'
+
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()[:20]
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-Ratelimit-Limit", "300")
+        self.send_header("X-Ratelimit-Remaining", "0" if status == 429 else "299")
+        self.send_header("X-Ratelimit-Reset", "1")
+        if status == 200:
+            self.send_header("ETag", etag)
+        if status == 429:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        if self.command == "HEAD":
+            return
+
+        cut = faults and status == 200 and len(body) > 1 and f.roll(f.truncate)
+        if cut:
+            body = body[:len(body) // 2]
+            self.close_connection = True
+        chunk = 16 * 1024
+        rate = (f.bandwidth_kib * 1024) if faults else 0
+        start = time.perf_counter()
+        sent = 0
+        try:
+            for i in range(0, len(body), chunk):
+                self.wfile.write(body[i:i + chunk])
+                sent += len(body[i:i + chunk])
+                if rate:
+                    ahead = sent / rate - (time.perf_counter() - start)
+                    if ahead > 0:
+                        time.sleep(ahead)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+
+def make_server(port=8765, host="127.0.0.1", fixtures_dir=None, record=False, faults=None,
+                upstreams=None, verbose=False):
+    """A ready-to-run stand-in; call serve_forever() (or run it on a thread)."""
+    server = ThreadingHTTPServer((host, port), StandinHandler)
+    server.daemon_threads = True
+    server.upstreams = upstreams or Upstreams()
+    server.fixtures = Fixtures(fixtures_dir, record)
+    server.faults = faults or Faults()
+    server.stats = {}
+    server.stats_lock = threading.Lock()
+    server.verbose = verbose
+    return server
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Local stand-in for Mojang, Fabric and Modrinth.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--fixtures", help="directory of recorded responses (<host>/<path>)")
+    ap.add_argument("--record", action="store_true", help="fetch and save fixtures missing from --fixtures")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--mods", type=int, default=300, help="synthetic Modrinth mods")
+    ap.add_argument("--modpacks", type=int, default=30, help="synthetic Modrinth modpacks")
+    ap.add_argument("--jar-kb", type=int, default=64, help="padding per synthetic jar, KiB")
+    ap.add_argument("--latency", type=float, default=0, help="ms before every response")
+    ap.add_argument("--jitter", type=float, default=0, help="extra random ms, up to this much")
+    ap.add_argument("--bandwidth", type=float, default=0, help="KiB/s per response (0 = unlimited)")
+    ap.add_argument("--rate-429", type=float, default=0, help="fraction of requests answered 429")
+    ap.add_argument("--truncate", type=float, default=0, help="fraction of bodies cut off half way")
+    ap.add_argument("-v", "--verbose", action="store_true")
+    args = ap.parse_args(argv)
+
+    if args.record and not args.fixtures:
+        ap.error("--record needs --fixtures")
+
+    t = time.perf_counter()
+    upstreams = Upstreams(args.seed, args.mods, args.modpacks, args.jar_kb)
+    faults = Faults(args.latency, args.jitter, args.bandwidth, args.rate_429, args.truncate, args.seed)
+    server = make_server(args.port, args.host, args.fixtures, args.record, faults, upstreams, args.verbose)
+    base = f"http://{args.host}:{server.server_address[1]}"
+    print(f"[STANDIN] {len(upstreams.projects)} projects, {len(MC_VERSIONS)} game versions "
+          f"ready in {time.perf_counter() - t:.1f}s")
+    print(f"[STANDIN] Serving on {base}  (export RBL_STANDIN={base})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Startup benchmark for the launcher.
+
+    python startup_benchmark.py [--runs 5] [--top 15] [--home /tmp/rbl-home] [--offscreen]
+
+Two measurements, each the median of --runs fresh processes:
+
+1. `python -X importtime` of the launcher's entry point: total import time
+   and the modules that cost the most (self time), to catch a heavy
+   dependency creeping back into the startup path.
+2. A real launch (new_launcher.py), read from its [STARTUP] lines
+   (startup_timeline.py) up to "interactive", then stopped.
+
+Only the first run of a session is a cold start; on macOS run `sudo purge`
+beforehand to measure one from disk. --home points HOME somewhere else so
+the launch doesn't touch your own config and instances.
+"""
+import os
+import re
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ENTRY = os.path.join(HERE, "new_launcher.py")
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+STARTUP_LINE = re.compile(r"^\[STARTUP\] ([^:]+): (\d+) ms$")
+
+
+def _env(args):
+    env = dict(os.environ)
+    if args.home:
+        os.makedirs(args.home, exist_ok=True)
+        env["HOME"] = args.home
+    if args.offscreen:
+        env["QT_QPA_PLATFORM"] = "offscreen"
+    return env
+
+
+def import_times(env):
+    """{module: (self us, cumulative us)} for one fresh import of the entry point's modules."""
+    code = "import startup_timeline, rblauncher.app"
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=HERE, env=env,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True)
+    if proc.returncode:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    out = {}
+    for line in proc.stderr.splitlines():
+        m = IMPORT_LINE.match(line)
+        if m:
+            out[m.group(4)] = (int(m.group(1)), int(m.group(2)))
+    return out
+
+
+def launch_marks(env, timeout=60):
+    """[STARTUP] marks (label -> ms) of one launch, up to "interactive"."""
+    proc = subprocess.Popen([sys.executable, "-u", ENTRY], cwd=HERE, env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+    marks = {}
+    deadline = time.time() + timeout
+    try:
+        for line in proc.stdout:
+            m = STARTUP_LINE.match(line.strip())
+            if m:
+                marks[m.group(1)] = int(m.group(2))
+                if m.group(1) == "interactive":
+                    break
+            if time.time() > deadline:
+                break
+    finally:
+        proc.kill()
+        proc.wait()
+    return marks
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Import-time and time-to-interactive benchmark.")
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--top", type=int, default=15, help="slowest modules to list")
+    ap.add_argument("--home", help="HOME for the launched processes (default: yours)")
+    ap.add_argument("--offscreen", action="store_true", help="QT_QPA_PLATFORM=offscreen (no window)")
+    ap.add_argument("--imports-only", action="store_true", help="skip the launch measurement")
+    args = ap.parse_args(argv)
+    env = _env(args)
+
+    runs = [import_times(env) for _ in range(args.runs)]
+    total = statistics.median(r.get("rblauncher.app", (0, 0))[1] for r in runs)
+    print(f"[BENCH] import rblauncher.app: {total / 1000:.0f} ms (median of {args.runs})")
+    modules = set().union(*runs)
+    med = {m: (statistics.median(r.get(m, (0, 0))[0] for r in runs),
+               statistics.median(r.get(m, (0, 0))[1] for r in runs)) for m in modules}
+    print(f"[BENCH] {'self ms':>8} {'cum ms':>8}  module")
+    for name, (self_us, cum_us) in sorted(med.items(), key=lambda kv: -kv[1][0])[:args.top]:
+        print(f"[BENCH] {self_us / 1000:8.1f} {cum_us / 1000:8.1f}  {name}")
+
+    if args.imports_only:
+        return
+    launches = [launch_marks(env) for _ in range(args.runs)]
+    labels = []
+    for marks in launches:
+        labels += [label for label in marks if label not in labels]
+    print(f"[BENCH] launch marks, ms since start (median of {args.runs}):")
+    for label in labels:
+        values = [marks[label] for marks in launches if label in marks]
+        print(f"[BENCH] {statistics.median(values):8.0f}  {label}"
+              + ("" if len(values) == len(launches) else f"  ({len(values)}/{len(launches)} runs)"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import time
+
+
+class StartupTimeline:
+    """
+    Named moments of a launch, in ms since this module was first imported
+    (the launcher imports it before PyQt, so module loading is counted).
+    "first frame" and "interactive" are the two that matter; the rest say
+    where the time before them went.
+    """
+
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.marks = []  # (label, ms since t0)
+
+    def mark(self, label):
+        ms = (time.perf_counter() - self.t0) * 1000
+        self.marks.append((label, ms))
+        print(f"[STARTUP] {label}: {ms:.0f} ms")
+        return ms
+
+    def at(self, label):
+        for name, ms in self.marks:
+            if name == label:
+                return ms
+        return None
+
+    def rows(self):
+        """(label, ms since start, ms since the previous mark)."""
+        out, prev = [], 0.0
+        for label, ms in self.marks:
+            out.append((label, ms, ms - prev))
+            prev = ms
+        return out
+
+    def summary(self):
+        return "\n".join(f"{ms:8.0f} ms  (+{delta:6.0f})  {label}" for label, ms, delta in self.rows())
+
+
+STARTUP = StartupTimeline()
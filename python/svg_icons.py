@@ -0,0 +1,121 @@
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+from PyQt5.QtGui import QIcon, QImage, QPainter, QPixmap
+from PyQt5.QtSvg import QSvgRenderer
+from PyQt5.QtWidgets import QApplication
+
+MAX_PIXMAPS = 256
+_COLOR = "\x00color\x00"
+
+
+def _template(svg):
+    """Every fill/stroke set to a placeholder, so a recolor is one str.replace."""
+    svg = re.sub(r'fill="[^"]+"', f'fill="{_COLOR}"', svg)
+    return re.sub(r'stroke="[^"]+"', f'stroke="{_COLOR}"', svg)
+
+
+def _render(data, px):
+    image = QImage(px, px, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    QSvgRenderer(data).render(painter)
+    painter.end()
+    return image
+
+
+class SvgIconCache(QObject):
+    """
+    Shared renderer for the monochrome .icons/*.svg set.
+
+    Each file is read and turned into a recolorable template once; each
+    (file, color) is parsed once; each (file, size, color, dpr) is painted
+    once and the pixmap reused. prerender() paints a list of icons on a
+    worker thread (QImage only) so the first screens don't pay for them.
+    """
+    _prerendered = pyqtSignal(object, object)  # key, QImage
+
+    def __init__(self, max_pixmaps=MAX_PIXMAPS, parent=None):
+        super().__init__(parent)
+        self.max_pixmaps = max_pixmaps
+        self._templates = {}       # path -> str (None if unreadable)
+        self._data = {}            # (path, color) -> bytes
+        self._pixmaps = OrderedDict()  # (path, size, color, dpr) -> QPixmap
+        self._icons = {}           # same key -> QIcon
+        self._pool = None
+        self.renders = 0
+        self._prerendered.connect(self._on_prerendered)
+
+    def _svg_data(self, path, color):
+        data = self._data.get((path, color))
+        if data is None:
+            if path not in self._templates:
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        self._templates[path] = _template(f.read())
+                except OSError:
+                    self._templates[path] = None
+            template = self._templates[path]
+            if template is None:
+                return None
+            data = self._data[(path, color)] = template.replace(_COLOR, color).encode("utf-8")
+        return data
+
+    @staticmethod
+    def _dpr(dpr):
+        if dpr is None:
+            dpr = QApplication.instance().devicePixelRatio()
+        return round(float(dpr), 2)
+
+    def pixmap(self, path, size=18, color="#ffffff", dpr=None):
+        """The icon painted at size (logical px) in color; a null pixmap if the file can't be read."""
+        key = (path, size, color, self._dpr(dpr))
+        pix = self._pixmaps.get(key)
+        if pix is not None:
+            self._pixmaps.move_to_end(key)
+            return pix
+        data = self._svg_data(path, color) if path else None
+        if data is None:
+            return QPixmap()
+        return self._remember(key, _render(data, int(size * key[3])))
+
+    def icon(self, path, size=18, color="#ffffff", dpr=None):
+        key = (path, size, color, self._dpr(dpr))
+        icon = self._icons.get(key)
+        if icon is None or key not in self._pixmaps:
+            pix = self.pixmap(path, size, color, key[3])
+            icon = QIcon(pix) if not pix.isNull() else QIcon()
+            self._icons[key] = icon
+        return icon
+
+    def _remember(self, key, image):
+        pix = QPixmap.fromImage(image)
+        pix.setDevicePixelRatio(key[3])
+        self._pixmaps[key] = pix
+        self.renders += 1
+        while len(self._pixmaps) > self.max_pixmaps:
+            old, _ = self._pixmaps.popitem(last=False)
+            self._icons.pop(old, None)
+        return pix
+
+    # ---- background warm-up ----
+
+    def prerender(self, specs, dpr=None):
+        """specs: (path, size, color) triples to have ready before they're asked for."""
+        dpr = self._dpr(dpr)
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=1)
+        for path, size, color in specs:
+            key = (path, size, color, dpr)
+            data = self._svg_data(path, color)
+            if data is not None and key not in self._pixmaps:
+                self._pool.submit(self._prerender_job, key, data)
+
+    def _prerender_job(self, key, data):
+        self._prerendered.emit(key, _render(data, int(key[1] * key[3])))
+
+    def _on_prerendered(self, key, image):
+        if key not in self._pixmaps and not image.isNull():
+            self._remember(key, image)
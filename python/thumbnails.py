@@ -0,0 +1,303 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import Qt, QObject, QRectF, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap, QPainter, QPainterPath
+from PyQt5.QtWidgets import QApplication
+
+# In-memory budget for decoded thumbnails, and on-disk budget behind it
+MEMORY_BUDGET = 48 * 1024 * 1024
+DISK_BUDGET = 64 * 1024 * 1024
+LOAD_WORKERS = 2
+
+
+def render_rounded(src, size, radius, dpr):
+    """
+    Scales, centre-crops and rounds a QImage to size x size logical px.
+    QImage only, so it is safe to call off the GUI thread.
+    """
+    if src.isNull():
+        return QImage()
+    px = max(1, int(round(size * dpr)))
+    scaled = src.scaled(px, px, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+
+    out = QImage(px, px, QImage.Format_ARGB32_Premultiplied)
+    out.fill(Qt.transparent)
+    p = QPainter(out)
+    p.setRenderHint(QPainter.Antialiasing, True)
+    p.setRenderHint(QPainter.SmoothPixmapTransform, True)
+    clip = QPainterPath()
+    clip.addRoundedRect(QRectF(0, 0, px, px), radius * dpr, radius * dpr)
+    p.setClipPath(clip)
+    # centre-crop whatever KeepAspectRatioByExpanding left over
+    p.drawImage((px - scaled.width()) // 2, (px - scaled.height()) // 2, scaled)
+    p.end()
+    return out
+
+
+class PixmapLRU:
+    """QPixmaps in least-recently-used order, bounded by their decoded size in bytes."""
+
+    def __init__(self, budget):
+        self.budget = budget
+        self._items = OrderedDict()  # key -> QPixmap
+        self._bytes = 0
+
+    @staticmethod
+    def _cost(pix):
+        return pix.width() * pix.height() * 4
+
+    def get(self, key):
+        pix = self._items.get(key)
+        if pix is not None:
+            self._items.move_to_end(key)
+        return pix
+
+    def put(self, key, pix):
+        old = self._items.pop(key, None)
+        if old is not None:
+            self._bytes -= self._cost(old)
+        self._items[key] = pix
+        self._bytes += self._cost(pix)
+        while self._bytes > self.budget and len(self._items) > 1:
+            _, old = self._items.popitem(last=False)
+            self._bytes -= self._cost(old)
+
+    def clear(self):
+        self._items.clear()
+        self._bytes = 0
+
+
+class DiskLRU:
+    """
+    A cache directory kept under a size budget. Callers write files into it
+    and report them with added(); touch() on a hit keeps a file's LRU place.
+    Past the budget the least recently used files go until it's at 80%.
+    """
+
+    def __init__(self, cache_dir, budget):
+        self.cache_dir = cache_dir
+        self.budget = budget
+        self._bytes = None  # scanned lazily on first write
+        self._lock = threading.Lock()  # writes can come from worker threads
+
+    def touch(self, path):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def added(self, path):
+        with self._lock:
+            if self._bytes is None:
+                self._bytes = sum(size for _, size, _ in self._entries())
+            else:
+                try:
+                    self._bytes += os.path.getsize(path)
+                except OSError:
+                    pass
+            if self._bytes > self.budget:
+                self._trim()
+
+    def _entries(self):
+        out = []
+        if not os.path.isdir(self.cache_dir):
+            return out
+        for root, _, files in os.walk(self.cache_dir):
+            for fn in files:
+                p = os.path.join(root, fn)
+                try:
+                    st = os.stat(p)
+                except OSError:
+                    continue
+                out.append((p, st.st_size, st.st_mtime))
+        return out
+
+    def _trim(self):
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        total = sum(e[1] for e in entries)
+        target = int(self.budget * 0.8)
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self._bytes = total
+
+
+class ThumbnailCache(QObject):
+    """
+    Ready-to-draw rounded thumbnails for mod and instance icons.
+
+    Keyed by the source file's content hash plus (size, radius, dpr), so the
+    same icon saved under two names is decoded once and an icon replaced in
+    place is picked up. Lookups go: memory LRU -> PNG on disk -> decode,
+    scale, crop and round the source once and store it in both.
+
+    get() does all of that on the calling thread. load() is for painting: it
+    only looks in memory and leaves the rest to a small thread pool.
+    """
+    _loaded = pyqtSignal(object, object, object)  # (path, size, radius, dpr), key, QImage
+
+    def __init__(self, cache_dir, memory_budget=MEMORY_BUDGET, disk_budget=DISK_BUDGET,
+                 workers=LOAD_WORKERS, parent=None):
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        self.workers = workers
+        self._mem = PixmapLRU(memory_budget)  # key -> QPixmap
+        self._disk = DiskLRU(cache_dir, disk_budget)
+        self._hashes = {}           # path -> (size, mtime_ns, sha1)
+        self._by_path = {}          # (path, size, radius, dpr) -> key of its last load
+        self._failed = set()        # (path, size, radius, dpr) that can't be shown
+        self._waiting = {}          # (path, size, radius, dpr) -> [callback]
+        self._pool = None
+        self._loaded.connect(self._on_loaded)
+
+    # ---- keys ----
+
+    def _source_hash(self, path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        known = self._hashes.get(path)
+        if known and known[0] == st.st_size and known[1] == st.st_mtime_ns:
+            return known[2]
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        self._hashes[path] = (st.st_size, st.st_mtime_ns, digest)
+        return digest
+
+    def _disk_path(self, digest, size, radius, dpr):
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}_{size}r{radius}@{dpr:g}x.png")
+
+    # ---- public ----
+
+    def get(self, path, size, radius=8, dpr=None):
+        """Returns a rounded size x size (logical px) QPixmap, or a null one if path can't be read."""
+        if not path or not os.path.exists(path):
+            return QPixmap()
+        if dpr is None:
+            app = QApplication.instance()
+            dpr = app.devicePixelRatio() if app else 1.0
+        dpr = round(float(dpr), 2)
+
+        try:
+            digest = self._source_hash(path)
+        except OSError:
+            return QPixmap()
+        if digest is None:
+            return QPixmap()
+
+        key = (digest, size, radius, dpr)
+        self._by_path[(path, size, radius, dpr)] = key
+        pix = self._mem.get(key)
+        if pix is not None:
+            return pix
+
+        image = self._load_image(path, key)
+        if image.isNull():
+            return QPixmap()
+        pix = QPixmap.fromImage(image)
+        pix.setDevicePixelRatio(dpr)
+        self._mem.put(key, pix)
+        return pix
+
+    def load(self, path, size, radius=8, dpr=1.0, callback=None):
+        """
+        Returns the thumbnail if it's in memory, a null QPixmap if path can't
+        be shown, else None and calls callback(QPixmap) on the GUI thread once
+        a worker has loaded it. Never touches the disk on the calling thread.
+        """
+        pkey = (path, size, radius, round(float(dpr), 2))
+        if pkey in self._failed:
+            return QPixmap()
+        key = self._by_path.get(pkey)
+        pix = self._mem.get(key) if key else None
+        if pix is not None:
+            return pix
+
+        callbacks = self._waiting.get(pkey)
+        if callbacks is not None:
+            if callback:
+                callbacks.append(callback)
+            return None
+        self._waiting[pkey] = [callback] if callback else []
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="thumbnails")
+        self._pool.submit(self._load_job, pkey)
+        return None
+
+    def forget(self, path):
+        """Call when path was rewritten in place, so load() doesn't keep showing the old icon."""
+        for pkey in [k for k in self._by_path if k[0] == path]:
+            del self._by_path[pkey]
+        self._failed = {k for k in self._failed if k[0] != path}
+
+    def clear_memory(self):
+        self._mem.clear()
+
+    # ---- internals ----
+
+    def _render(self, path, size, radius, dpr):
+        return render_rounded(QImage(path), size, radius, dpr)
+
+    def _load_image(self, path, key):
+        """The disk copy for key, or a fresh render that is stored there. QImage only."""
+        digest, size, radius, dpr = key
+        disk_path = self._disk_path(digest, size, radius, dpr)
+        image = QImage(disk_path) if os.path.exists(disk_path) else QImage()
+        if not image.isNull():
+            self._disk.touch(disk_path)  # LRU order for disk eviction
+            return image
+        image = self._render(path, size, radius, dpr)
+        if not image.isNull():
+            self._store(disk_path, image)
+        return image
+
+    def _load_job(self, pkey):
+        # pool thread
+        path, size, radius, dpr = pkey
+        key, image = None, QImage()
+        try:
+            digest = self._source_hash(path) if path else None
+            if digest:
+                key = (digest, size, radius, dpr)
+                image = self._load_image(path, key)
+        except Exception as e:
+            print(f"[THUMBS] Could not load {path}: {e}")
+        self._loaded.emit(pkey, key, image)
+
+    def _on_loaded(self, pkey, key, image):
+        callbacks = self._waiting.pop(pkey, [])
+        if image.isNull():
+            self._failed.add(pkey)
+            return
+        pix = QPixmap.fromImage(image)
+        pix.setDevicePixelRatio(pkey[3])
+        self._mem.put(key, pix)
+        self._by_path[pkey] = key
+        for cb in callbacks:
+            cb(pix)
+
+    def _store(self, disk_path, image):
+        try:
+            os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+            tmp = disk_path + ".tmp"
+            if not image.save(tmp, "PNG"):
+                return
+            os.replace(tmp, disk_path)
+        except OSError as e:
+            print(f"[THUMBS] Could not write {disk_path}: {e}")
+            return
+
+        self._disk.added(disk_path)